@@ -0,0 +1,10 @@
+-- Task search filters with ILIKE '%term%' on title/description (Prisma `contains`
+-- with mode: 'insensitive'), which a B-tree index cannot serve. Trigram GIN
+-- indexes let Postgres use an index scan instead of scanning every task row.
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- CreateIndex
+CREATE INDEX "tasks_title_idx" ON "tasks" USING GIN ("title" gin_trgm_ops);
+
+-- CreateIndex
+CREATE INDEX "tasks_description_idx" ON "tasks" USING GIN ("description" gin_trgm_ops);
@@ -0,0 +1,8 @@
+-- The notification feed filters by user and orders by newest first. With only
+-- (user_id, read) and (created_at) available, Postgres has to sort every
+-- notification the user owns before applying the page limit. A composite index
+-- matching both the filter and the sort order lets it read rows in order and
+-- stop as soon as the page is full.
+
+-- CreateIndex
+CREATE INDEX "notifications_user_id_created_at_idx" ON "notifications"("user_id", "created_at" DESC);
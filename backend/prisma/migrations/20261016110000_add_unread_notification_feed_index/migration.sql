@@ -0,0 +1,11 @@
+-- The unread-only feed (?unreadOnly=true) filters by user and read flag and
+-- pages newest first. (user_id, read) finds the rows but leaves them unordered,
+-- so each page sorts every unread notification. Appending created_at DESC lets
+-- the page be read straight off the index; the new index still serves the
+-- (user_id, read) lookups behind the unread count, so the old one is dropped.
+
+-- DropIndex
+DROP INDEX "notifications_user_id_read_idx";
+
+-- CreateIndex
+CREATE INDEX "notifications_user_id_read_created_at_idx" ON "notifications"("user_id", "read", "created_at" DESC);
@@ -6,6 +6,8 @@ import cookieParser from 'cookie-parser';
 import dotenv from 'dotenv';
 import { randomUUID } from 'crypto';
 import prisma from './lib/prisma.js';
+import { createBufferedLogStream } from './lib/logStream.js';
+import { getAllowedOrigins, isAllowedOrigin } from './lib/cors.js';
 import { errorHandler } from './middleware/errorHandler.js';
 import authRoutes from './routes/auth.js';
 import projectRoutes from './routes/projects.js';
@@ -58,24 +60,19 @@ app.use((_req, res, next) => {
   next();
 });
 
-// CORS: support comma-separated origins for Railway multi-service deployments
-const allowedOrigins = (process.env.CORS_ORIGIN || 'http://localhost:3000')
-  .split(',')
-  .map((o) => o.trim())
-  .filter(Boolean);
-
 app.use(cors({
   origin: (origin, callback) => {
     // Allow requests with no origin (server-to-server, health checks)
     if (!origin) return callback(null, true);
-    if (allowedOrigins.includes(origin)) return callback(null, true);
+    if (isAllowedOrigin(origin)) return callback(null, true);
     callback(new Error(`CORS: origin ${origin} not allowed`));
   },
   credentials: true,
 }));
 
-console.log('CORS allowed origins:', allowedOrigins);
-app.use(morgan('dev'));
+console.log('CORS allowed origins:', getAllowedOrigins());
+// Request lines are batched per event-loop turn so logging stays off the hot path
+app.use(morgan('dev', { stream: createBufferedLogStream() }));
 
 // CRITICAL: express.raw() MUST come before express.json() for Stripe webhook signature verification
 // Moving or reordering these middlewares will break Stripe webhook processing
@@ -1,10 +1,15 @@
 import { createServer } from 'http';
 import app from './app.js';
+import prisma from './lib/prisma.js';
 import { startScheduler } from './lib/scheduler.js';
 import { initializeSocket } from './lib/socket.js';
 
 const PORT = parseInt(process.env.PORT || '4000', 10);
 
+// Open the shared connection pool up front so the first requests don't pay
+// the TCP/TLS/auth handshake (Prisma otherwise connects lazily on first query)
+prisma.$connect().catch((err) => console.error('[startup] Failed to connect to database:', err));
+
 const server = createServer(app);
 initializeSocket(server);
 
@@ -1,19 +1,12 @@
+import { randomUUID } from 'crypto';
 import { Prisma } from '@prisma/client';
 import prisma from './prisma.js';
 import { getIO } from './socket.js';
+import { chunk, IN_LIST_CHUNK_SIZE } from './batching.js';
 
 const TRACKED_FIELDS = ['title', 'description', 'status', 'priority', 'assigneeId', 'dueDate'] as const;
 
-const RETENTION_DAYS = 180;
-
-function scheduleRetentionCleanup(taskId: string): void {
-  prisma.activityLog.deleteMany({
-    where: {
-      taskId,
-      createdAt: { lt: new Date(Date.now() - RETENTION_DAYS * 24 * 60 * 60 * 1000) },
-    },
-  }).catch((err) => console.error('[activityLog] Failed to cleanup old logs:', err));
-}
+// Logs older than the retention window are purged by the daily job in scheduler.ts
 
 export async function logTaskCreated(
   taskId: string,
@@ -30,15 +23,11 @@ export async function logTaskCreated(
       },
     });
 
-    // Fire-and-forget retention cleanup outside transaction
-    if (!tx) {
-      scheduleRetentionCleanup(taskId);
-    }
-
     const io = getIO();
     if (io) {
-      io.to(`task:${taskId}`).emit('task:updated', { taskId });
-      io.to(`task:${taskId}`).emit('activity:new', activity);
+      const room = io.to(`task:${taskId}`);
+      room.emit('task:updated', { taskId });
+      room.emit('activity:new', activity);
     }
   } catch (err) {
     console.error('Failed to log task creation:', err);
@@ -95,16 +84,13 @@ export async function logTaskChanges(
         );
       }
 
-      // Fire-and-forget retention cleanup outside transaction
-      if (!tx) {
-        scheduleRetentionCleanup(taskId);
-      }
-
       const io = getIO();
       if (io) {
-        io.to(`task:${taskId}`).emit('task:updated', { taskId });
+        // Resolve the room once rather than once per emitted log
+        const room = io.to(`task:${taskId}`);
+        room.emit('task:updated', { taskId });
         createdLogs.forEach(log => {
-          io.to(`task:${taskId}`).emit('activity:new', log);
+          room.emit('activity:new', log);
         });
       }
     }
@@ -114,6 +100,49 @@ export async function logTaskChanges(
   }
 }
 
+/**
+ * Logs one status change per task for a bulk update with multi-row INSERTs
+ * instead of a round trip per task. Ids and timestamps are assigned here so
+ * the rows can be pushed over WebSocket without reading them back.
+ */
+export async function logBulkStatusChanges(
+  changes: { taskId: string; oldStatus: string }[],
+  newStatus: string,
+  userId: string,
+): Promise<void> {
+  if (changes.length === 0) return;
+
+  try {
+    const createdAt = new Date();
+    const logs = changes.map(({ taskId, oldStatus }) => ({
+      id: randomUUID(),
+      action: 'UPDATED' as const,
+      field: 'status',
+      oldValue: oldStatus,
+      newValue: newStatus,
+      createdAt,
+      taskId,
+      userId,
+    }));
+
+    // Chunked so a very large bulk update stays under the bind-parameter limit
+    await prisma.$transaction(
+      chunk(logs, IN_LIST_CHUNK_SIZE).map((data) => prisma.activityLog.createMany({ data }))
+    );
+
+    const io = getIO();
+    if (io) {
+      for (const log of logs) {
+        const room = io.to(`task:${log.taskId}`);
+        room.emit('task:updated', { taskId: log.taskId });
+        room.emit('activity:new', log);
+      }
+    }
+  } catch (err) {
+    console.error('Failed to log bulk status changes:', err);
+  }
+}
+
 export async function logTaskDeleted(
   taskId: string,
   userId: string,
@@ -131,13 +160,11 @@ export async function logTaskDeleted(
       },
     });
 
-    // No retention cleanup for deleted tasks — the task (and its logs) will be
-    // cascade-deleted when the task record is removed.
-
     const io = getIO();
     if (io) {
-      io.to(`task:${taskId}`).emit('task:deleted', { taskId });
-      io.to(`task:${taskId}`).emit('task:updated', { taskId });
+      const room = io.to(`task:${taskId}`);
+      room.emit('task:deleted', { taskId });
+      room.emit('task:updated', { taskId });
     }
   } catch (err) {
     console.error('Failed to log task deletion:', err);
@@ -156,12 +183,11 @@ export async function logDependencyAdded(taskId: string, userId: string, depends
       },
     });
 
-    scheduleRetentionCleanup(taskId);
-
     const io = getIO();
     if (io) {
-      io.to(`task:${taskId}`).emit('task:updated', { taskId });
-      io.to(`task:${taskId}`).emit('activity:new', activity);
+      const room = io.to(`task:${taskId}`);
+      room.emit('task:updated', { taskId });
+      room.emit('activity:new', activity);
     }
   } catch (error) {
     console.error('Failed to log dependency added:', error);
@@ -179,12 +205,11 @@ export async function logDependencyRemoved(taskId: string, userId: string, depen
       },
     });
 
-    scheduleRetentionCleanup(taskId);
-
     const io = getIO();
     if (io) {
-      io.to(`task:${taskId}`).emit('task:updated', { taskId });
-      io.to(`task:${taskId}`).emit('activity:new', activity);
+      const room = io.to(`task:${taskId}`);
+      room.emit('task:updated', { taskId });
+      room.emit('activity:new', activity);
     }
   } catch (error) {
     console.error('Failed to log dependency removed:', error);
@@ -205,8 +230,6 @@ export async function logCommentAction(
       },
     });
 
-    scheduleRetentionCleanup(taskId);
-
     const io = getIO();
     if (io) {
       io.to(`task:${taskId}`).emit('activity:new', activity);
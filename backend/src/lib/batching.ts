@@ -0,0 +1,34 @@
+/**
+ * Max ids bound into a single `IN (...)` list. Keeps queries far below
+ * Postgres' 32767 bind-parameter limit and the planner's hash size modest.
+ */
+export const IN_LIST_CHUNK_SIZE = 1000;
+
+/**
+ * Splits `items` into consecutive slices of at most `size` elements.
+ */
+export function chunk<T>(items: readonly T[], size: number): T[][] {
+  const step = Math.max(1, Math.floor(size));
+  const chunks: T[][] = [];
+  for (let i = 0; i < items.length; i += step) {
+    chunks.push(items.slice(i, i + step));
+  }
+  return chunks;
+}
+
+/**
+ * Distinct `key(item)` values in first-seen order. A single pass, without the
+ * intermediate array that `[...new Set(items.map(key))]` allocates.
+ */
+export function distinct<T, K>(items: Iterable<T>, key: (item: T) => K): K[] {
+  const seen = new Set<K>();
+  const keys: K[] = [];
+  for (const item of items) {
+    const k = key(item);
+    if (!seen.has(k)) {
+      seen.add(k);
+      keys.push(k);
+    }
+  }
+  return keys;
+}
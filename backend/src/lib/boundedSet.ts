@@ -0,0 +1,25 @@
+/**
+ * An insertion-ordered Set capped at `maxSize` values. Adding a new value
+ * to a full set evicts the oldest one, since Sets iterate in insertion order.
+ */
+export class BoundedSet<T> {
+  private readonly items = new Set<T>();
+
+  constructor(private readonly maxSize: number) {}
+
+  get size(): number {
+    return this.items.size;
+  }
+
+  has(value: T): boolean {
+    return this.items.has(value);
+  }
+
+  add(value: T): void {
+    if (this.items.has(value)) return;
+    if (this.items.size >= this.maxSize) {
+      this.items.delete(this.items.values().next().value as T);
+    }
+    this.items.add(value);
+  }
+}
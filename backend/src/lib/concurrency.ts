@@ -0,0 +1,24 @@
+/**
+ * Runs `worker` over `items` with at most `limit` calls in flight at once.
+ * Results are returned in input order. Workers should handle their own
+ * errors — a rejection rejects the whole call, though in-flight work still runs.
+ */
+export async function mapWithConcurrency<T, R>(
+  items: readonly T[],
+  limit: number,
+  worker: (item: T, index: number) => Promise<R>,
+): Promise<R[]> {
+  const results = new Array<R>(items.length);
+  let next = 0;
+
+  async function drain(): Promise<void> {
+    while (next < items.length) {
+      const index = next++;
+      results[index] = await worker(items[index], index);
+    }
+  }
+
+  const lanes = Math.min(Math.max(1, limit), items.length);
+  await Promise.all(Array.from({ length: lanes }, drain));
+  return results;
+}
@@ -0,0 +1,17 @@
+// CORS: support comma-separated origins for Railway multi-service deployments.
+// Shared by the Express and Socket.io servers; parsed on first use (after
+// dotenv has populated CORS_ORIGIN) and reused from then on.
+let allowedOrigins: string[] | undefined;
+let allowedOriginSet: Set<string> | undefined;
+
+export function getAllowedOrigins(): string[] {
+  return (allowedOrigins ??= (process.env.CORS_ORIGIN || 'http://localhost:3000')
+    .split(',')
+    .map((o) => o.trim())
+    .filter(Boolean));
+}
+
+// Checked on every request, so index once for O(1) lookups
+export function isAllowedOrigin(origin: string): boolean {
+  return (allowedOriginSet ??= new Set(getAllowedOrigins())).has(origin);
+}
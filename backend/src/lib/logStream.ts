@@ -0,0 +1,28 @@
+/**
+ * A minimal writable for request loggers (morgan's `stream` option) that
+ * coalesces every line logged during one event-loop turn into a single write
+ * on the target, issued from setImmediate. Request handling only appends to
+ * an array; stdout writes — synchronous when stdout is a file or TTY — happen
+ * once per turn instead of once per request.
+ */
+export function createBufferedLogStream(target: { write(chunk: string): unknown } = process.stdout) {
+  let pending: string[] = [];
+  let flushScheduled = false;
+
+  const flush = () => {
+    flushScheduled = false;
+    const lines = pending;
+    pending = [];
+    target.write(lines.join(''));
+  };
+
+  return {
+    write(line: string): void {
+      pending.push(line);
+      if (!flushScheduled) {
+        flushScheduled = true;
+        setImmediate(flush);
+      }
+    },
+  };
+}
@@ -1,11 +1,12 @@
 import prisma from './prisma.js';
-import { createNotification } from './notifications.js';
+import { createNotifications } from './notifications.js';
+import { distinct } from './batching.js';
 
 export function parseMentions(content: string): string[] {
   const matches = content.match(/@(\w+(?:\.\w+)*)/g);
   if (!matches) return [];
   // Remove the '@' prefix and deduplicate
-  return [...new Set(matches.map((m) => m.slice(1)))];
+  return distinct(matches, (m) => m.slice(1));
 }
 
 export async function resolveMentions(names: string[], projectId: string) {
@@ -21,17 +22,27 @@ export async function resolveMentions(names: string[], projectId: string) {
     },
   });
 
+  // Index members once by both lookup forms — lowercased name ("jane doe") and
+  // dotted handle ("jane.doe") — so each mention is a map lookup, not a scan.
+  // The earliest member wins on collisions, matching a first-match search.
+  const byName = new Map<string, number>();
+  const byHandle = new Map<string, number>();
+  members.forEach((m, index) => {
+    const lowerName = m.user.name.toLowerCase();
+    if (!byName.has(lowerName)) byName.set(lowerName, index);
+    const handle = lowerName.replace(/\s+/g, '.');
+    if (!byHandle.has(handle)) byHandle.set(handle, index);
+  });
+
   // Case-insensitive match by name (comparing with dots replaced by spaces too)
   const matched: { id: string; name: string }[] = [];
   for (const name of names) {
-    const normalizedName = name.toLowerCase().replace(/\./g, ' ');
-    const member = members.find(
-      (m) =>
-        m.user.name.toLowerCase() === normalizedName ||
-        m.user.name.toLowerCase().replace(/\s+/g, '.') === name.toLowerCase()
-    );
-    if (member) {
-      matched.push(member.user);
+    const lowerMention = name.toLowerCase();
+    const nameIndex = byName.get(lowerMention.replace(/\./g, ' '));
+    const handleIndex = byHandle.get(lowerMention);
+    const index = Math.min(nameIndex ?? Infinity, handleIndex ?? Infinity);
+    if (index !== Infinity) {
+      matched.push(members[index].user);
     }
   }
 
@@ -46,17 +57,21 @@ export async function notifyMentions(
   taskTitle: string,
   projectId: string,
 ) {
-  for (const user of mentionedUsers) {
-    // Don't notify self-mentions
-    if (user.id === authorId) continue;
+  // Don't notify self-mentions
+  const recipients = mentionedUsers.filter((user) => user.id !== authorId);
+  if (recipients.length === 0) return;
 
-    await createNotification({
+  const message = `${authorName} mentioned you in a comment on "${taskTitle}"`;
+
+  // One INSERT for every mentioned user rather than a round trip each
+  await createNotifications(
+    recipients.map((user) => ({
       userId: user.id,
-      type: 'MENTION',
+      type: 'MENTION' as const,
       title: 'You were mentioned',
-      message: `${authorName} mentioned you in a comment on "${taskTitle}"`,
+      message,
       taskId,
       projectId,
-    });
-  }
+    })),
+  );
 }
@@ -1,3 +1,4 @@
+import { randomUUID } from 'crypto';
 import prisma from './prisma.js';
 import { getIO } from './socket.js';
 
@@ -39,6 +40,46 @@ export async function createNotification(params: CreateNotificationParams) {
   }
 }
 
+/**
+ * Creates several notifications with one multi-row INSERT instead of one per
+ * recipient. Ids and timestamps are assigned here so the rows can be pushed
+ * over WebSocket without reading them back.
+ */
+export async function createNotifications(paramsList: CreateNotificationParams[]) {
+  if (paramsList.length === 0) return [];
+
+  try {
+    const createdAt = new Date();
+    const notifications = paramsList.map((params) => ({
+      id: randomUUID(),
+      type: params.type,
+      title: params.title,
+      message: params.message,
+      read: false,
+      createdAt,
+      userId: params.userId,
+      taskId: params.taskId ?? null,
+      projectId: params.projectId ?? null,
+    }));
+
+    await prisma.notification.createMany({ data: notifications });
+
+    // Real-time delivery via WebSocket
+    const io = getIO();
+    if (io) {
+      for (const notification of notifications) {
+        io.to(`user:${notification.userId}`).emit('notification:new', notification);
+      }
+    }
+
+    return notifications;
+  } catch (error) {
+    console.error('Failed to create notifications:', error);
+    // Don't throw - notifications are non-critical
+    return [];
+  }
+}
+
 export async function notifyTaskAssignment(taskId: string, assigneeId: string, assignerName: string, taskTitle: string) {
   return createNotification({
     userId: assigneeId,
@@ -71,6 +112,15 @@ export async function notifyProjectInvite(projectId: string, userId: string, inv
   });
 }
 
+// Only the fields the reminder message needs, not the full task/user/project rows
+const notifiedTaskSelect = {
+  id: true,
+  title: true,
+  projectId: true,
+  assigneeId: true,
+  project: { select: { name: true } },
+} as const;
+
 // Check for tasks due soon (called by a cron job or manually)
 export async function checkTasksDueSoon() {
   const tomorrow = new Date();
@@ -93,27 +143,21 @@ export async function checkTasksDueSoon() {
         not: null,
       },
     },
-    include: {
-      assignee: true,
-      project: true,
-    },
+    select: notifiedTaskSelect,
   });
 
-  const tasksWithAssignee = tasksDueSoon.filter((task) => task.assignee !== null);
-
-  const notificationPromises = tasksWithAssignee.map((task) =>
-    createNotification({
-      userId: task.assignee!.id,
-      type: 'TASK_DUE_SOON',
+  // The query already excludes unassigned tasks, so map straight to
+  // notifications and insert them all in one statement
+  return createNotifications(
+    tasksDueSoon.map((task) => ({
+      userId: task.assigneeId!,
+      type: 'TASK_DUE_SOON' as const,
       title: 'Task due soon',
       message: `Task "${task.title}" is due soon in project "${task.project.name}"`,
       taskId: task.id,
       projectId: task.projectId,
-    })
+    }))
   );
-
-  const notifications = await Promise.all(notificationPromises);
-  return notifications.filter(Boolean);
 }
 
 // Check for overdue tasks
@@ -132,25 +176,17 @@ export async function checkOverdueTasks() {
         not: null,
       },
     },
-    include: {
-      assignee: true,
-      project: true,
-    },
+    select: notifiedTaskSelect,
   });
 
-  const tasksWithAssignee = overdueTasks.filter((task) => task.assignee !== null);
-
-  const notificationPromises = tasksWithAssignee.map((task) =>
-    createNotification({
-      userId: task.assignee!.id,
-      type: 'TASK_OVERDUE',
+  return createNotifications(
+    overdueTasks.map((task) => ({
+      userId: task.assigneeId!,
+      type: 'TASK_OVERDUE' as const,
       title: 'Task overdue',
       message: `Task "${task.title}" is overdue in project "${task.project.name}"`,
       taskId: task.id,
       projectId: task.projectId,
-    })
+    }))
   );
-
-  const notifications = await Promise.all(notificationPromises);
-  return notifications.filter(Boolean);
 }
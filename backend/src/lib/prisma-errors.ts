@@ -0,0 +1,17 @@
+import { Prisma } from '@prisma/client';
+
+/**
+ * True when a Prisma write matched no row (P2025) — e.g. an `update`/`delete`
+ * whose unique `where` also carries an ownership filter such as `userId`.
+ */
+export function isRecordNotFound(err: unknown): boolean {
+  return err instanceof Prisma.PrismaClientKnownRequestError && err.code === 'P2025';
+}
+
+/**
+ * True when a Prisma write hit a unique constraint (P2002) — lets callers insert
+ * directly and map the conflict, instead of probing for the row first.
+ */
+export function isUniqueViolation(err: unknown): boolean {
+  return err instanceof Prisma.PrismaClientKnownRequestError && err.code === 'P2002';
+}
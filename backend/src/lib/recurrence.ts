@@ -1,5 +1,9 @@
-import { RecurrenceFrequency, TaskStatus } from '@prisma/client';
+import { RecurrenceFrequency, RecurringTask, TaskStatus } from '@prisma/client';
 import prisma from './prisma.js';
+import { mapWithConcurrency } from './concurrency.js';
+
+// Max recurring tasks generated in parallel — kept below Prisma's default pool size
+const GENERATION_CONCURRENCY = 5;
 
 interface RecurrenceConfig {
   frequency: RecurrenceFrequency;
@@ -24,7 +28,11 @@ export function calculateNextOccurrence(
 
     case 'WEEKLY':
       if (config.daysOfWeek) {
-        const targetDays = config.daysOfWeek.split(',').map(Number);
+        // Pack the target weekdays into a 7-bit mask so each probe is a bit test
+        let targetDayMask = 0;
+        for (const day of config.daysOfWeek.split(',').map(Number)) {
+          if (Number.isInteger(day) && day >= 0 && day < 7) targetDayMask |= 1 << day;
+        }
         const currentDay = next.getDay();
 
         // Find the next matching day
@@ -33,7 +41,7 @@ export function calculateNextOccurrence(
 
         for (let i = 0; i < 7; i++) {
           const checkDay = (currentDay + daysToAdd) % 7;
-          if (targetDays.includes(checkDay)) {
+          if (targetDayMask & (1 << checkDay)) {
             foundNext = true;
             break;
           }
@@ -77,19 +85,21 @@ export function calculateNextOccurrence(
 }
 
 /**
- * Generate the next task instance from a recurring task
+ * Generate the next task instance from a recurring task.
+ * Accepts an already-loaded row and the sweep's clock reading so batch
+ * callers don't re-fetch it by id or take a fresh timestamp per row.
  */
-export async function generateNextTask(recurringTaskId: string) {
-  const recurring = await prisma.recurringTask.findUnique({
-    where: { id: recurringTaskId },
-  });
+export async function generateNextTask(recurringTaskOrId: string | RecurringTask, now: Date = new Date()) {
+  const recurring = typeof recurringTaskOrId === 'string'
+    ? await prisma.recurringTask.findUnique({ where: { id: recurringTaskOrId } })
+    : recurringTaskOrId;
 
   if (!recurring) {
     throw new Error('Recurring task not found');
   }
 
   // Check if we've passed the end date
-  if (recurring.endDate && new Date() > recurring.endDate) {
+  if (recurring.endDate && now > recurring.endDate) {
     return null;
   }
 
@@ -111,32 +121,33 @@ export async function generateNextTask(recurringTaskId: string) {
     dayOfMonth: recurring.dayOfMonth || undefined,
   });
 
-  // Create new task instance
-  const newTask = await prisma.task.create({
-    data: {
-      title: baseTask.title,
-      description: baseTask.description,
-      status: 'TODO' as TaskStatus,
-      priority: baseTask.priority,
-      dueDate: nextDueDate,
-      projectId: recurring.projectId,
-      assigneeId: baseTask.assigneeId,
-      creatorId: recurring.creatorId,
-      recurringTaskId: recurring.id,
-      isRecurring: true,
-    },
-    include: {
-      project: true,
-      assignee: true,
-      creator: true,
-    },
-  });
-
-  // Update lastGenerated timestamp
-  await prisma.recurringTask.update({
-    where: { id: recurring.id },
-    data: { lastGenerated: nextDueDate },
-  });
+  // Create the instance and advance lastGenerated under one commit, so the
+  // pair costs a single WAL flush and a crash can't generate it twice
+  const [newTask] = await prisma.$transaction([
+    prisma.task.create({
+      data: {
+        title: baseTask.title,
+        description: baseTask.description,
+        status: 'TODO' as TaskStatus,
+        priority: baseTask.priority,
+        dueDate: nextDueDate,
+        projectId: recurring.projectId,
+        assigneeId: baseTask.assigneeId,
+        creatorId: recurring.creatorId,
+        recurringTaskId: recurring.id,
+        isRecurring: true,
+      },
+      include: {
+        project: true,
+        assignee: true,
+        creator: true,
+      },
+    }),
+    prisma.recurringTask.update({
+      where: { id: recurring.id },
+      data: { lastGenerated: nextDueDate },
+    }),
+  ]);
 
   return newTask;
 }
@@ -173,7 +184,8 @@ export async function generateAllDueRecurringTasks() {
     failed: [] as { id: string; error: string }[],
   };
 
-  for (const recurring of recurringTasks) {
+  // Generations are independent DB round trips, so run a bounded number at once
+  await mapWithConcurrency(recurringTasks, GENERATION_CONCURRENCY, async (recurring) => {
     try {
       // Calculate what the next occurrence should be
       const lastDate = recurring.lastGenerated || recurring.startDate;
@@ -186,7 +198,7 @@ export async function generateAllDueRecurringTasks() {
 
       // Only generate if next date is now or in the past
       if (nextDate <= now) {
-        await generateNextTask(recurring.id);
+        await generateNextTask(recurring, now);
         results.success.push(recurring.id);
       }
     } catch (error) {
@@ -195,7 +207,7 @@ export async function generateAllDueRecurringTasks() {
         error: error instanceof Error ? error.message : 'Unknown error',
       });
     }
-  }
+  });
 
   return results;
 }
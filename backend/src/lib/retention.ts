@@ -0,0 +1,47 @@
+import prisma from './prisma.js';
+
+const ACTIVITY_LOG_RETENTION_DAYS = 180;
+const WEBHOOK_LOG_RETENTION_DAYS = 90;
+
+// Rows removed per DELETE — keeps each statement's locks and WAL burst short
+const PURGE_BATCH_SIZE = 5000;
+
+function daysAgo(days: number): Date {
+  return new Date(Date.now() - days * 24 * 60 * 60 * 1000);
+}
+
+/**
+ * Repeatedly selects up to `PURGE_BATCH_SIZE` expired ids (served by the
+ * createdAt index) and deletes exactly those, until none remain.
+ * Returns the total number of rows deleted.
+ */
+async function deleteInBatches(
+  findBatch: (take: number) => Promise<{ id: string }[]>,
+  deleteBatch: (ids: string[]) => Promise<{ count: number }>,
+): Promise<number> {
+  let total = 0;
+  for (;;) {
+    const rows = await findBatch(PURGE_BATCH_SIZE);
+    if (rows.length === 0) break;
+    const { count } = await deleteBatch(rows.map((r) => r.id));
+    total += count;
+    if (rows.length < PURGE_BATCH_SIZE) break;
+  }
+  return total;
+}
+
+export async function purgeExpiredActivityLogs(): Promise<number> {
+  const cutoff = daysAgo(ACTIVITY_LOG_RETENTION_DAYS);
+  return deleteInBatches(
+    (take) => prisma.activityLog.findMany({ where: { createdAt: { lt: cutoff } }, select: { id: true }, take }),
+    (ids) => prisma.activityLog.deleteMany({ where: { id: { in: ids } } }),
+  );
+}
+
+export async function purgeExpiredWebhookLogs(): Promise<number> {
+  const cutoff = daysAgo(WEBHOOK_LOG_RETENTION_DAYS);
+  return deleteInBatches(
+    (take) => prisma.webhookLog.findMany({ where: { createdAt: { lt: cutoff } }, select: { id: true }, take }),
+    (ids) => prisma.webhookLog.deleteMany({ where: { id: { in: ids } } }),
+  );
+}
@@ -1,5 +1,6 @@
 import cron from 'node-cron';
 import { generateAllDueRecurringTasks } from './recurrence.js';
+import { purgeExpiredActivityLogs, purgeExpiredWebhookLogs } from './retention.js';
 
 /**
  * Start the cron scheduler for recurring tasks
@@ -23,5 +24,19 @@ export function startScheduler() {
     }
   });
 
+  // Log retention: one batched purge per day instead of a DELETE on every log write
+  cron.schedule('30 3 * * *', async () => {
+    try {
+      // The two tables are independent, so purge them side by side on separate pool connections
+      const [activityLogs, webhookLogs] = await Promise.all([
+        purgeExpiredActivityLogs(),
+        purgeExpiredWebhookLogs(),
+      ]);
+      console.log(`[Scheduler] Purged ${activityLogs} activity logs and ${webhookLogs} webhook logs`);
+    } catch (error) {
+      console.error('[Scheduler] Error purging expired logs:', error);
+    }
+  });
+
   console.log(`[Scheduler] Started - running ${schedule}`);
 }
@@ -2,6 +2,8 @@ import { Server as HttpServer } from 'http';
 import { Server, Socket } from 'socket.io';
 import jwt from 'jsonwebtoken';
 import cookie from 'cookie';
+import { getJwtSecret } from '../middleware/auth.js';
+import { getAllowedOrigins } from './cors.js';
 
 let io: Server | null = null;
 
@@ -14,14 +16,9 @@ interface JwtPayload {
 const onlineUsers = new Map<string, Set<string>>(); // userId -> Set<socketId>
 
 export function initializeSocket(httpServer: HttpServer) {
-  const allowedOrigins = (process.env.CORS_ORIGIN || 'http://localhost:3000')
-    .split(',')
-    .map((o) => o.trim())
-    .filter(Boolean);
-
   io = new Server(httpServer, {
     cors: {
-      origin: allowedOrigins,
+      origin: getAllowedOrigins(),
       credentials: true,
     },
   });
@@ -40,7 +37,7 @@ export function initializeSocket(httpServer: HttpServer) {
         return next(new Error('Authentication required'));
       }
 
-      const payload = jwt.verify(token, process.env.JWT_SECRET as string) as JwtPayload;
+      const payload = jwt.verify(token, getJwtSecret()) as JwtPayload;
       (socket as unknown as { userId: string }).userId = payload.userId;
       next();
     } catch {
@@ -1,5 +1,6 @@
 import prisma from './prisma.js';
 import { AppError } from '../middleware/errorHandler.js';
+import { isProjectAdmin } from '../middleware/rbac.js';
 
 export const userSelect = {
   id: true,
@@ -52,9 +53,8 @@ export function canModifyTask(
   userId: string
 ): boolean {
   if (!membership) return false;
-  if (['OWNER', 'ADMIN'].includes(membership.role)) return true;
-  if (membership.role === 'MEMBER' && task.creatorId === userId) return true;
-  return false;
+  // Admins pass on the role alone; only MEMBERs need the creator comparison
+  return isProjectAdmin(membership.role) || (membership.role === 'MEMBER' && task.creatorId === userId);
 }
 
 export const uuidRegex = /^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$/i;
@@ -64,3 +64,16 @@ export function validateUUID(id: string, label: string): void {
     throw new AppError(`Invalid ${label} format`, 400);
   }
 }
+
+/**
+ * Reads a `?cursor=` row id for keyset pagination. An empty cursor means the
+ * first page; anything else must be a UUID, so a malformed cursor is a 400
+ * rather than a Prisma error.
+ */
+export function parseCursor(cursor: unknown): string | undefined {
+  if (!cursor) return undefined;
+  if (typeof cursor !== 'string' || !uuidRegex.test(cursor)) {
+    throw new AppError('Invalid cursor format', 400);
+  }
+  return cursor;
+}
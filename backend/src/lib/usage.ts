@@ -29,15 +29,18 @@ export const PLAN_LIMITS = {
   },
 } as const;
 
+export interface BillingPeriod {
+  start: Date;
+  end: Date;
+}
+
 /**
- * Get the current billing period start/end for a user.
+ * Billing period for an already-loaded subscription (or none).
  * Uses the subscription period if available, otherwise calendar month.
  */
-export async function getCurrentPeriod(userId: string): Promise<{ start: Date; end: Date }> {
-  const subscription = await prisma.subscription.findUnique({
-    where: { userId },
-  });
-
+export function periodFromSubscription(
+  subscription: { currentPeriodStart: Date; currentPeriodEnd: Date } | null,
+): BillingPeriod {
   if (subscription) {
     return {
       start: subscription.currentPeriodStart,
@@ -52,12 +55,25 @@ export async function getCurrentPeriod(userId: string): Promise<{ start: Date; e
   return { start, end };
 }
 
+/**
+ * Get the current billing period start/end for a user.
+ */
+export async function getCurrentPeriod(userId: string): Promise<BillingPeriod> {
+  const subscription = await prisma.subscription.findUnique({
+    where: { userId },
+    select: { currentPeriodStart: true, currentPeriodEnd: true },
+  });
+
+  return periodFromSubscription(subscription);
+}
+
 /**
  * Increment usage for a feature in the current billing period.
+ * Pass `period` when the request already resolved it to skip re-reading it.
  * Returns the new count.
  */
-export async function incrementUsage(userId: string, feature: string): Promise<number> {
-  const period = await getCurrentPeriod(userId);
+export async function incrementUsage(userId: string, feature: string, period?: BillingPeriod): Promise<number> {
+  period ??= await getCurrentPeriod(userId);
 
   const record = await prisma.usageRecord.upsert({
     where: {
@@ -84,9 +100,10 @@ export async function incrementUsage(userId: string, feature: string): Promise<n
 
 /**
  * Get current usage for a feature in the current billing period.
+ * Pass `period` when the request already resolved it to skip re-reading it.
  */
-export async function getUsage(userId: string, feature: string): Promise<number> {
-  const period = await getCurrentPeriod(userId);
+export async function getUsage(userId: string, feature: string, period?: BillingPeriod): Promise<number> {
+  period ??= await getCurrentPeriod(userId);
 
   const record = await prisma.usageRecord.findUnique({
     where: {
@@ -103,13 +120,14 @@ export async function getUsage(userId: string, feature: string): Promise<number>
 
 /**
  * Check if a user can use a feature based on their plan limits.
- * Returns { allowed, current, limit } for quota-based features.
+ * Returns { allowed, current, limit } for quota-based features, plus the
+ * billing period when one had to be looked up.
  */
 export async function checkFeatureAccess(
   userId: string,
   feature: keyof typeof PLAN_LIMITS.FREE,
   plan: PlanTier
-): Promise<{ allowed: boolean; current: number; limit: number }> {
+): Promise<{ allowed: boolean; current: number; limit: number; period?: BillingPeriod }> {
   const limit = PLAN_LIMITS[plan][feature];
 
   if (limit === Infinity) {
@@ -121,10 +139,12 @@ export async function checkFeatureAccess(
   }
 
   // For countable features, check usage
-  const current = await getUsage(userId, feature);
+  const period = await getCurrentPeriod(userId);
+  const current = await getUsage(userId, feature, period);
   return {
     allowed: current < limit,
     current,
     limit,
+    period,
   };
 }
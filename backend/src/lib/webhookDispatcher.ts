@@ -1,5 +1,6 @@
 import crypto, { randomUUID } from 'crypto';
 import prisma from './prisma.js';
+import { distinct } from './batching.js';
 
 const WEBHOOK_EVENTS = [
   'task.created',
@@ -17,17 +18,95 @@ export type WebhookEvent = typeof WEBHOOK_EVENTS[number];
 
 export const ALLOWED_WEBHOOK_EVENTS = WEBHOOK_EVENTS;
 
+// Retry delay per failed attempt (attempt 1 → 1s, attempt 2 → 5s); attempt 3 is final
+const RETRY_DELAYS_MS = [1000, 5000] as const;
+
+interface PendingRetry {
+  webhookId: string;
+  url: string;
+  secret: string;
+  event: string;
+  dataJson: string | undefined; // undefined when there is no payload
+  attempt: number;
+  dueAt: number;
+}
+
+interface RetryBucket {
+  entries: PendingRetry[]; // FIFO — every entry shares the bucket delay, so dueAt is ascending
+  timer: ReturnType<typeof setTimeout> | null;
+}
+
+// One bucket per retry tier. Each bucket owns a single timer that flushes every
+// due entry in one pass, instead of arming a separate setTimeout per failed delivery.
+const retryBuckets = new Map<number, RetryBucket>();
+
+function armRetryBucket(delayMs: number, bucket: RetryBucket, waitMs: number): void {
+  bucket.timer = setTimeout(() => flushRetryBucket(delayMs, bucket), waitMs);
+}
+
+function flushRetryBucket(delayMs: number, bucket: RetryBucket): void {
+  const now = Date.now();
+  let dueCount = 0;
+  while (dueCount < bucket.entries.length && bucket.entries[dueCount].dueAt <= now) {
+    dueCount++;
+  }
+  const due = bucket.entries.splice(0, dueCount);
+
+  bucket.timer = null;
+  if (bucket.entries.length > 0) {
+    armRetryBucket(delayMs, bucket, bucket.entries[0].dueAt - now);
+  }
+
+  if (due.length > 0) {
+    void redeliverRetries(due)
+      .catch((err) => console.error('[webhookDispatcher] Failed to flush webhook retries:', err));
+  }
+}
+
+async function redeliverRetries(due: PendingRetry[]): Promise<void> {
+  // A webhook may have been disabled or deleted while its retry was waiting.
+  // Check the whole batch in one query and drop those instead of re-sending.
+  const activeWebhooks = await prisma.webhook.findMany({
+    where: { id: { in: distinct(due, (r) => r.webhookId) }, active: true },
+    select: { id: true },
+  });
+  const activeIds = new Set(activeWebhooks.map((w) => w.id));
+
+  for (const retry of due) {
+    if (!activeIds.has(retry.webhookId)) continue;
+    void deliverWebhook(retry.webhookId, retry.url, retry.secret, retry.event, retry.dataJson, retry.attempt)
+      .catch((err) => console.error(`[webhookDispatcher] Failed to retry webhook ${retry.webhookId}:`, err));
+  }
+}
+
+function scheduleRetry(retry: PendingRetry, delayMs: number): void {
+  let bucket = retryBuckets.get(delayMs);
+  if (!bucket) {
+    bucket = { entries: [], timer: null };
+    retryBuckets.set(delayMs, bucket);
+  }
+
+  bucket.entries.push(retry);
+  if (!bucket.timer) {
+    armRetryBucket(delayMs, bucket, delayMs);
+  }
+}
+
 async function deliverWebhook(
   webhookId: string,
   url: string,
   secret: string,
   event: string,
-  data: unknown,
+  dataJson: string | undefined,
   attempt: number = 1,
 ): Promise<void> {
   const deliveryId = randomUUID();
-  const body = JSON.stringify({ event, timestamp: new Date().toISOString(), deliveryId, data });
+  // Only the envelope differs per delivery; the payload arrives pre-serialised.
+  // Like JSON.stringify, an undefined payload leaves the data key out.
+  const body = `{"event":${JSON.stringify(event)},"timestamp":"${new Date().toISOString()}",` +
+    `"deliveryId":"${deliveryId}"${dataJson === undefined ? '' : `,"data":${dataJson}`}}`;
   const signature = crypto.createHmac('sha256', secret).update(body).digest('hex');
+  let statusCode: number | undefined;
 
   try {
     const controller = new AbortController();
@@ -45,54 +124,45 @@ async function deliverWebhook(
     });
 
     clearTimeout(timeout);
+    statusCode = response.status;
 
-    // Upsert the delivery log (idempotent — keyed on deliveryId)
-    await prisma.webhookLog.upsert({
-      where: { deliveryId },
-      update: { statusCode: response.status },
-      create: {
-        webhookId,
-        event,
-        statusCode: response.status,
-        deliveryId,
-      },
-    });
-
-    // Fire-and-forget: clean up logs older than 90 days for this webhook
-    prisma.webhookLog.deleteMany({
-      where: {
-        webhookId,
-        createdAt: { lt: new Date(Date.now() - 90 * 24 * 60 * 60 * 1000) },
-      },
-    }).catch((err) => console.error('[webhookDispatcher] Failed to cleanup old logs:', err));
+    if (!response.ok) {
+      throw new Error(`HTTP ${response.status}`);
+    }
 
-    if (response.ok) {
+    // The delivery log and the failure-count reset are independent writes,
+    // so issue them together rather than paying two sequential round trips.
+    await Promise.all([
+      // Upsert the delivery log (idempotent — keyed on deliveryId)
+      prisma.webhookLog.upsert({
+        where: { deliveryId },
+        update: { statusCode },
+        create: { webhookId, event, statusCode, deliveryId },
+      }),
       // Reset failure count on success
-      await prisma.webhook.update({
+      prisma.webhook.update({
         where: { id: webhookId },
         data: { failureCount: 0 },
-      });
-    } else {
-      throw new Error(`HTTP ${response.status}`);
-    }
+      }),
+    ]);
   } catch (error: unknown) {
-    // Upsert the failure log (idempotent — keyed on deliveryId)
-    await prisma.webhookLog.upsert({
-      where: { deliveryId },
-      update: { error: error instanceof Error ? error.message : 'Unknown error' },
-      create: {
-        webhookId,
-        event,
-        error: error instanceof Error ? error.message : 'Unknown error',
-        deliveryId,
-      },
-    }).catch((err) => console.error(`[webhookDispatcher] Failed to log webhook failure for ${webhookId}:`, err));
+    const message = error instanceof Error ? error.message : 'Unknown error';
 
-    // Increment failure count
-    const updated = await prisma.webhook.update({
-      where: { id: webhookId },
-      data: { failureCount: { increment: 1 } },
-    }).catch(() => null);
+    // Failure log (with the HTTP status, when there was one) and failure-count
+    // increment go out together; a non-2xx response is logged in a single upsert.
+    const [, updated] = await Promise.all([
+      // Upsert the failure log (idempotent — keyed on deliveryId)
+      prisma.webhookLog.upsert({
+        where: { deliveryId },
+        update: { statusCode, error: message },
+        create: { webhookId, event, statusCode, error: message, deliveryId },
+      }).catch((err) => console.error(`[webhookDispatcher] Failed to log webhook failure for ${webhookId}:`, err)),
+      // Increment failure count
+      prisma.webhook.update({
+        where: { id: webhookId },
+        data: { failureCount: { increment: 1 } },
+      }).catch(() => null),
+    ]);
 
     // Auto-disable after 10 consecutive failures
     if (updated && updated.failureCount >= 10) {
@@ -103,12 +173,14 @@ async function deliverWebhook(
       return; // Don't retry if disabled
     }
 
-    // Retry with exponential backoff (1s, 5s, 25s)
-    if (attempt < 3) {
-      const delay = Math.pow(5, attempt - 1) * 1000;
-      setTimeout(() => {
-        void deliverWebhook(webhookId, url, secret, event, data, attempt + 1);
-      }, delay);
+    // Retry with exponential backoff (1s, 5s) via the shared retry buckets
+    if (attempt <= RETRY_DELAYS_MS.length) {
+      const delayMs = RETRY_DELAYS_MS[attempt - 1];
+      // Built once in its final shape; the bucket keeps this object as-is
+      scheduleRetry(
+        { webhookId, url, secret, event, dataJson, attempt: attempt + 1, dueAt: Date.now() + delayMs },
+        delayMs,
+      );
     }
   }
 }
@@ -121,11 +193,17 @@ export async function dispatchWebhooks(event: string, data: unknown, userId: str
         active: true,
         events: { has: event },
       },
+      // Only what delivery needs; retries hold on to these values for seconds
+      select: { id: true, url: true, secret: true },
     });
 
+    if (webhooks.length === 0) return;
+
+    // Serialise the payload once for every subscriber and any retries
+    const dataJson: string | undefined = JSON.stringify(data);
     for (const webhook of webhooks) {
       // Fire-and-forget: don't await delivery
-      void deliverWebhook(webhook.id, webhook.url, webhook.secret, event, data).catch((err) => console.error(`[webhookDispatcher] Failed to deliver webhook ${webhook.id}:`, err));
+      void deliverWebhook(webhook.id, webhook.url, webhook.secret, event, dataJson).catch((err) => console.error(`[webhookDispatcher] Failed to deliver webhook ${webhook.id}:`, err));
     }
   } catch (error) {
     console.error('Failed to dispatch webhooks:', error);
@@ -18,6 +18,11 @@ interface JwtPayload {
 
 const COOKIE_NAME = 'auth_token';
 
+// process.env is a getter into the OS environment block, so the secret used on
+// every token check is read once on first use (after dotenv has populated it)
+let jwtSecret: string | undefined;
+export const getJwtSecret = (): string => (jwtSecret ??= process.env.JWT_SECRET as string);
+
 export const getCookieOptions = () => ({
   httpOnly: true,
   secure: process.env.NODE_ENV === 'production',
@@ -30,7 +35,7 @@ export const generateToken = (userId: string): string => {
   const expiresIn = (process.env.JWT_SECRET ? process.env.JWT_EXPIRES_IN || '7d' : '7d') as string & jwt.SignOptions['expiresIn'];
   return jwt.sign(
     { userId },
-    process.env.JWT_SECRET as string,
+    getJwtSecret(),
     { expiresIn }
   );
 };
@@ -126,7 +131,7 @@ export const authenticate = async (
   }
 
   try {
-    const payload = jwt.verify(token, process.env.JWT_SECRET as string) as JwtPayload;
+    const payload = jwt.verify(token, getJwtSecret()) as JwtPayload;
     req.userId = payload.userId;
     req.authMethod = 'cookie';
     next();
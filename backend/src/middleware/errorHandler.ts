@@ -14,8 +14,13 @@ export const errorHandler = (
   err: Error,
   _req: Request,
   res: Response,
-  _next: NextFunction
+  next: NextFunction
 ) => {
+  // A streamed response already sent its status; let Express abort the connection
+  if (res.headersSent) {
+    return next(err);
+  }
+
   if (err instanceof ZodError) {
     return res.status(400).json({
       error: 'Validation error',
@@ -3,11 +3,13 @@ import { PlanTier } from '@prisma/client';
 import prisma from '../lib/prisma.js';
 import { AuthRequest } from './auth.js';
 import { AppError } from './errorHandler.js';
-import { PLAN_LIMITS, checkFeatureAccess } from '../lib/usage.js';
+import { PLAN_LIMITS, BillingPeriod, checkFeatureAccess } from '../lib/usage.js';
 
 // Extend AuthRequest to include plan info
 export interface PlanRequest extends AuthRequest {
   userPlan?: PlanTier;
+  /** Billing period resolved by requireQuota(), reused when recording usage. */
+  usagePeriod?: BillingPeriod;
 }
 
 /**
@@ -45,6 +47,9 @@ export const loadPlan = async (
  * Usage: `requirePlan('PRO')` or `requirePlan('TEAM')`
  */
 export const requirePlan = (...allowedPlans: PlanTier[]) => {
+  // Fixed per route, so the plan list in the 403 message is joined once here
+  const requiredPlans = allowedPlans.join(' or ');
+
   return async (req: PlanRequest, _res: Response, next: NextFunction): Promise<void> => {
     if (!req.userId) {
       return next(new AppError('Authentication required', 401));
@@ -63,7 +68,7 @@ export const requirePlan = (...allowedPlans: PlanTier[]) => {
     if (!allowedPlans.includes(req.userPlan)) {
       return next(
         new AppError(
-          `This feature requires a ${allowedPlans.join(' or ')} plan. ` +
+          `This feature requires a ${requiredPlans} plan. ` +
           `You are on the ${req.userPlan} plan.`,
           403
         )
@@ -94,11 +99,12 @@ export const requireQuota = (feature: keyof typeof PLAN_LIMITS.FREE) => {
       req.userPlan = user.plan;
     }
 
-    const { allowed, current, limit } = await checkFeatureAccess(
+    const { allowed, current, limit, period } = await checkFeatureAccess(
       req.userId,
       feature,
       req.userPlan
     );
+    req.usagePeriod = period;
 
     if (!allowed) {
       const msg = limit === 0
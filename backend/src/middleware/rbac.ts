@@ -11,6 +11,11 @@ export interface ProjectRoleRequest extends AuthRequest {
   projectMembership?: { role: ProjectRole };
 }
 
+// ─── Role helpers ─────────────────────────────────────────────────────────────
+
+/** True for roles that can manage a project (OWNER or ADMIN). */
+export const isProjectAdmin = (role: string): boolean => role === 'OWNER' || role === 'ADMIN';
+
 // ─── Middleware factory ───────────────────────────────────────────────────────
 
 /**
@@ -28,6 +33,9 @@ export interface ProjectRoleRequest extends AuthRequest {
  *   router.delete('/:id',               authenticate, requireProjectRole('OWNER'),            handler)
  */
 export const requireProjectRole = (...allowedRoles: ProjectRole[]) => {
+  // Fixed per route, so the role list in the 403 message is joined once here
+  const requiredRoles = allowedRoles.join(' or ');
+
   return async (
     req: ProjectRoleRequest,
     _res: Response,
@@ -56,7 +64,7 @@ export const requireProjectRole = (...allowedRoles: ProjectRole[]) => {
       if (!allowedRoles.includes(membership.role)) {
         return next(
           new AppError(
-            `This action requires ${allowedRoles.join(' or ')} role. ` +
+            `This action requires ${requiredRoles} role. ` +
               `Your role is ${membership.role}.`,
             403,
           ),
@@ -1,7 +1,7 @@
 import rateLimit from 'express-rate-limit';
 import { Request, Response, NextFunction } from 'express';
 import jwt from 'jsonwebtoken';
-import { AuthRequest } from './auth.js';
+import { AuthRequest, getJwtSecret } from './auth.js';
 
 interface JwtPayload {
   userId: string;
@@ -42,7 +42,7 @@ export const tryAuthenticate = (req: Request, _res: Response, next: NextFunction
     }
 
     if (token) {
-      const payload = jwt.verify(token, process.env.JWT_SECRET as string) as JwtPayload;
+      const payload = jwt.verify(token, getJwtSecret()) as JwtPayload;
       (req as AuthRequest).userId = payload.userId;
       (req as AuthRequest).authMethod = 'cookie';
     }
@@ -2,6 +2,7 @@ import { Router, Response, NextFunction } from 'express';
 import { z } from 'zod';
 import prisma from '../lib/prisma.js';
 import { AppError } from '../middleware/errorHandler.js';
+import { isProjectAdmin } from '../middleware/rbac.js';
 import { authenticate, AuthRequest } from '../middleware/auth.js';
 import { requirePlan, requireQuota, PlanRequest } from '../middleware/planEnforcement.js';
 import { incrementUsage } from '../lib/usage.js';
@@ -44,7 +45,7 @@ router.post(
         const membership = await prisma.projectMember.findUnique({
           where: { projectId_userId: { projectId: task.projectId, userId: req.userId! } },
         });
-        if (!membership || !['OWNER', 'ADMIN'].includes(membership.role)) {
+        if (!membership || !isProjectAdmin(membership.role)) {
           throw new AppError('Task not found', 404);
         }
       }
@@ -58,8 +59,8 @@ router.post(
         },
       });
 
-      // Track usage
-      await incrementUsage(req.userId!, 'ai_delegation');
+      // Track usage (in the period requireQuota already resolved)
+      await incrementUsage(req.userId!, 'ai_delegation', req.usagePeriod);
 
       // Fire webhook (fire-and-forget)
       void dispatchWebhooks('task.delegated', { delegation, taskId: data.taskId }, req.userId!);
@@ -2,6 +2,7 @@ import express from 'express';
 import prisma from '../lib/prisma.js';
 import { authenticate, AuthRequest } from '../middleware/auth.js';
 import { AppError } from '../middleware/errorHandler.js';
+import { isProjectAdmin } from '../middleware/rbac.js';
 import { calculateCheckinStreak } from '../lib/streakUtils.js';
 
 const router = express.Router();
@@ -16,37 +17,29 @@ router.get('/insights', authenticate, async (req: AuthRequest, res, next) => {
         const oneWeekAgo = new Date(now.getTime() - 7 * 24 * 60 * 60 * 1000);
         const twoWeeksAgo = new Date(now.getTime() - 14 * 24 * 60 * 60 * 1000);
 
-        // 1. Tasks completed in the last 7 days vs previous 7 days
-        const completedThisWeek = await prisma.task.count({
-            where: {
-                assigneeId: userId,
-                status: 'DONE',
-                updatedAt: { gte: oneWeekAgo },
-            },
-        });
-
-        const completedLastWeek = await prisma.task.count({
-            where: {
-                assigneeId: userId,
-                status: 'DONE',
-                updatedAt: { gte: twoWeeksAgo, lt: oneWeekAgo },
-            },
-        });
-
-        // 2. Most productive day of the week (all time)
-        // Prisma grouping by date part isn't direct in generic SQL without raw query, 
-        // but for MVP we can fetch recent completed tasks and aggregate in JS
+        // One query for every task completed in the last 14 days feeds both the
+        // week-over-week counts and the productive-day pattern, instead of two
+        // separate COUNT round trips plus a findMany over the same rows.
         const recentTasks = await prisma.task.findMany({
             where: {
                 assigneeId: userId,
                 status: 'DONE',
-                updatedAt: { gte: twoWeeksAgo }, // Look back 2 weeks for "productive day" pattern
+                updatedAt: { gte: twoWeeksAgo },
             },
             select: { updatedAt: true },
         });
 
+        // 1. Tasks completed in the last 7 days vs previous 7 days
+        // 2. Most productive day of the week (over the same 2-week window)
+        let completedThisWeek = 0;
+        let completedLastWeek = 0;
         const dayCounts = new Array(7).fill(0);
         recentTasks.forEach((task) => {
+            if (task.updatedAt >= oneWeekAgo) {
+                completedThisWeek++;
+            } else {
+                completedLastWeek++;
+            }
             const day = task.updatedAt.getDay(); // 0 = Sunday
             dayCounts[day]++;
         });
@@ -69,21 +62,32 @@ router.get('/insights', authenticate, async (req: AuthRequest, res, next) => {
         const recentCheckins = await prisma.dailyCheckin.findMany({
             where: { userId, date: { gte: twoWeeksAgoCheckin } },
             orderBy: { date: 'desc' },
+            select: { date: true, energyLevel: true },
+        });
+
+        // Single pass: overall energy sum, the last-7 / previous-7 sums for the
+        // trend, and the streak dates (already newest-first from the query)
+        let energySum = 0;
+        let last7Sum = 0;
+        let prev7Sum = 0;
+        const sortedDates: string[] = [];
+        recentCheckins.forEach((c, i) => {
+            energySum += c.energyLevel;
+            if (i < 7) last7Sum += c.energyLevel;
+            else if (i < 14) prev7Sum += c.energyLevel;
+            sortedDates.push(c.date.toISOString().slice(0, 10));
         });
 
-        const avgEnergy = recentCheckins.length > 0
-            ? recentCheckins.reduce((sum, c) => sum + c.energyLevel, 0) / recentCheckins.length
-            : 0;
+        const avgEnergy = recentCheckins.length > 0 ? energySum / recentCheckins.length : 0;
 
         // Calculate streak
-        const sortedDates = recentCheckins.map(c => c.date.toISOString().slice(0, 10)).sort().reverse();
         const checkinStreak = calculateCheckinStreak(sortedDates);
 
         // Energy trend: compare last 7 days avg vs previous 7 days avg
-        const last7 = recentCheckins.slice(0, 7);
-        const prev7 = recentCheckins.slice(7, 14);
-        const last7Avg = last7.length > 0 ? last7.reduce((s, c) => s + c.energyLevel, 0) / last7.length : 0;
-        const prev7Avg = prev7.length > 0 ? prev7.reduce((s, c) => s + c.energyLevel, 0) / prev7.length : 0;
+        const last7Count = Math.min(recentCheckins.length, 7);
+        const prev7Count = Math.min(Math.max(recentCheckins.length - 7, 0), 7);
+        const last7Avg = last7Count > 0 ? last7Sum / last7Count : 0;
+        const prev7Avg = prev7Count > 0 ? prev7Sum / prev7Count : 0;
         const energyTrend = prev7Avg === 0 ? 0 : ((last7Avg - prev7Avg) / prev7Avg) * 100;
 
         res.json({
@@ -122,7 +126,7 @@ router.get('/creator-metrics', authenticate, async (req: AuthRequest, res, next)
         const membership = await prisma.projectMember.findUnique({
             where: { projectId_userId: { projectId, userId } },
         });
-        if (!membership || !['OWNER', 'ADMIN'].includes(membership.role)) {
+        if (!membership || !isProjectAdmin(membership.role)) {
             throw new AppError('Only project owners and admins can view creator metrics', 403);
         }
 
@@ -178,6 +182,10 @@ router.get('/creator-metrics', authenticate, async (req: AuthRequest, res, next)
             });
         }
 
+        // Project-level totals are accumulated in the same pass as the per-creator metrics
+        let totalDone = 0;
+        let totalStale = 0;
+
         for (const task of tasks) {
             let entry = creatorMap.get(task.creatorId);
             if (!entry) {
@@ -204,6 +212,7 @@ router.get('/creator-metrics', authenticate, async (req: AuthRequest, res, next)
             }
 
             if (task.status === 'DONE') {
+                totalDone++;
                 if (task.updatedAt >= oneWeekAgo) {
                     entry.completedThisWeek++;
                 } else if (task.updatedAt >= twoWeeksAgo) {
@@ -213,6 +222,7 @@ router.get('/creator-metrics', authenticate, async (req: AuthRequest, res, next)
                 entry.openTasks++;
                 if (task.updatedAt < oneWeekAgo) {
                     entry.staleTasks++;
+                    totalStale++;
                 }
             }
         }
@@ -257,9 +267,7 @@ router.get('/creator-metrics', authenticate, async (req: AuthRequest, res, next)
 
         // Project-level summary
         const totalTasks = tasks.length;
-        const totalDone = tasks.filter((t) => t.status === 'DONE').length;
         const totalOpen = totalTasks - totalDone;
-        const totalStale = tasks.filter((t) => t.status !== 'DONE' && t.updatedAt < oneWeekAgo).length;
 
         // Bottleneck identification: creators with high open tasks and high stale tasks
         const bottlenecks = creators
@@ -4,6 +4,7 @@ import path from 'path';
 import fs from 'fs';
 import prisma from '../lib/prisma.js';
 import { AppError } from '../middleware/errorHandler.js';
+import { isProjectAdmin } from '../middleware/rbac.js';
 import { authenticate, AuthRequest } from '../middleware/auth.js';
 
 const router = Router();
@@ -123,11 +124,13 @@ router.get('/:id/download', async (req: AuthRequest, res: Response, next: NextFu
     const membership = await getProjectMembership(req.userId!, attachment.task.projectId);
     if (!membership) throw new AppError('Attachment not found', 404);
 
-    if (!fs.existsSync(attachment.path)) {
-      throw new AppError('File not found on server', 404);
-    }
-
-    res.download(attachment.path, attachment.originalName);
+    // res.download already stats the file; map a missing file to a 404 there
+    // instead of paying a blocking existsSync() on every download
+    res.download(attachment.path, attachment.originalName, (err) => {
+      if (!err || res.headersSent) return;
+      const code = (err as NodeJS.ErrnoException).code;
+      next(code === 'ENOENT' ? new AppError('File not found on server', 404) : err);
+    });
   } catch (error) { next(error); }
 });
 
@@ -143,7 +146,7 @@ router.delete('/:id', async (req: AuthRequest, res: Response, next: NextFunction
 
     const membership = await getProjectMembership(req.userId!, attachment.task.projectId);
     const isUploader = attachment.uploadedById === req.userId;
-    const isAdminOrOwner = membership && ['OWNER', 'ADMIN'].includes(membership.role);
+    const isAdminOrOwner = membership && isProjectAdmin(membership.role);
 
     // Non-members (who are also not the uploader) should not know the attachment exists
     if (!membership && !isUploader) {
@@ -154,10 +157,10 @@ router.delete('/:id', async (req: AuthRequest, res: Response, next: NextFunction
       throw new AppError('Cannot delete this attachment', 403);
     }
 
-    // Delete file from disk
-    if (fs.existsSync(attachment.path)) {
-      fs.unlinkSync(attachment.path);
-    }
+    // Delete file from disk (a file that is already gone is not an error)
+    await fs.promises.unlink(attachment.path).catch((err: NodeJS.ErrnoException) => {
+      if (err.code !== 'ENOENT') throw err;
+    });
 
     await prisma.attachment.delete({ where: { id: req.params.id } });
     res.status(204).send();
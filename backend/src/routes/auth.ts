@@ -15,6 +15,7 @@ import {
   clearAuthCookie,
 } from '../middleware/auth.js';
 import { requirePlan, PlanRequest } from '../middleware/planEnforcement.js';
+import { isRecordNotFound } from '../lib/prisma-errors.js';
 
 const router = Router();
 
@@ -128,7 +129,10 @@ router.post('/register', authLimiter, async (req: Request, res: Response, next:
   try {
     const data = registerSchema.parse(req.body);
 
-    const existing = await prisma.user.findUnique({ where: { email: data.email } });
+    const existing = await prisma.user.findUnique({
+      where: { email: data.email },
+      select: { id: true },
+    });
     if (existing) {
       throw new AppError('Email already registered', 409);
     }
@@ -551,20 +555,19 @@ router.get('/api-keys', authenticate, async (req: AuthRequest, res: Response, ne
  */
 router.delete('/api-keys/:id', authenticate, async (req: AuthRequest, res: Response, next: NextFunction) => {
   try {
-    const key = await prisma.apiKey.findUnique({
-      where: { id: req.params.id },
-    });
-
-    if (!key) {
-      throw new AppError('API key not found', 404);
-    }
-
-    if (key.userId !== req.userId) {
-      throw new AppError('You can only revoke your own API keys', 403);
-    }
-
+    // Owner-scoped delete in one round trip; a miss falls back to a lookup for 404 vs 403
     await prisma.apiKey.delete({
-      where: { id: req.params.id },
+      where: { id: req.params.id, userId: req.userId! },
+      select: { id: true },
+    }).catch(async (err: unknown) => {
+      if (!isRecordNotFound(err)) throw err;
+      const key = await prisma.apiKey.findUnique({
+        where: { id: req.params.id },
+        select: { id: true },
+      });
+      throw key
+        ? new AppError('You can only revoke your own API keys', 403)
+        : new AppError('API key not found', 404);
     });
 
     res.status(204).send();
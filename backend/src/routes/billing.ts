@@ -5,8 +5,9 @@ import prisma from '../lib/prisma.js';
 import { AppError } from '../middleware/errorHandler.js';
 import { authenticate, AuthRequest } from '../middleware/auth.js';
 import { getStripeOrThrow, STRIPE_PRICES } from '../lib/stripe.js';
-import { PLAN_LIMITS, getUsage, getCurrentPeriod } from '../lib/usage.js';
-import { PlanTier } from '@prisma/client';
+import { BoundedSet } from '../lib/boundedSet.js';
+import { PLAN_LIMITS, getUsage, periodFromSubscription } from '../lib/usage.js';
+import { PlanTier, SubscriptionStatus } from '@prisma/client';
 
 const router = Router();
 
@@ -96,8 +97,9 @@ router.get('/status', authenticate, async (req: AuthRequest, res: Response, next
 
     if (!user) throw new AppError('User not found', 404);
 
-    const period = await getCurrentPeriod(req.userId!);
-    const aiUsage = await getUsage(req.userId!, 'ai_delegation');
+    // The subscription is already loaded, so derive the period from it
+    const period = periodFromSubscription(user.subscription);
+    const aiUsage = await getUsage(req.userId!, 'ai_delegation', period);
 
     res.json({
       plan: user.plan,
@@ -204,6 +206,15 @@ router.post('/portal', authenticate, async (req: AuthRequest, res: Response, nex
 });
 
 // ─── POST /api/billing/webhook ── Stripe webhook handler ───
+// Stripe redelivers an event until it gets a 2xx, so retries of the same id
+// tend to arrive close together. Remember the ids this process handled
+// recently so such a repeat is acknowledged without a database round trip.
+// This is only a per-process shortcut: after a restart, on another instance
+// or past the last PROCESSED_EVENT_CACHE_MAX events, the stripeEventId lookup
+// is the only guard, and it only knows the latest event on a subscription.
+const PROCESSED_EVENT_CACHE_MAX = 1000;
+const processedEventIds = new BoundedSet<string>(PROCESSED_EVENT_CACHE_MAX);
+
 // NOTE: This route must be mounted BEFORE express.json() body parsing,
 // or use express.raw() for this specific path. We handle raw body here.
 router.post(
@@ -236,10 +247,16 @@ router.post(
       }
 
       // Idempotency guard: skip events we have already processed
+      if (processedEventIds.has(event.id)) {
+        console.log(`[billing] Skipping duplicate event ${event.id}`);
+        return res.json({ received: true });
+      }
       const alreadyProcessed = await prisma.subscription.findFirst({
         where: { stripeEventId: event.id },
+        select: { id: true },
       });
       if (alreadyProcessed) {
+        processedEventIds.add(event.id);
         console.log(`[billing] Skipping duplicate event ${event.id}`);
         return res.json({ received: true });
       }
@@ -270,6 +287,8 @@ router.post(
           break;
       }
 
+      // Only remembered once handled, so a failed attempt is retried in full
+      processedEventIds.add(event.id);
       res.json({ received: true });
     } catch (error) { next(error); }
   }
@@ -277,6 +296,15 @@ router.post(
 
 // ─── Webhook handlers ──────────────────────────────────
 
+// Stripe subscription status → our enum. Unknown statuses fall back to ACTIVE.
+const SUBSCRIPTION_STATUS_MAP: Readonly<Record<string, SubscriptionStatus>> = {
+  active: 'ACTIVE',
+  past_due: 'PAST_DUE',
+  canceled: 'CANCELED',
+  trialing: 'TRIALING',
+  unpaid: 'UNPAID',
+};
+
 async function handleCheckoutCompleted(stripe: Stripe, session: Stripe.Checkout.Session, eventId: string) {
   const userId = session.metadata?.userId;
   if (!userId || !session.subscription) return;
@@ -339,15 +367,7 @@ async function handleSubscriptionUpdated(subscription: Stripe.Subscription, even
   });
   if (!existing) return;
 
-  const statusMap: Record<string, 'ACTIVE' | 'PAST_DUE' | 'CANCELED' | 'TRIALING' | 'UNPAID'> = {
-    active: 'ACTIVE',
-    past_due: 'PAST_DUE',
-    canceled: 'CANCELED',
-    trialing: 'TRIALING',
-    unpaid: 'UNPAID',
-  };
-
-  const status = statusMap[subscription.status] || 'ACTIVE';
+  const status = SUBSCRIPTION_STATUS_MAP[subscription.status] ?? 'ACTIVE';
   const item = subscription.items.data[0];
   const seats = item?.quantity ?? existing.seats;
 
@@ -1,5 +1,6 @@
 import { Router, Request, Response, NextFunction } from 'express';
 import crypto from 'crypto';
+import { Prisma } from '@prisma/client';
 import prisma from '../lib/prisma.js';
 import { authenticate, AuthRequest } from '../middleware/auth.js';
 import { AppError } from '../middleware/errorHandler.js';
@@ -16,6 +17,40 @@ const PRIORITY_MAP: Record<string, number> = {
   LOW: 9,
 };
 
+// Tasks read per query while building a feed
+const FEED_BATCH_SIZE = 500;
+
+const feedTaskSelect = {
+  id: true,
+  title: true,
+  description: true,
+  status: true,
+  priority: true,
+  dueDate: true,
+  project: { select: { name: true } },
+} as const;
+
+/**
+ * Yields the feed's tasks in keyset-paginated batches (dueDate asc, id as
+ * tie-breaker), so only one batch of rows is alive next to the calendar
+ * being built rather than the user's entire task list.
+ */
+async function* feedTaskBatches(where: Prisma.TaskWhereInput) {
+  let cursor: string | undefined;
+  for (;;) {
+    const batch = await prisma.task.findMany({
+      where,
+      select: feedTaskSelect,
+      orderBy: [{ dueDate: 'asc' }, { id: 'asc' }],
+      take: FEED_BATCH_SIZE,
+      ...(cursor !== undefined && { cursor: { id: cursor }, skip: 1 }),
+    });
+    if (batch.length > 0) yield batch;
+    if (batch.length < FEED_BATCH_SIZE) return;
+    cursor = batch[batch.length - 1].id;
+  }
+}
+
 /** Build the public base URL for calendar feed links.
  *  Priority: CALENDAR_PUBLIC_URL env var > request host (with X-Forwarded-Proto support)
  */
@@ -149,7 +184,7 @@ router.get('/feed.ics', async (req: Request, res: Response, next: NextFunction)
     const projectIds = userProjects.map((p) => p.id);
 
     // Fetch tasks with due dates
-    const where: Record<string, unknown> = {
+    const where: Prisma.TaskWhereInput = {
       projectId: { in: projectIds },
       dueDate: { not: null },
     };
@@ -158,14 +193,6 @@ router.get('/feed.ics', async (req: Request, res: Response, next: NextFunction)
       where.status = { not: 'DONE' };
     }
 
-    const tasks = await prisma.task.findMany({
-      where,
-      include: {
-        project: { select: { name: true } },
-      },
-      orderBy: { dueDate: 'asc' },
-    });
-
     // Build iCal calendar
     const calendar = ical({
       name: `${user.name}'s TaskMan`,
@@ -173,22 +200,24 @@ router.get('/feed.ics', async (req: Request, res: Response, next: NextFunction)
       prodId: { company: 'TaskMan', product: 'TaskMan Calendar Feed' },
     });
 
-    for (const task of tasks) {
-      const dueDate = task.dueDate!;
-      const descriptionParts: string[] = [];
-      if (task.description) descriptionParts.push(task.description);
-      descriptionParts.push(`Project: ${task.project.name}`);
-      descriptionParts.push(`Priority: ${task.priority}`);
-      descriptionParts.push(`Status: ${task.status}`);
-
-      calendar.createEvent({
-        id: `task-${task.id}@taskman`,
-        summary: task.title,
-        description: descriptionParts.join('\n'),
-        start: dueDate,
-        allDay: true,
-        priority: PRIORITY_MAP[task.priority] ?? 5,
-      });
+    for await (const batch of feedTaskBatches(where)) {
+      for (const task of batch) {
+        const dueDate = task.dueDate!;
+        const descriptionParts: string[] = [];
+        if (task.description) descriptionParts.push(task.description);
+        descriptionParts.push(`Project: ${task.project.name}`);
+        descriptionParts.push(`Priority: ${task.priority}`);
+        descriptionParts.push(`Status: ${task.status}`);
+
+        calendar.createEvent({
+          id: `task-${task.id}@taskman`,
+          summary: task.title,
+          description: descriptionParts.join('\n'),
+          start: dueDate,
+          allDay: true,
+          priority: PRIORITY_MAP[task.priority] ?? 5,
+        });
+      }
     }
 
     res.setHeader('Content-Type', 'text/calendar; charset=utf-8');
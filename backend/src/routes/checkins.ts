@@ -3,11 +3,15 @@ import { z } from 'zod';
 import prisma from '../lib/prisma.js';
 import { AppError } from '../middleware/errorHandler.js';
 import { authenticate, AuthRequest } from '../middleware/auth.js';
+import { isRecordNotFound } from '../lib/prisma-errors.js';
 import { calculateCheckinStreak } from '../lib/streakUtils.js';
 
 const router = Router();
 router.use(authenticate);
 
+// Check-ins read per query while walking back for the streak
+const STREAK_PAGE_SIZE = 90;
+
 const uuidRegex = /^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$/i;
 function validateUUID(id: string, label: string): void {
   if (!uuidRegex.test(id)) throw new AppError(`Invalid ${label} format`, 400);
@@ -74,15 +78,27 @@ router.get('/streak', async (req: AuthRequest, res: Response, next: NextFunction
   try {
     const userId = req.userId!;
 
-    const checkins = await prisma.dailyCheckin.findMany({
-      where: { userId },
-      orderBy: { date: 'desc' },
-      select: { date: true },
-    });
+    // Dates arrive newest first and the streak ends at the first gap, so read
+    // a page at a time and stop once a page contains the break instead of
+    // loading the user's whole check-in history.
+    const dates: string[] = [];
+    let streak = 0;
+    let before: Date | undefined;
+    for (;;) {
+      const page = await prisma.dailyCheckin.findMany({
+        where: { userId, ...(before && { date: { lt: before } }) },
+        orderBy: { date: 'desc' },
+        select: { date: true },
+        take: STREAK_PAGE_SIZE,
+      });
+      for (const c of page) dates.push(c.date.toISOString().slice(0, 10));
+
+      streak = calculateCheckinStreak(dates);
+      if (page.length < STREAK_PAGE_SIZE || streak < dates.length) break;
+      before = page[page.length - 1].date;
+    }
 
-    const dates = checkins.map((c) => c.date.toISOString().slice(0, 10));
-    const streak = calculateCheckinStreak(dates);
-    const lastCheckin = dates.length > 0 ? dates[0] ?? null : null;
+    const lastCheckin = dates[0] ?? null;
     res.json({ streak, lastCheckin });
   } catch (error) {
     next(error);
@@ -96,6 +112,8 @@ router.get('/', async (req: AuthRequest, res: Response, next: NextFunction) => {
     const { startDate, endDate } = req.query as { startDate?: string; endDate?: string };
     const limit = Math.max(1, Math.min(100, parseInt(String(req.query.limit ?? '20'), 10) || 20));
     const offset = Math.max(0, parseInt(String(req.query.offset ?? '0'), 10) || 0);
+    const cursor = req.query.cursor ? new Date(String(req.query.cursor)) : undefined;
+    if (cursor && isNaN(cursor.getTime())) throw new AppError('Invalid cursor', 400);
 
     const where: {
       userId: string;
@@ -108,17 +126,26 @@ router.get('/', async (req: AuthRequest, res: Response, next: NextFunction) => {
       if (endDate) where.date.lte = new Date(endDate);
     }
 
+    // Keyset pagination: (userId, date) is unique, so resuming from "date < cursor"
+    // walks the index directly instead of scanning and discarding OFFSET rows.
+    // ?offset is still honoured for callers that don't pass a cursor.
+    const pageWhere = cursor ? { ...where, date: { ...where.date, lt: cursor } } : where;
+
     const [checkins, total] = await Promise.all([
       prisma.dailyCheckin.findMany({
-        where,
+        where: pageWhere,
         orderBy: { date: 'desc' },
         take: limit,
-        skip: offset,
+        ...(!cursor && { skip: offset }),
       }),
       prisma.dailyCheckin.count({ where }),
     ]);
 
-    res.json({ checkins, total });
+    const nextCursor = checkins.length === limit
+      ? checkins[checkins.length - 1].date.toISOString().slice(0, 10)
+      : null;
+
+    res.json({ checkins, total, nextCursor });
   } catch (error) {
     next(error);
   }
@@ -141,10 +168,15 @@ router.get('/:id', async (req: AuthRequest, res: Response, next: NextFunction) =
 router.delete('/:id', async (req: AuthRequest, res: Response, next: NextFunction) => {
   try {
     validateUUID(req.params.id, 'check-in ID');
-    const checkin = await prisma.dailyCheckin.findUnique({ where: { id: req.params.id } });
-    if (!checkin) throw new AppError('Check-in not found', 404);
-    if (checkin.userId !== req.userId) throw new AppError('Not authorized', 403);
-    await prisma.dailyCheckin.delete({ where: { id: req.params.id } });
+    // Owner-scoped delete in one statement; only a miss pays for the 404/403 lookup
+    await prisma.dailyCheckin.delete({
+      where: { id: req.params.id, userId: req.userId! },
+      select: { id: true },
+    }).catch(async (err: unknown) => {
+      if (!isRecordNotFound(err)) throw err;
+      const checkin = await prisma.dailyCheckin.findUnique({ where: { id: req.params.id }, select: { id: true } });
+      throw checkin ? new AppError('Not authorized', 403) : new AppError('Check-in not found', 404);
+    });
     res.status(204).send();
   } catch (error) {
     next(error);
@@ -2,6 +2,7 @@ import { Router, Response, NextFunction } from 'express';
 import { z } from 'zod';
 import prisma from '../lib/prisma.js';
 import { AppError } from '../middleware/errorHandler.js';
+import { isProjectAdmin } from '../middleware/rbac.js';
 import { authenticate, AuthRequest } from '../middleware/auth.js';
 import { logCommentAction } from '../lib/activityLog.js';
 import { parseMentions, resolveMentions, notifyMentions } from '../lib/mentions.js';
@@ -21,8 +22,12 @@ const DANGEROUS_PATTERNS = [
   /<embed/i,
 ];
 
+// Compiled once into a single case-insensitive alternation so a comment body
+// (up to 50k chars) is scanned in one pass rather than once per pattern
+const DANGEROUS_CONTENT = new RegExp(DANGEROUS_PATTERNS.map((p) => p.source).join('|'), 'i');
+
 function isSafeContent(val: string): boolean {
-  return !DANGEROUS_PATTERNS.some((p) => p.test(val));
+  return !DANGEROUS_CONTENT.test(val);
 }
 
 const createCommentSchema = z.object({
@@ -59,6 +64,29 @@ const authorSelect = {
   avatarUrl: true,
 } as const;
 
+/**
+ * Notifies every project member @mentioned in a new comment. Takes the author
+ * already loaded with the comment rather than looking the user up again.
+ */
+async function notifyCommentMentions(
+  content: string,
+  author: { id: string; name: string },
+  task: { id: string; title: string; projectId: string },
+) {
+  const mentionNames = parseMentions(content);
+  if (mentionNames.length === 0) return;
+
+  const mentionedUsers = await resolveMentions(mentionNames, task.projectId);
+  await notifyMentions(
+    mentionedUsers,
+    author.id,
+    author.name || 'Someone',
+    task.id,
+    task.title,
+    task.projectId,
+  );
+}
+
 async function getProjectMembership(userId: string, projectId: string) {
   return prisma.projectMember.findUnique({
     where: { projectId_userId: { projectId, userId } },
@@ -158,26 +186,13 @@ router.post('/tasks/:taskId/comments', authenticate, async (req: AuthRequest, re
       },
     });
 
-    // Log activity
-    await logCommentAction('COMMENT_ADDED', req.params.taskId, req.userId!);
-
-    // Process @mentions
-    const mentionNames = parseMentions(data.content);
-    if (mentionNames.length > 0) {
-      const author = await prisma.user.findUnique({
-        where: { id: req.userId! },
-        select: { name: true },
-      });
-      const mentionedUsers = await resolveMentions(mentionNames, task.projectId);
-      await notifyMentions(
-        mentionedUsers,
-        req.userId!,
-        author?.name || 'Someone',
-        task.id,
-        task.title,
-        task.projectId,
-      );
-    }
+    // Activity log, @mention notifications and webhook dispatch are independent
+    // follow-ups, so their round trips run side by side instead of back to back
+    await Promise.all([
+      logCommentAction('COMMENT_ADDED', req.params.taskId, req.userId!),
+      notifyCommentMentions(data.content, comment.author, task),
+      dispatchWebhooks('comment.added', { comment, taskId: req.params.taskId }, req.userId!),
+    ]);
 
     // Emit socket events
     const io = getIO();
@@ -186,8 +201,6 @@ router.post('/tasks/:taskId/comments', authenticate, async (req: AuthRequest, re
       io.to(`task:${req.params.taskId}`).emit('activity:new', { taskId: req.params.taskId });
     }
 
-    await dispatchWebhooks('comment.added', { comment, taskId: req.params.taskId }, req.userId!);
-
     res.status(201).json(comment);
   } catch (error) {
     next(error);
@@ -218,7 +231,7 @@ router.put('/comments/:id', authenticate, async (req: AuthRequest, res: Response
 
     // Only author or OWNER/ADMIN can edit
     const isAuthor = comment.authorId === req.userId;
-    const isAdmin = ['OWNER', 'ADMIN'].includes(membership.role);
+    const isAdmin = isProjectAdmin(membership.role);
     if (!isAuthor && !isAdmin) {
       throw new AppError('You cannot edit this comment', 403);
     }
@@ -271,7 +284,7 @@ router.delete('/comments/:id', authenticate, async (req: AuthRequest, res: Respo
 
     // Only author or OWNER/ADMIN can delete
     const isAuthor = comment.authorId === req.userId;
-    const isAdmin = ['OWNER', 'ADMIN'].includes(membership.role);
+    const isAdmin = isProjectAdmin(membership.role);
     if (!isAuthor && !isAdmin) {
       throw new AppError('You cannot delete this comment', 403);
     }
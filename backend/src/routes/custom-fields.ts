@@ -2,7 +2,9 @@ import { Router, Response, NextFunction } from 'express';
 import { z } from 'zod';
 import prisma from '../lib/prisma.js';
 import { AppError } from '../middleware/errorHandler.js';
+import { isProjectAdmin } from '../middleware/rbac.js';
 import { authenticate, AuthRequest } from '../middleware/auth.js';
+import { distinct } from '../lib/batching.js';
 
 const router = Router();
 router.use(authenticate);
@@ -88,7 +90,7 @@ router.post('/', async (req: AuthRequest, res: Response, next: NextFunction) =>
   try {
     const data = createFieldSchema.parse(req.body);
     const membership = await getProjectMembership(req.userId!, data.projectId);
-    if (!membership || !['OWNER', 'ADMIN'].includes(membership.role)) {
+    if (!membership || !isProjectAdmin(membership.role)) {
       throw new AppError('Only OWNER or ADMIN can create custom fields', 403);
     }
 
@@ -122,7 +124,7 @@ router.put('/:id', async (req: AuthRequest, res: Response, next: NextFunction) =
     if (!field) throw new AppError('Custom field not found', 404);
 
     const membership = await getProjectMembership(req.userId!, field.projectId);
-    if (!membership || !['OWNER', 'ADMIN'].includes(membership.role)) {
+    if (!membership || !isProjectAdmin(membership.role)) {
       throw new AppError('Only OWNER or ADMIN can update custom fields', 403);
     }
 
@@ -150,7 +152,7 @@ router.delete('/:id', async (req: AuthRequest, res: Response, next: NextFunction
     if (!field) throw new AppError('Custom field not found', 404);
 
     const membership = await getProjectMembership(req.userId!, field.projectId);
-    if (!membership || !['OWNER', 'ADMIN'].includes(membership.role)) {
+    if (!membership || !isProjectAdmin(membership.role)) {
       throw new AppError('Only OWNER or ADMIN can delete custom fields', 403);
     }
 
@@ -197,16 +199,21 @@ router.put('/task/:taskId', async (req: AuthRequest, res: Response, next: NextFu
       throw new AppError('Cannot modify this task', 403);
     }
 
-    // Validate all fields belong to the project
-    for (const { fieldId } of fields) {
-      const fieldDef = await prisma.customFieldDefinition.findUnique({ where: { id: fieldId } });
-      if (!fieldDef || fieldDef.projectId !== task.projectId) {
-        throw new AppError(`Field ${fieldId} not found in this project`, 404);
-      }
+    // Validate all fields belong to the project (one IN query instead of one lookup per field)
+    const fieldIds = distinct(fields, (f) => f.fieldId);
+    const fieldDefs = await prisma.customFieldDefinition.findMany({
+      where: { id: { in: fieldIds }, projectId: task.projectId },
+      select: { id: true },
+    });
+    const knownFieldIds = new Set(fieldDefs.map((f) => f.id));
+    const missingFieldId = fieldIds.find((id) => !knownFieldIds.has(id));
+    if (missingFieldId) {
+      throw new AppError(`Field ${missingFieldId} not found in this project`, 404);
     }
 
-    // Upsert all values
-    const results = await Promise.all(
+    // Upsert all values in one transaction: a single commit for the batch, and
+    // a failure part-way through no longer leaves the task half-updated
+    const results = await prisma.$transaction(
       fields.map(({ fieldId, value }) =>
         prisma.customFieldValue.upsert({
           where: { taskId_fieldId: { taskId: req.params.taskId, fieldId } },
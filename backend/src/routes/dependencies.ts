@@ -2,9 +2,11 @@ import { Router, Response, NextFunction } from 'express';
 import { z } from 'zod';
 import prisma from '../lib/prisma.js';
 import { AppError } from '../middleware/errorHandler.js';
+import { isProjectAdmin } from '../middleware/rbac.js';
 import { authenticate, AuthRequest } from '../middleware/auth.js';
 import { logDependencyAdded, logDependencyRemoved } from '../lib/activityLog.js';
 import { getIO } from '../lib/socket.js';
+import { isUniqueViolation } from '../lib/prisma-errors.js';
 
 const router = Router();
 
@@ -37,9 +39,8 @@ function canModifyTask(
   userId: string
 ): boolean {
   if (!membership) return false;
-  if (['OWNER', 'ADMIN'].includes(membership.role)) return true;
-  if (membership.role === 'MEMBER' && task.creatorId === userId) return true;
-  return false;
+  // Admins pass on the role alone; only MEMBERs need the creator comparison
+  return isProjectAdmin(membership.role) || (membership.role === 'MEMBER' && task.creatorId === userId);
 }
 
 /**
@@ -62,26 +63,30 @@ async function wouldCreateCycle(blockingId: string, blockedId: string): Promise<
   // In schema terms: blockedId will have dependsOnId=blockingId
   // We check if blockingId has a chain that leads to blockedId
 
-  const visited = new Set<string>();
-  const stack = [blockedId]; // Start searching from the task that is being inhibited
+  if (blockedId === blockingId) return true;
 
-  while (stack.length > 0) {
-    const current = stack.pop()!;
-    if (current === blockingId) return true; // Found path to the proposed blocker
-    if (visited.has(current)) continue;
-    visited.add(current);
+  // Walk level by level from the task that is being inhibited, expanding the
+  // whole frontier with one query per level instead of one query per task.
+  const visited = new Set<string>([blockedId]);
+  let frontier = [blockedId];
 
-    // Find what 'current' blocks (tasks that depend on current)
-    // In schema: find TaskDependency where dependsOnId = current
-    // Those taskIds are blocked by current
+  while (frontier.length > 0) {
+    // Find what the frontier blocks (tasks that depend on it)
+    // In schema: find TaskDependency where dependsOnId is in the frontier
+    // Those taskIds are blocked by the frontier
     const downstream = await prisma.taskDependency.findMany({
-      where: { dependsOnId: current },
+      where: { dependsOnId: { in: frontier } },
       select: { taskId: true },
     });
 
+    const nextFrontier: string[] = [];
     for (const dep of downstream) {
-      stack.push(dep.taskId);
+      if (dep.taskId === blockingId) return true; // Found path to the proposed blocker
+      if (visited.has(dep.taskId)) continue;
+      visited.add(dep.taskId);
+      nextFrontier.push(dep.taskId);
     }
+    frontier = nextFrontier;
   }
 
   return false;
@@ -138,20 +143,13 @@ router.post('/tasks/:id/dependencies', authenticate, async (req: AuthRequest, re
       throw new AppError('You cannot modify this task', 403);
     }
 
-    // Check for duplicate
-    const existing = await prisma.taskDependency.findUnique({
-      where: { taskId_dependsOnId: { taskId: blockedId, dependsOnId: blockingId } },
-    });
-    if (existing) {
-      throw new AppError('This dependency already exists', 409);
-    }
-
     // Cycle detection
     const hasCycle = await wouldCreateCycle(blockingId, blockedId);
     if (hasCycle) {
       throw new AppError('Adding this dependency would create a circular dependency', 400);
     }
 
+    // The (taskId, dependsOnId) unique constraint doubles as the duplicate check
     const dependency = await prisma.taskDependency.create({
       data: {
         taskId: blockedId,
@@ -160,6 +158,9 @@ router.post('/tasks/:id/dependencies', authenticate, async (req: AuthRequest, re
       include: {
         dependsOn: { select: taskSelect }, // Return the blocking task details
       },
+    }).catch((err) => {
+      if (isUniqueViolation(err)) throw new AppError('This dependency already exists', 409);
+      throw err;
     });
 
     // Log activity
@@ -307,13 +308,14 @@ router.get('/projects/:id/dependencies', authenticate, async (req: AuthRequest,
       },
     });
 
-    const taskIds = new Set(tasks.map(t => t.id));
+    // Primary keys are already unique, so one id array serves both IN lists
+    const taskIds = tasks.map(t => t.id);
 
     // Get all dependencies where both tasks are in this project
     const dependencies = await prisma.taskDependency.findMany({
       where: {
-        taskId: { in: [...taskIds] },
-        dependsOnId: { in: [...taskIds] },
+        taskId: { in: taskIds },
+        dependsOnId: { in: taskIds },
       },
       select: {
         id: true,
@@ -407,9 +409,9 @@ router.get('/projects/:id/critical-path', authenticate, async (req: AuthRequest,
       }
     }
 
-    // Process queue
-    while (queue.length > 0) {
-      const current = queue.shift()!;
+    // Process queue (read via a head index; shift() would re-index the array each time)
+    for (let head = 0; head < queue.length; head++) {
+      const current = queue[head];
       const currentDist = distance.get(current) || 1;
 
       for (const neighbor of graph.get(current) || []) {
@@ -453,10 +455,11 @@ router.get('/projects/:id/critical-path', authenticate, async (req: AuthRequest,
     while (current) {
       const task = taskMap.get(current);
       if (task) {
-        path.unshift(task);
+        path.push(task);
       }
       current = parent.get(current) || null;
     }
+    path.reverse();
 
     res.json({
       path,
@@ -3,6 +3,7 @@ import { z } from 'zod';
 import prisma from '../lib/prisma.js';
 import { AppError } from '../middleware/errorHandler.js';
 import { authenticate, AuthRequest } from '../middleware/auth.js';
+import { isRecordNotFound } from '../lib/prisma-errors.js';
 
 const router = Router();
 router.use(authenticate);
@@ -76,13 +77,7 @@ router.post('/', async (req: AuthRequest, res: Response, next: NextFunction) =>
     const data = createDomainSchema.parse(req.body);
 
     const domain = await prisma.domain.create({
-      data: {
-        userId,
-        name: data.name,
-        ...(data.color !== undefined && { color: data.color }),
-        ...(data.icon !== undefined && { icon: data.icon }),
-        ...(data.sortOrder !== undefined && { sortOrder: data.sortOrder }),
-      },
+      data: { ...data, userId },
       include: { _count: { select: { tasks: true } } },
     });
 
@@ -97,19 +92,15 @@ router.put('/:id', async (req: AuthRequest, res: Response, next: NextFunction) =
     const userId = req.userId!;
     const data = updateDomainSchema.parse(req.body);
 
-    const existing = await prisma.domain.findUnique({ where: { id: req.params.id } });
-    if (!existing) throw new AppError('Domain not found', 404);
-    if (existing.userId !== userId) throw new AppError('Forbidden', 403);
-
+    // Owner-scoped conditional update; a miss falls back to a lookup for 404 vs 403
     const domain = await prisma.domain.update({
-      where: { id: req.params.id },
-      data: {
-        ...(data.name !== undefined && { name: data.name }),
-        ...(data.color !== undefined && { color: data.color }),
-        ...(data.icon !== undefined && { icon: data.icon }),
-        ...(data.sortOrder !== undefined && { sortOrder: data.sortOrder }),
-      },
+      where: { id: req.params.id, userId },
+      data,
       include: { _count: { select: { tasks: true } } },
+    }).catch(async (err: unknown) => {
+      if (!isRecordNotFound(err)) throw err;
+      const existing = await prisma.domain.findUnique({ where: { id: req.params.id }, select: { id: true } });
+      throw existing ? new AppError('Forbidden', 403) : new AppError('Domain not found', 404);
     });
 
     res.json(domain);
@@ -122,11 +113,12 @@ router.delete('/:id', async (req: AuthRequest, res: Response, next: NextFunction
     validateUUID(req.params.id, 'domain ID');
     const userId = req.userId!;
 
-    const existing = await prisma.domain.findUnique({ where: { id: req.params.id } });
-    if (!existing) throw new AppError('Domain not found', 404);
-    if (existing.userId !== userId) throw new AppError('Forbidden', 403);
-
-    await prisma.domain.delete({ where: { id: req.params.id } });
+    // Owner-scoped delete in one statement; only a miss pays for the 404/403 lookup
+    await prisma.domain.delete({ where: { id: req.params.id, userId } }).catch(async (err: unknown) => {
+      if (!isRecordNotFound(err)) throw err;
+      const existing = await prisma.domain.findUnique({ where: { id: req.params.id }, select: { id: true } });
+      throw existing ? new AppError('Forbidden', 403) : new AppError('Domain not found', 404);
+    });
     res.status(204).send();
   } catch (error) { next(error); }
 });
@@ -1,4 +1,5 @@
 import { Router, Response, NextFunction } from 'express';
+import { Prisma } from '@prisma/client';
 import { z } from 'zod';
 import prisma from '../lib/prisma.js';
 import { authenticate, AuthRequest } from '../middleware/auth.js';
@@ -13,41 +14,109 @@ const exportQuerySchema = z.object({
 
 // --- Helpers ---
 
+// One scan for any character that forces quoting, instead of three includes()
+const CSV_NEEDS_QUOTING = /[",\n]/;
+
 function escapeCSVField(value: string): string {
-  if (value.includes(',') || value.includes('"') || value.includes('\n')) {
+  if (CSV_NEEDS_QUOTING.test(value)) {
     return `"${value.replace(/"/g, '""')}"`;
   }
   return value;
 }
 
-function tasksToCSV(tasks: Array<Record<string, unknown>>): string {
-  const headers = [
-    'Title',
-    'Description',
-    'Status',
-    'Priority',
-    'Due Date',
-    'Project',
-    'Assignee',
-    'Creator',
-    'Created At',
-    'Updated At',
-  ];
-
-  const rows = tasks.map((task) => [
-    escapeCSVField(String(task.title || '')),
-    escapeCSVField(String(task.description || '')),
-    escapeCSVField(String(task.status || '')),
-    escapeCSVField(String(task.priority || '')),
-    escapeCSVField(task.dueDate ? new Date(task.dueDate as string).toISOString().split('T')[0] : ''),
-    escapeCSVField(String((task.project as { name?: string })?.name || '')),
-    escapeCSVField(String((task.assignee as { name?: string })?.name || '')),
-    escapeCSVField(String((task.creator as { name?: string })?.name || '')),
-    escapeCSVField(new Date(task.createdAt as string).toISOString()),
-    escapeCSVField(new Date(task.updatedAt as string).toISOString()),
-  ]);
-
-  return [headers.join(','), ...rows.map((r) => r.join(','))].join('\n');
+const CSV_HEADER = [
+  'Title',
+  'Description',
+  'Status',
+  'Priority',
+  'Due Date',
+  'Project',
+  'Assignee',
+  'Creator',
+  'Created At',
+  'Updated At',
+].join(',');
+
+// Rows fetched per query while streaming an export
+const EXPORT_BATCH_SIZE = 500;
+
+// Only the columns an export writes (plus id for the keyset cursor)
+const exportTaskSelect = {
+  id: true,
+  title: true,
+  description: true,
+  status: true,
+  priority: true,
+  dueDate: true,
+  createdAt: true,
+  updatedAt: true,
+  project: { select: { name: true } },
+  assignee: { select: { name: true } },
+  creator: { select: { name: true } },
+} as const;
+
+type ExportTask = Prisma.TaskGetPayload<{ select: typeof exportTaskSelect }>;
+
+function fetchTaskBatch(where: Prisma.TaskWhereInput, cursor?: string) {
+  return prisma.task.findMany({
+    where,
+    select: exportTaskSelect,
+    orderBy: [{ createdAt: 'desc' }, { id: 'asc' }],
+    take: EXPORT_BATCH_SIZE,
+    ...(cursor !== undefined && { cursor: { id: cursor }, skip: 1 }),
+  });
+}
+
+/**
+ * Yields the matching tasks in keyset-paginated batches (createdAt desc, id as
+ * tie-breaker), so an export never holds more than one batch in memory.
+ * The next batch is only requested once the consumer resumes the generator,
+ * i.e. after the previous batch was accepted by the socket. That query still
+ * overlaps with the kernel sending the buffered bytes, and a consumer that
+ * stops (client gone) leaves no query in flight.
+ */
+async function* taskBatches(where: Prisma.TaskWhereInput) {
+  let cursor: string | undefined;
+  for (;;) {
+    const batch = await fetchTaskBatch(where, cursor);
+    if (batch.length > 0) yield batch;
+    if (batch.length < EXPORT_BATCH_SIZE) return;
+    cursor = batch[batch.length - 1].id;
+  }
+}
+
+/**
+ * Writes one chunk of a streamed export. When the socket buffer is full it
+ * waits for 'drain', so a slow client is never queued more than it accepts.
+ * Also settles if the connection closes while waiting.
+ */
+function writeChunk(res: Response, chunk: string): Promise<void> {
+  if (res.write(chunk)) return Promise.resolve();
+  return new Promise((resolve) => {
+    const settle = () => {
+      res.off('drain', settle);
+      res.off('close', settle);
+      resolve();
+    };
+    res.on('drain', settle);
+    res.on('close', settle);
+  });
+}
+
+// Each row is joined as it is built; Prisma already hands back Date objects
+function tasksToCSVRows(tasks: ExportTask[]): string {
+  return tasks.map((task) => [
+    escapeCSVField(task.title),
+    escapeCSVField(task.description || ''),
+    escapeCSVField(task.status),
+    escapeCSVField(task.priority),
+    escapeCSVField(task.dueDate ? task.dueDate.toISOString().split('T')[0] : ''),
+    escapeCSVField(task.project.name),
+    escapeCSVField(task.assignee?.name || ''),
+    escapeCSVField(task.creator.name),
+    escapeCSVField(task.createdAt.toISOString()),
+    escapeCSVField(task.updatedAt.toISOString()),
+  ].join(',')).join('\n');
 }
 
 // GET /api/export/tasks - Export tasks as CSV or JSON
@@ -68,7 +137,7 @@ router.get('/tasks', async (req: AuthRequest, res: Response, next: NextFunction)
 
     const projectIds = userProjects.map((p) => p.id);
 
-    const where: Record<string, unknown> = {
+    const where: Prisma.TaskWhereInput = {
       projectId: { in: projectIds },
     };
 
@@ -81,42 +150,55 @@ router.get('/tasks', async (req: AuthRequest, res: Response, next: NextFunction)
       where.projectId = query.projectId;
     }
 
-    const tasks = await prisma.task.findMany({
-      where,
-      include: {
-        project: { select: { id: true, name: true, color: true } },
-        assignee: { select: { id: true, name: true } },
-        creator: { select: { id: true, name: true } },
-      },
-      orderBy: { createdAt: 'desc' },
-    });
+    // Both formats are streamed batch by batch rather than built in memory.
+    // 'close' fires once the response finishes or the client goes away;
+    // either way no further batches are read.
+    let closed = false;
+    res.on('close', () => { closed = true; });
 
     if (query.format === 'json') {
-      const exportData = tasks.map((t) => ({
-        title: t.title,
-        description: t.description,
-        status: t.status,
-        priority: t.priority,
-        dueDate: t.dueDate,
-        project: t.project.name,
-        assignee: t.assignee?.name || null,
-        creator: t.creator.name,
-        createdAt: t.createdAt,
-        updatedAt: t.updatedAt,
-      }));
-
-      res.setHeader('Content-Type', 'application/json');
+      res.setHeader('Content-Type', 'application/json; charset=utf-8');
       res.setHeader('Content-Disposition', 'attachment; filename="tasks-export.json"');
-      res.json(exportData);
+      res.write('[');
+      let first = true;
+      for await (const batch of taskBatches(where)) {
+        const items = batch.map((t) => JSON.stringify({
+          title: t.title,
+          description: t.description,
+          status: t.status,
+          priority: t.priority,
+          dueDate: t.dueDate,
+          project: t.project.name,
+          assignee: t.assignee?.name || null,
+          creator: t.creator.name,
+          createdAt: t.createdAt,
+          updatedAt: t.updatedAt,
+        }));
+        await writeChunk(res, (first ? '' : ',') + items.join(','));
+        first = false;
+        if (closed) break;
+      }
+      if (!closed) res.end(']');
       return;
     }
 
     // CSV format
-    const csv = tasksToCSV(tasks as unknown as Array<Record<string, unknown>>);
     res.setHeader('Content-Type', 'text/csv; charset=utf-8');
     res.setHeader('Content-Disposition', 'attachment; filename="tasks-export.csv"');
-    res.send(csv);
+    res.write(CSV_HEADER);
+    for await (const batch of taskBatches(where)) {
+      await writeChunk(res, '\n' + tasksToCSVRows(batch));
+      if (closed) break;
+    }
+    if (!closed) res.end();
   } catch (error) {
+    if (res.headersSent) {
+      // Part of a 200 body is already out; ending it normally would hand the
+      // client a truncated file that looks complete, so drop the connection
+      console.error('[export] Export failed mid-stream:', error);
+      res.destroy();
+      return;
+    }
     next(error);
   }
 });
@@ -1,9 +1,11 @@
 import { Router, Response, NextFunction } from 'express';
+import { randomUUID } from 'crypto';
 import { z } from 'zod';
 import prisma from '../lib/prisma.js';
 import { authenticate, AuthRequest } from '../middleware/auth.js';
 import { AppError } from '../middleware/errorHandler.js';
 import { logTaskCreated } from '../lib/activityLog.js';
+import { isUniqueViolation } from '../lib/prisma-errors.js';
 
 const router = Router();
 
@@ -81,13 +83,21 @@ router.post('/milestones', authenticate, async (req: AuthRequest, res: Response,
   const allTagNames = [...new Set(body.milestones.flatMap((m) => m.tags))];
   const tagMap = new Map<string, string>(); // lowercase name → tag id
 
-  for (const tagName of allTagNames) {
-    const tag = await prisma.tag.upsert({
-      where: { projectId_name: { projectId: project.id, name: tagName } },
-      update: {},
-      create: { projectId: project.id, name: tagName },
+  if (allTagNames.length > 0) {
+    // One multi-row INSERT (existing tags skipped) + one read-back, instead of an upsert per tag
+    await prisma.tag.createMany({
+      data: allTagNames.map((name) => ({ projectId: project!.id, name })),
+      skipDuplicates: true,
     });
-    tagMap.set(tagName.toLowerCase(), tag.id);
+    const tags = await prisma.tag.findMany({
+      where: { projectId: project.id, name: { in: allTagNames } },
+      select: { id: true, name: true },
+    });
+    const tagIdByName = new Map(tags.map((t) => [t.name, t.id]));
+    for (const tagName of allTagNames) {
+      const id = tagIdByName.get(tagName);
+      if (id) tagMap.set(tagName.toLowerCase(), id);
+    }
   }
 
   // ---- Match domains ----
@@ -120,28 +130,32 @@ router.post('/milestones', authenticate, async (req: AuthRequest, res: Response,
     return { milestone: m, tagIds, domainIds };
   });
 
-  const createdTasks = await prisma.$transaction(
-    taskCreateInputs.map(({ milestone, tagIds, domainIds }) =>
-      prisma.task.create({
-        data: {
-          title: milestone.title,
-          description: milestone.description ?? null,
-          priority: milestone.priority ?? 'MEDIUM',
-          status: milestone.status ?? 'TODO',
-          dueDate: milestone.dueDate ? new Date(milestone.dueDate) : null,
-          projectId: project!.id,
-          creatorId: userId,
-          tags: tagIds.length > 0
-            ? { create: tagIds.map((tagId) => ({ tagId })) }
-            : undefined,
-          domains: domainIds.length > 0
-            ? { create: domainIds.map((domainId) => ({ domainId })) }
-            : undefined,
-        },
-        select: { id: true, title: true, status: true, priority: true },
-      }),
-    ),
+  // Ids are generated up front so the tasks and their tag/domain links can be
+  // written as three multi-row INSERTs instead of one nested create per task
+  const taskRows = taskCreateInputs.map(({ milestone }) => ({
+    id: randomUUID(),
+    title: milestone.title,
+    description: milestone.description ?? null,
+    priority: milestone.priority ?? ('MEDIUM' as const),
+    status: milestone.status ?? ('TODO' as const),
+    dueDate: milestone.dueDate ? new Date(milestone.dueDate) : null,
+    projectId: project!.id,
+    creatorId: userId,
+  }));
+  const taskTagRows = taskCreateInputs.flatMap(({ tagIds }, i) =>
+    tagIds.map((tagId) => ({ taskId: taskRows[i].id, tagId })),
   );
+  const taskDomainRows = taskCreateInputs.flatMap(({ domainIds }, i) =>
+    domainIds.map((domainId) => ({ taskId: taskRows[i].id, domainId })),
+  );
+
+  await prisma.$transaction([
+    prisma.task.createMany({ data: taskRows }),
+    prisma.taskTag.createMany({ data: taskTagRows, skipDuplicates: true }),
+    prisma.taskDomain.createMany({ data: taskDomainRows, skipDuplicates: true }),
+  ]);
+
+  const createdTasks = taskRows.map(({ id, title, status, priority }) => ({ id, title, status, priority }));
 
   // ---- Wire dependencies (post-transaction) ----
   const titleToId = new Map<string, string>();
@@ -149,6 +163,8 @@ router.post('/milestones', authenticate, async (req: AuthRequest, res: Response,
     titleToId.set(t.title.toLowerCase(), t.id);
   }
 
+  const dependencyRows: { taskId: string; dependsOnId: string }[] = [];
+  const dependencyLabels: string[] = []; // parallel to dependencyRows, for warnings
   for (let i = 0; i < body.milestones.length; i++) {
     const deps = body.milestones[i].dependsOn;
     if (deps.length === 0) continue;
@@ -164,12 +180,26 @@ router.post('/milestones', authenticate, async (req: AuthRequest, res: Response,
         warnings.push(`Self-dependency skipped for "${createdTasks[i].title}"`);
         continue;
       }
-      try {
-        await prisma.taskDependency.create({
-          data: { taskId, dependsOnId: depId },
-        });
-      } catch {
-        warnings.push(`Failed to create dependency "${depTitle}" → "${createdTasks[i].title}"`);
+      dependencyRows.push({ taskId, dependsOnId: depId });
+      dependencyLabels.push(`"${depTitle}" → "${createdTasks[i].title}"`);
+    }
+  }
+
+  // One INSERT for the whole batch; a dependency listed twice is a no-op.
+  // If the batch fails for any other reason, retry row by row so only the
+  // offending dependencies are dropped, each with its own warning.
+  if (dependencyRows.length > 0) {
+    try {
+      await prisma.taskDependency.createMany({ data: dependencyRows, skipDuplicates: true });
+    } catch {
+      for (let i = 0; i < dependencyRows.length; i++) {
+        try {
+          await prisma.taskDependency.create({ data: dependencyRows[i] });
+        } catch (err) {
+          // A repeated edge already exists; that is what skipDuplicates did above
+          if (isUniqueViolation(err)) continue;
+          warnings.push(`Failed to create dependency ${dependencyLabels[i]}`);
+        }
       }
     }
   }
@@ -3,6 +3,8 @@ import { z } from 'zod';
 import prisma from '../lib/prisma.js';
 import { AppError } from '../middleware/errorHandler.js';
 import { authenticate, AuthRequest } from '../middleware/auth.js';
+import { isRecordNotFound } from '../lib/prisma-errors.js';
+import { parseCursor } from '../lib/task-helpers.js';
 
 const router = Router();
 router.use(authenticate);
@@ -20,7 +22,7 @@ router.get('/', async (req: AuthRequest, res: Response, next: NextFunction) => {
   try {
     const unreadOnly = req.query.unreadOnly === 'true';
     const hasCursorParam = 'cursor' in req.query;
-    const cursorId = (req.query.cursor as string) || undefined;
+    const cursorId = parseCursor(req.query.cursor);
     const limit = Math.min(100, Math.max(1, parseInt(req.query.limit as string, 10) || 20));
 
     // eslint-disable-next-line @typescript-eslint/no-explicit-any
@@ -101,14 +103,15 @@ router.patch('/mark-read', async (req: AuthRequest, res: Response, next: NextFun
   try {
     const data = markReadSchema.parse(req.body);
 
-    // Verify all notifications belong to the user
-    const notifications = await prisma.notification.findMany({
+    // Verify all notifications belong to the user: a single LIMIT 1 probe for
+    // any foreign row, instead of loading every requested notification
+    const unauthorized = await prisma.notification.findFirst({
       where: {
         id: { in: data.notificationIds },
+        userId: { not: req.userId! },
       },
+      select: { id: true },
     });
-
-    const unauthorized = notifications.some(n => n.userId !== req.userId);
     if (unauthorized) {
       throw new AppError('Unauthorized to modify these notifications', 403);
     }
@@ -151,20 +154,19 @@ router.patch('/mark-all-read', async (req: AuthRequest, res: Response, next: Nex
 // DELETE /api/notifications/:id - Delete a notification
 router.delete('/:id', async (req: AuthRequest, res: Response, next: NextFunction) => {
   try {
-    const notification = await prisma.notification.findUnique({
-      where: { id: req.params.id },
-    });
-
-    if (!notification) {
-      throw new AppError('Notification not found', 404);
-    }
-
-    if (notification.userId !== req.userId) {
-      throw new AppError('Unauthorized', 403);
-    }
-
+    // Owner-scoped delete in one round trip; a miss falls back to a lookup for 404 vs 403
     await prisma.notification.delete({
-      where: { id: req.params.id },
+      where: { id: req.params.id, userId: req.userId! },
+      select: { id: true },
+    }).catch(async (err: unknown) => {
+      if (!isRecordNotFound(err)) throw err;
+      const notification = await prisma.notification.findUnique({
+        where: { id: req.params.id },
+        select: { id: true },
+      });
+      throw notification
+        ? new AppError('Unauthorized', 403)
+        : new AppError('Notification not found', 404);
     });
 
     res.status(204).send();
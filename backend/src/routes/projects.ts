@@ -2,9 +2,11 @@ import { Router, Response, NextFunction } from 'express';
 import { z } from 'zod';
 import prisma from '../lib/prisma.js';
 import { AppError } from '../middleware/errorHandler.js';
+import { isProjectAdmin } from '../middleware/rbac.js';
 import { authenticate, AuthRequest } from '../middleware/auth.js';
 import { dispatchWebhooks } from '../lib/webhookDispatcher.js';
 import { notifyProjectInvite } from '../lib/notifications.js';
+import { parseCursor } from '../lib/task-helpers.js';
 
 const router = Router();
 router.use(authenticate);
@@ -24,6 +26,10 @@ const addMemberSchema = z.object({
   role: z.enum(['ADMIN', 'MEMBER', 'VIEWER']).optional(),
 });
 
+const updateMemberRoleSchema = z.object({
+  role: z.enum(['ADMIN', 'MEMBER', 'VIEWER']),
+});
+
 // --- Helpers ---
 
 const userSelect = {
@@ -88,12 +94,44 @@ router.get('/', async (req: AuthRequest, res: Response, next: NextFunction) => {
       ],
     };
 
-    // Pagination: only when `page` query param is present (backward-compatible)
+    // Pagination modes (in priority order):
+    // 1. Cursor-based: when `cursor` key is in query (even empty = first page)
+    // 2. Offset-based: when `page` query param is present (backward-compatible)
+    // 3. Raw array: no pagination params (backward-compatible)
+    const hasCursorParam = 'cursor' in req.query;
+    const cursorId = parseCursor(req.query.cursor);
     const wantsPagination = req.query.page !== undefined;
     const page = Math.max(1, parseInt(req.query.page as string, 10) || 1);
     const limit = Math.min(100, Math.max(1, parseInt(req.query.limit as string, 10) || 20));
 
-    if (wantsPagination) {
+    if (hasCursorParam) {
+      // Cursor-based pagination: resumes after the cursor row instead of
+      // scanning and discarding every earlier page like `skip` does
+      const [results, total] = await Promise.all([
+        prisma.project.findMany({
+          where: projectWhere,
+          include: projectInclude,
+          orderBy: [{ createdAt: 'desc' }, { id: 'asc' }],
+          take: limit + 1, // fetch one extra to determine hasMore
+          ...(cursorId && { cursor: { id: cursorId }, skip: 1 }),
+        }),
+        prisma.project.count({ where: projectWhere }),
+      ]);
+
+      const hasMore = results.length > limit;
+      const data = hasMore ? results.slice(0, limit) : results;
+      const nextCursor = data.length > 0 ? data[data.length - 1].id : null;
+
+      res.json({
+        data,
+        pagination: {
+          nextCursor: hasMore ? nextCursor : null,
+          hasMore,
+          limit,
+          total,
+        },
+      });
+    } else if (wantsPagination) {
       const [projects, total] = await Promise.all([
         prisma.project.findMany({
           where: projectWhere,
@@ -190,17 +228,15 @@ router.put('/:id', async (req: AuthRequest, res: Response, next: NextFunction) =
     const data = updateProjectSchema.parse(req.body);
 
     const membership = await getProjectMembership(req.userId!, req.params.id);
-    if (!membership || !['OWNER', 'ADMIN'].includes(membership.role)) {
+    if (!membership || !isProjectAdmin(membership.role)) {
       throw new AppError('Only project owners and admins can update projects', 403);
     }
 
     const project = await prisma.project.update({
       where: { id: req.params.id },
-      data: {
-        ...(data.name !== undefined && { name: data.name }),
-        ...(data.description !== undefined && { description: data.description }),
-        ...(data.color !== undefined && { color: data.color }),
-      },
+      // Zod strips unknown keys and Prisma skips undefined fields, so the parsed
+      // body can be passed as-is instead of re-spreading each optional field
+      data,
       include: projectInclude,
     });
 
@@ -245,7 +281,7 @@ router.post('/:id/members', async (req: AuthRequest, res: Response, next: NextFu
 
     // Check requester is OWNER or ADMIN
     const membership = await getProjectMembership(req.userId!, req.params.id);
-    if (!membership || !['OWNER', 'ADMIN'].includes(membership.role)) {
+    if (!membership || !isProjectAdmin(membership.role)) {
       throw new AppError('Only project owners and admins can add members', 403);
     }
 
@@ -313,7 +349,7 @@ router.delete('/:id/members/:userId', async (req: AuthRequest, res: Response, ne
 
     // Check requester is OWNER or ADMIN
     const membership = await getProjectMembership(req.userId!, req.params.id);
-    if (!membership || !['OWNER', 'ADMIN'].includes(membership.role)) {
+    if (!membership || !isProjectAdmin(membership.role)) {
       throw new AppError('Only project owners and admins can remove members', 403);
     }
 
@@ -365,14 +401,11 @@ router.patch('/:id/members/:userId', async (req: AuthRequest, res: Response, nex
     validateUUID(req.params.id, 'project ID');
     validateUUID(req.params.userId, 'user ID');
 
-    const roleSchema = z.object({
-      role: z.enum(['ADMIN', 'MEMBER', 'VIEWER']),
-    });
-    const data = roleSchema.parse(req.body);
+    const data = updateMemberRoleSchema.parse(req.body);
 
     // Check requester is OWNER or ADMIN
     const membership = await getProjectMembership(req.userId!, req.params.id);
-    if (!membership || !['OWNER', 'ADMIN'].includes(membership.role)) {
+    if (!membership || !isProjectAdmin(membership.role)) {
       throw new AppError('Only project owners and admins can change member roles', 403);
     }
 
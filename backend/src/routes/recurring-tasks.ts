@@ -2,6 +2,7 @@ import { Router, Response, NextFunction } from 'express';
 import { z } from 'zod';
 import prisma from '../lib/prisma.js';
 import { AppError } from '../middleware/errorHandler.js';
+import { isProjectAdmin } from '../middleware/rbac.js';
 import { authenticate, AuthRequest } from '../middleware/auth.js';
 import { generateNextTask } from '../lib/recurrence.js';
 
@@ -30,7 +31,7 @@ async function getProjectMembership(userId: string, projectId: string) {
 
 function canCreateRecurringTask(membership: { role: string } | null): boolean {
   if (!membership) return false;
-  return ['OWNER', 'ADMIN', 'MEMBER'].includes(membership.role);
+  return isProjectAdmin(membership.role) || membership.role === 'MEMBER';
 }
 
 function canDeleteRecurringTask(
@@ -39,9 +40,8 @@ function canDeleteRecurringTask(
   userId: string
 ): boolean {
   if (!membership) return false;
-  if (['OWNER', 'ADMIN'].includes(membership.role)) return true;
-  if (membership.role === 'MEMBER' && recurringTask.creatorId === userId) return true;
-  return false;
+  // Admins pass on the role alone; only MEMBERs need the creator comparison
+  return isProjectAdmin(membership.role) || (membership.role === 'MEMBER' && recurringTask.creatorId === userId);
 }
 
 // --- Routes ---
@@ -2,6 +2,7 @@ import { Router, Response, NextFunction } from 'express';
 import { z } from 'zod';
 import prisma from '../lib/prisma.js';
 import { AppError } from '../middleware/errorHandler.js';
+import { isProjectAdmin } from '../middleware/rbac.js';
 import { authenticate, AuthRequest } from '../middleware/auth.js';
 
 const router = Router();
@@ -29,6 +30,10 @@ const updateTagSchema = z.object({
   color: z.string().regex(/^#[0-9a-fA-F]{6}$/).optional(),
 });
 
+const addTaskTagSchema = z.object({
+  tagId: z.string().uuid(),
+});
+
 // GET /api/tags?projectId=xxx
 router.get('/', async (req: AuthRequest, res: Response, next: NextFunction) => {
   try {
@@ -52,7 +57,7 @@ router.post('/', async (req: AuthRequest, res: Response, next: NextFunction) =>
   try {
     const data = createTagSchema.parse(req.body);
     const membership = await getProjectMembership(req.userId!, data.projectId);
-    if (!membership || !['OWNER', 'ADMIN'].includes(membership.role)) {
+    if (!membership || !isProjectAdmin(membership.role)) {
       throw new AppError('Only OWNER or ADMIN can create tags', 403);
     }
 
@@ -73,13 +78,13 @@ router.put('/:id', async (req: AuthRequest, res: Response, next: NextFunction) =
     if (!tag) throw new AppError('Tag not found', 404);
 
     const membership = await getProjectMembership(req.userId!, tag.projectId);
-    if (!membership || !['OWNER', 'ADMIN'].includes(membership.role)) {
+    if (!membership || !isProjectAdmin(membership.role)) {
       throw new AppError('Only OWNER or ADMIN can update tags', 403);
     }
 
     const updated = await prisma.tag.update({
       where: { id: req.params.id },
-      data: { ...(data.name !== undefined && { name: data.name }), ...(data.color !== undefined && { color: data.color }) },
+      data,
     });
     res.json(updated);
   } catch (error) { next(error); }
@@ -93,7 +98,7 @@ router.delete('/:id', async (req: AuthRequest, res: Response, next: NextFunction
     if (!tag) throw new AppError('Tag not found', 404);
 
     const membership = await getProjectMembership(req.userId!, tag.projectId);
-    if (!membership || !['OWNER', 'ADMIN'].includes(membership.role)) {
+    if (!membership || !isProjectAdmin(membership.role)) {
       throw new AppError('Only OWNER or ADMIN can delete tags', 403);
     }
 
@@ -106,7 +111,7 @@ router.delete('/:id', async (req: AuthRequest, res: Response, next: NextFunction
 router.post('/task/:taskId', async (req: AuthRequest, res: Response, next: NextFunction) => {
   try {
     validateUUID(req.params.taskId, 'task ID');
-    const { tagId } = z.object({ tagId: z.string().uuid() }).parse(req.body);
+    const { tagId } = addTaskTagSchema.parse(req.body);
 
     const task = await prisma.task.findUnique({ where: { id: req.params.taskId } });
     if (!task) throw new AppError('Task not found', 404);
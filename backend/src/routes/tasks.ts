@@ -2,12 +2,13 @@ import { Router, Response, NextFunction } from 'express';
 import prisma from '../lib/prisma.js';
 import { AppError } from '../middleware/errorHandler.js';
 import { authenticate, AuthRequest } from '../middleware/auth.js';
-import { logTaskCreated, logTaskChanges, logTaskDeleted } from '../lib/activityLog.js';
+import { logTaskCreated, logTaskChanges, logTaskDeleted, logBulkStatusChanges } from '../lib/activityLog.js';
 import { getIO } from '../lib/socket.js';
 import { dispatchWebhooks } from '../lib/webhookDispatcher.js';
 import { calculateTaskXP, awardXP } from '../services/xpService.js';
 import { createTaskSchema, updateTaskSchema, bulkStatusSchema } from '../lib/task-schemas.js';
-import { taskInclude, getProjectMembership, canModifyTask, validateUUID } from '../lib/task-helpers.js';
+import { taskInclude, getProjectMembership, canModifyTask, validateUUID, parseCursor } from '../lib/task-helpers.js';
+import { chunk, distinct, IN_LIST_CHUNK_SIZE } from '../lib/batching.js';
 
 const router = Router();
 router.use(authenticate);
@@ -56,22 +57,22 @@ router.patch('/bulk-status', async (req: AuthRequest, res: Response, next: NextF
   try {
     const data = bulkStatusSchema.parse(req.body);
 
-    // Get all tasks and verify permissions for each
-    const tasks = await prisma.task.findMany({
-      where: {
-        id: { in: data.taskIds },
-      },
-      include: {
-        project: {
-          include: {
-            members: true,
-          },
+    // Get all tasks and verify permissions for each. Ids are looked up in
+    // chunks so very large requests stay under the bind-parameter limit;
+    // the list itself is only bounded by the JSON body size limit.
+    const taskIdChunks = chunk(distinct(data.taskIds, (id) => id), IN_LIST_CHUNK_SIZE);
+    const tasks = [];
+    for (const ids of taskIdChunks) {
+      tasks.push(...await prisma.task.findMany({
+        where: {
+          id: { in: ids },
         },
-      },
-    });
+        select: { id: true, projectId: true, creatorId: true, status: true },
+      }));
+    }
 
     // Optimization: Batch all membership checks into a single DB query
-    const projectIds = Array.from(new Set(tasks.map((t) => t.projectId)));
+    const projectIds = distinct(tasks, (t) => t.projectId);
     const membershipRows = await prisma.projectMember.findMany({
       where: { projectId: { in: projectIds }, userId: req.userId! },
       select: { projectId: true, role: true },
@@ -89,29 +90,31 @@ router.patch('/bulk-status', async (req: AuthRequest, res: Response, next: NextF
     // However, we should use the IDs that were actually found in the DB.
     const updatableTaskIds = tasks.map(t => t.id);
 
-    // Update all authorized tasks
-    const result = await prisma.task.updateMany({
-      where: {
-        id: { in: updatableTaskIds },
-      },
-      data: {
-        status: data.status,
-      },
-    });
-
-    // Log status changes for each affected task
-    for (const task of tasks) {
-      if (task.status !== data.status) {
-        await logTaskChanges({
-          taskId: task.id,
-          userId: req.userId!,
-          oldTask: { status: task.status },
-          newTask: { status: data.status },
-        });
-      }
-    }
-
-    res.json({ updated: result.count });
+    // Update all authorized tasks (chunked, but atomic as one transaction)
+    const results = await prisma.$transaction(
+      chunk(updatableTaskIds, IN_LIST_CHUNK_SIZE).map((ids) =>
+        prisma.task.updateMany({
+          where: {
+            id: { in: ids },
+          },
+          data: {
+            status: data.status,
+          },
+        })
+      )
+    );
+    const updatedCount = results.reduce((sum, r) => sum + r.count, 0);
+
+    // Log status changes for every affected task in one batch
+    await logBulkStatusChanges(
+      tasks
+        .filter((task) => task.status !== data.status)
+        .map((task) => ({ taskId: task.id, oldStatus: task.status })),
+      data.status,
+      req.userId!,
+    );
+
+    res.json({ updated: updatedCount });
   } catch (error) {
     next(error);
   }
@@ -293,7 +296,7 @@ router.get('/', async (req: AuthRequest, res: Response, next: NextFunction) => {
     // 2. Offset-based: when `page` query param is present (backward-compatible)
     // 3. Raw array: no pagination params (backward-compatible)
     const hasCursorParam = 'cursor' in req.query;
-    const cursorId = (req.query.cursor as string) || undefined;
+    const cursorId = parseCursor(req.query.cursor);
     const wantsPagination = req.query.page !== undefined;
     const limit = Math.min(100, Math.max(1, parseInt(req.query.limit as string, 10) || 20));
 
@@ -334,17 +337,27 @@ router.get('/', async (req: AuthRequest, res: Response, next: NextFunction) => {
     } else if (wantsPagination) {
       // Offset-based pagination (backward-compatible)
       const page = Math.max(1, parseInt(req.query.page as string, 10) || 1);
+      const skip = (page - 1) * limit;
 
-      const [tasks, total] = await Promise.all([
-        prisma.task.findMany({
-          where,
-          include: taskInclude,
-          orderBy: { [safeSortBy]: order },
-          skip: (page - 1) * limit,
-          take: limit,
-        }),
-        prisma.task.count({ where }),
-      ]);
+      // Start the COUNT alongside the page query, since full pages need it.
+      // Prisma queries are lazy, so attaching the handler is what sends it;
+      // it also keeps an unawaited failure from surfacing as unhandled.
+      const countPromise = prisma.task.count({ where });
+      countPromise.catch(() => undefined);
+
+      const tasks = await prisma.task.findMany({
+        where,
+        include: taskInclude,
+        orderBy: { [safeSortBy]: order },
+        skip,
+        take: limit,
+      });
+
+      // A partially filled page is the last one, so the total follows from it
+      // and the response doesn't wait on the COUNT. Full (or empty, past
+      // page 1) pages use it.
+      const isLastPage = tasks.length > 0 ? tasks.length < limit : page === 1;
+      const total = isLastPage ? skip + tasks.length : await countPromise;
 
       res.json({
         data: tasks,
@@ -657,12 +670,12 @@ router.put('/:id', async (req: AuthRequest, res: Response, next: NextFunction) =
 
       // Award XP for task completion
       try {
-        // Get time tracking data
-        const timeEntries = await prisma.timeEntry.findMany({
+        // Get time tracking data (summed in the database, not row by row here)
+        const timeTotals = await prisma.timeEntry.aggregate({
           where: { taskId: updatedTask.id, userId: req.userId! },
-          select: { duration: true },
+          _sum: { duration: true },
         });
-        const totalTimeTracked = timeEntries.reduce((sum, entry) => sum + (entry.duration || 0), 0);
+        const totalTimeTracked = timeTotals._sum.duration ?? 0;
 
         // Get attachment count
         const attachmentCount = await prisma.attachment.count({
@@ -773,7 +786,7 @@ router.get('/:id/activity', async (req: AuthRequest, res: Response, next: NextFu
     }
 
     const hasCursorParam = 'cursor' in req.query;
-    const cursorId = (req.query.cursor as string) || undefined;
+    const cursorId = parseCursor(req.query.cursor);
     const limit = Math.min(parseInt(req.query.limit as string) || 50, 200);
 
     const userSelect = {
@@ -32,6 +32,11 @@ const startTimerSchema = z.object({
 
 // --- Helpers ---
 
+// Shared query shape, built once at module load instead of per request
+const timeEntryInclude = {
+  task: { select: { id: true, title: true, status: true, projectId: true } },
+} as const;
+
 async function verifyProjectMembership(userId: string, taskId: string) {
   const task = await prisma.task.findUnique({
     where: { id: taskId },
@@ -122,9 +127,7 @@ router.get('/', async (req: AuthRequest, res: Response, next: NextFunction) => {
 
     const entries = await prisma.timeEntry.findMany({
       where,
-      include: {
-        task: { select: { id: true, title: true, status: true, projectId: true } },
-      },
+      include: timeEntryInclude,
       orderBy: { startTime: 'desc' },
     });
 
@@ -141,9 +144,7 @@ router.get('/active', async (req: AuthRequest, res: Response, next: NextFunction
 
     const activeEntry = await prisma.timeEntry.findFirst({
       where: { userId, endTime: null },
-      include: {
-        task: { select: { id: true, title: true, status: true, projectId: true } },
-      },
+      include: timeEntryInclude,
     });
 
     if (!activeEntry) {
@@ -253,9 +254,7 @@ router.get('/:id', async (req: AuthRequest, res: Response, next: NextFunction) =
 
     const fullEntry = await prisma.timeEntry.findUnique({
       where: { id: entry.id },
-      include: {
-        task: { select: { id: true, title: true, status: true, projectId: true } },
-      },
+      include: timeEntryInclude,
     });
 
     res.json(fullEntry);
@@ -290,9 +289,7 @@ router.post('/', async (req: AuthRequest, res: Response, next: NextFunction) =>
         duration: duration || null,
         description: parsed.description || null,
       },
-      include: {
-        task: { select: { id: true, title: true, status: true, projectId: true } },
-      },
+      include: timeEntryInclude,
     });
 
     res.status(201).json(entry);
@@ -335,9 +332,7 @@ router.put('/:id', async (req: AuthRequest, res: Response, next: NextFunction) =
     const updated = await prisma.timeEntry.update({
       where: { id },
       data: updateData,
-      include: {
-        task: { select: { id: true, title: true, status: true, projectId: true } },
-      },
+      include: timeEntryInclude,
     });
 
     res.json(updated);
@@ -388,9 +383,7 @@ router.post('/start', async (req: AuthRequest, res: Response, next: NextFunction
         duration: null,
         description: parsed.description || null,
       },
-      include: {
-        task: { select: { id: true, title: true, status: true, projectId: true } },
-      },
+      include: timeEntryInclude,
     });
 
     res.status(201).json(entry);
@@ -420,9 +413,7 @@ router.post('/:id/stop', async (req: AuthRequest, res: Response, next: NextFunct
         endTime,
         duration,
       },
-      include: {
-        task: { select: { id: true, title: true, status: true, projectId: true } },
-      },
+      include: timeEntryInclude,
     });
 
     res.json(updated);
@@ -6,6 +6,7 @@ import { AppError } from '../middleware/errorHandler.js';
 import { authenticate, AuthRequest } from '../middleware/auth.js';
 import { requirePlan, PlanRequest } from '../middleware/planEnforcement.js';
 import { ALLOWED_WEBHOOK_EVENTS } from '../lib/webhookDispatcher.js';
+import { isRecordNotFound } from '../lib/prisma-errors.js';
 
 const router = Router();
 router.use(authenticate);
@@ -36,13 +37,15 @@ function isPrivateUrl(urlString: string): boolean {
 
 // --- Zod Schemas ---
 
+const allowedEventSet: ReadonlySet<string> = new Set(ALLOWED_WEBHOOK_EVENTS);
+
 const createWebhookSchema = z.object({
   url: z.string().url('Must be a valid URL').max(2048, 'URL must be 2048 characters or less').refine(
     url => !isPrivateUrl(url),
     'Webhook URL must be a public URL'
   ),
   events: z.array(z.string()).min(1, 'At least one event is required').refine(
-    (events) => events.every((e) => (ALLOWED_WEBHOOK_EVENTS as readonly string[]).includes(e)),
+    (events) => events.every((e) => allowedEventSet.has(e)),
     { message: `Events must be one of: ${ALLOWED_WEBHOOK_EVENTS.join(', ')}` }
   ),
 });
@@ -53,7 +56,7 @@ const updateWebhookSchema = z.object({
     'Webhook URL must be a public URL'
   ).optional(),
   events: z.array(z.string()).min(1, 'At least one event is required').refine(
-    (events) => events.every((e) => (ALLOWED_WEBHOOK_EVENTS as readonly string[]).includes(e)),
+    (events) => events.every((e) => allowedEventSet.has(e)),
     { message: `Events must be one of: ${ALLOWED_WEBHOOK_EVENTS.join(', ')}` }
   ).optional(),
   active: z.boolean().optional(),
@@ -118,25 +121,11 @@ router.put('/:id', async (req: AuthRequest, res: Response, next: NextFunction) =
   try {
     const data = updateWebhookSchema.parse(req.body);
 
-    const webhook = await prisma.webhook.findUnique({
-      where: { id: req.params.id },
-    });
-
-    if (!webhook) {
-      throw new AppError('Webhook not found', 404);
-    }
-
-    if (webhook.userId !== req.userId) {
-      throw new AppError('You can only update your own webhooks', 403);
-    }
-
+    // Owner-scoped conditional update: a single round trip when the caller owns
+    // the webhook. Only a miss pays for a lookup to tell 404 from 403.
     const updated = await prisma.webhook.update({
-      where: { id: req.params.id },
-      data: {
-        ...(data.url !== undefined && { url: data.url }),
-        ...(data.events !== undefined && { events: data.events }),
-        ...(data.active !== undefined && { active: data.active }),
-      },
+      where: { id: req.params.id, userId: req.userId! },
+      data,
       select: {
         id: true,
         url: true,
@@ -145,6 +134,15 @@ router.put('/:id', async (req: AuthRequest, res: Response, next: NextFunction) =
         failureCount: true,
         createdAt: true,
       },
+    }).catch(async (err: unknown) => {
+      if (!isRecordNotFound(err)) throw err;
+      const webhook = await prisma.webhook.findUnique({
+        where: { id: req.params.id },
+        select: { id: true },
+      });
+      throw webhook
+        ? new AppError('You can only update your own webhooks', 403)
+        : new AppError('Webhook not found', 404);
     });
 
     res.json(updated);
@@ -156,20 +154,20 @@ router.put('/:id', async (req: AuthRequest, res: Response, next: NextFunction) =
 // DELETE /api/webhooks/:id - Delete webhook
 router.delete('/:id', async (req: AuthRequest, res: Response, next: NextFunction) => {
   try {
-    const webhook = await prisma.webhook.findUnique({
-      where: { id: req.params.id },
-    });
-
-    if (!webhook) {
-      throw new AppError('Webhook not found', 404);
-    }
-
-    if (webhook.userId !== req.userId) {
-      throw new AppError('You can only delete your own webhooks', 403);
-    }
-
-    await prisma.webhook.delete({
-      where: { id: req.params.id },
+    // Owner-scoped delete in one round trip; the deleted row still feeds the
+    // audit log. Only a miss pays for a lookup to tell 404 from 403.
+    const webhook = await prisma.webhook.delete({
+      where: { id: req.params.id, userId: req.userId! },
+      select: { id: true, url: true, events: true },
+    }).catch(async (err: unknown) => {
+      if (!isRecordNotFound(err)) throw err;
+      const existing = await prisma.webhook.findUnique({
+        where: { id: req.params.id },
+        select: { id: true },
+      });
+      throw existing
+        ? new AppError('You can only delete your own webhooks', 403)
+        : new AppError('Webhook not found', 404);
     });
 
     // Audit log: webhook deleted (url logged, secret never logged)
@@ -10,6 +10,7 @@
  * requires no event hooks into existing routes.
  */
 
+import { Prisma } from '@prisma/client';
 import prisma from '../lib/prisma.js';
 import { awardXP } from './xpService.js';
 
@@ -78,29 +79,30 @@ const WEEKLY_TEMPLATES: QuestData[] = [
 ];
 
 // ── Date helpers ────────────────────────────────────────────────────────────
+// Each takes the caller's `now` so one quest check reads the clock once.
 
-function startOfToday(): Date {
-  const d = new Date();
+function startOfToday(now: Date): Date {
+  const d = new Date(now);
   d.setHours(0, 0, 0, 0);
   return d;
 }
 
-function endOfToday(): Date {
-  const d = new Date();
+function endOfToday(now: Date): Date {
+  const d = new Date(now);
   d.setHours(23, 59, 59, 999);
   return d;
 }
 
-function startOfThisWeek(): Date {
-  const d = new Date();
+function startOfThisWeek(now: Date): Date {
+  const d = new Date(now);
   const day = d.getDay(); // 0 = Sunday
   d.setDate(d.getDate() - day);
   d.setHours(0, 0, 0, 0);
   return d;
 }
 
-function endOfThisWeek(): Date {
-  const d = startOfThisWeek();
+function endOfThisWeek(now: Date): Date {
+  const d = startOfThisWeek(now);
   d.setDate(d.getDate() + 6);
   d.setHours(23, 59, 59, 999);
   return d;
@@ -108,7 +110,13 @@ function endOfThisWeek(): Date {
 
 // ── Progress computation ────────────────────────────────────────────────────
 
-async function computeProgress(userId: string, quest: QuestData): Promise<number> {
+/** Period boundaries shared by every quest in one progress pass. */
+interface QuestWindow {
+  todayStart: Date;
+  weekStart: Date;
+}
+
+async function computeProgress(userId: string, quest: QuestData, bounds: QuestWindow): Promise<number> {
   const { objective } = quest;
 
   if (objective === 'tasks_completed') {
@@ -116,7 +124,7 @@ async function computeProgress(userId: string, quest: QuestData): Promise<number
       where: {
         assigneeId: userId,
         status: 'DONE',
-        updatedAt: { gte: startOfToday() },
+        updatedAt: { gte: bounds.todayStart },
       },
     });
     return count;
@@ -128,7 +136,7 @@ async function computeProgress(userId: string, quest: QuestData): Promise<number
         assigneeId: userId,
         status: 'DONE',
         priority: { in: ['HIGH', 'URGENT'] },
-        updatedAt: { gte: startOfToday() },
+        updatedAt: { gte: bounds.todayStart },
       },
     });
     return count;
@@ -139,7 +147,7 @@ async function computeProgress(userId: string, quest: QuestData): Promise<number
     const entries = await prisma.timeEntry.findMany({
       where: {
         userId,
-        startTime: { gte: startOfToday() },
+        startTime: { gte: bounds.todayStart },
       },
       select: { taskId: true },
       distinct: ['taskId'],
@@ -152,7 +160,7 @@ async function computeProgress(userId: string, quest: QuestData): Promise<number
       where: {
         assigneeId: userId,
         status: 'DONE',
-        updatedAt: { gte: startOfThisWeek() },
+        updatedAt: { gte: bounds.weekStart },
       },
     });
     return count;
@@ -167,27 +175,30 @@ async function computeProgress(userId: string, quest: QuestData): Promise<number
  * Ensure the user has daily quests for today. Creates 2–3 from the template
  * bank if none exist yet. Returns without creating if already present.
  */
-export async function ensureDailyQuests(userId: string): Promise<void> {
-  const existingCount = await prisma.userQuest.count({
+export async function ensureDailyQuests(userId: string, now: Date = new Date()): Promise<void> {
+  // Existence check only — stop at the first match instead of counting them all
+  const existing = await prisma.userQuest.findFirst({
     where: {
       userId,
       questType: 'DAILY',
-      createdAt: { gte: startOfToday() },
+      createdAt: { gte: startOfToday(now) },
     },
+    select: { id: true },
   });
 
-  if (existingCount > 0) return;
+  if (existing) return;
 
   // Shuffle templates and pick 2–3
   const shuffled = [...DAILY_TEMPLATES].sort(() => Math.random() - 0.5);
   const selected = shuffled.slice(0, 3);
+  const expiresAt = endOfToday(now);
 
   await prisma.userQuest.createMany({
     data: selected.map((tpl) => ({
       userId,
       questType: 'DAILY',
       questData: tpl as object,
-      expiresAt: endOfToday(),
+      expiresAt,
     })),
   });
 }
@@ -196,19 +207,21 @@ export async function ensureDailyQuests(userId: string): Promise<void> {
  * Ensure the user has a weekly quest for this week. Creates one from the
  * template bank if none exist yet.
  */
-export async function ensureWeeklyQuests(userId: string): Promise<void> {
-  const existingCount = await prisma.userQuest.count({
+export async function ensureWeeklyQuests(userId: string, now: Date = new Date()): Promise<void> {
+  // Existence check only — stop at the first match instead of counting them all
+  const existing = await prisma.userQuest.findFirst({
     where: {
       userId,
       questType: 'WEEKLY',
-      createdAt: { gte: startOfThisWeek() },
+      createdAt: { gte: startOfThisWeek(now) },
     },
+    select: { id: true },
   });
 
-  if (existingCount > 0) return;
+  if (existing) return;
 
   // Pick a weekly template (rotate based on week number for variety)
-  const weekNum = Math.floor(Date.now() / (7 * 24 * 60 * 60 * 1000));
+  const weekNum = Math.floor(now.getTime() / (7 * 24 * 60 * 60 * 1000));
   const template = WEEKLY_TEMPLATES[weekNum % WEEKLY_TEMPLATES.length];
 
   await prisma.userQuest.create({
@@ -216,24 +229,30 @@ export async function ensureWeeklyQuests(userId: string): Promise<void> {
       userId,
       questType: 'WEEKLY',
       questData: template as object,
-      expiresAt: endOfThisWeek(),
+      expiresAt: endOfThisWeek(now),
     },
   });
 }
 
 /**
- * Returns all active (non-expired) quests for a user with live progress.
- * Also generates today's daily and weekly quests if not yet created.
+ * Loads a user's non-expired quests matching `filter` and attaches live
+ * progress, generating today's daily and weekly quests first if needed.
  */
-export async function getActiveQuests(userId: string): Promise<QuestWithProgress[]> {
-  await ensureDailyQuests(userId);
-  await ensureWeeklyQuests(userId);
-
+async function loadActiveQuests(
+  userId: string,
+  filter: Prisma.UserQuestWhereInput = {},
+): Promise<QuestWithProgress[]> {
   const now = new Date();
+  const bounds: QuestWindow = { todayStart: startOfToday(now), weekStart: startOfThisWeek(now) };
+
+  // Independent checks, so their round trips overlap on separate pool connections
+  await Promise.all([ensureDailyQuests(userId, now), ensureWeeklyQuests(userId, now)]);
+
   const quests = await prisma.userQuest.findMany({
     where: {
       userId,
       expiresAt: { gte: now },
+      ...filter,
     },
     orderBy: { createdAt: 'asc' },
   });
@@ -241,7 +260,7 @@ export async function getActiveQuests(userId: string): Promise<QuestWithProgress
   return Promise.all(
     quests.map(async (q) => {
       const data = q.questData as QuestData;
-      const progress = q.completed ? data.target : await computeProgress(userId, data);
+      const progress = q.completed ? data.target : await computeProgress(userId, data, bounds);
       return {
         id: q.id,
         questType: q.questType,
@@ -256,6 +275,14 @@ export async function getActiveQuests(userId: string): Promise<QuestWithProgress
   );
 }
 
+/**
+ * Returns all active (non-expired) quests for a user with live progress.
+ * Also generates today's daily and weekly quests if not yet created.
+ */
+export async function getActiveQuests(userId: string): Promise<QuestWithProgress[]> {
+  return loadActiveQuests(userId);
+}
+
 /**
  * Check all of a user's active quests for completion and award XP for any
  * that have reached their target but are not yet marked complete.
@@ -263,17 +290,19 @@ export async function getActiveQuests(userId: string): Promise<QuestWithProgress
  * (e.g., task completion, time entry).
  */
 export async function checkAndCompleteQuests(userId: string): Promise<string[]> {
-  const quests = await getActiveQuests(userId);
+  // Already-completed quests are excluded by the query (served by the
+  // userId/completed/expiresAt index) rather than loaded and skipped here
+  const quests = await loadActiveQuests(userId, { completed: false });
   const nowCompleted: string[] = [];
+  const completedAt = new Date();
 
   for (const quest of quests) {
-    if (quest.completed) continue;
     if (quest.progress < quest.questData.target) continue;
 
     // Mark complete
     await prisma.userQuest.update({
       where: { id: quest.id },
-      data: { completed: true, completedAt: new Date() },
+      data: { completed: true, completedAt },
     });
 
     // Award XP
@@ -33,6 +33,7 @@ export class SeedService {
         // Check if seed data already exists for this user
         const existingProject = await prisma.project.findFirst({
             where: { ownerId: userId, name: 'Welcome Project' },
+            select: { id: true },
         });
         if (existingProject) {
             return { message: 'Seed data already exists', alreadySeeded: true };
@@ -46,13 +47,12 @@ export class SeedService {
             { code: 'COLLABORATOR', name: 'Team Player', description: 'Add a member to a project', icon: 'users' },
         ];
 
-        for (const ach of achievements) {
-            await prisma.achievement.upsert({
-                where: { code: ach.code },
-                update: {},
-                create: ach,
-            });
-        }
+        // The upserts never updated anything, so one multi-row INSERT that
+        // skips existing codes does the same work in a single statement
+        await prisma.achievement.createMany({
+            data: achievements,
+            skipDuplicates: true,
+        });
 
         // 2. Create Sample Project
         const project = await prisma.project.create({
@@ -98,9 +98,7 @@ export class SeedService {
             },
         ];
 
-        for (const t of tasks) {
-            await prisma.task.create({ data: t });
-        }
+        await prisma.task.createMany({ data: tasks });
 
         return { message: 'Seed data created successfully' };
     }
@@ -25,6 +25,14 @@ interface TaskXPData {
   attachmentCount?: number;
 }
 
+// Priority base XP — intentionally weighted, not arbitrary multipliers
+const PRIORITY_BASE_XP: Record<Priority, number> = {
+  LOW: 10,
+  MEDIUM: 25,
+  HIGH: 50,
+  URGENT: 100,
+};
+
 /**
  * Calculate XP for a completed task.
  * Formula: XP = (PriorityBase + ComplexityBonus) × TimeBonusFactor
@@ -33,14 +41,7 @@ interface TaskXPData {
  *   LOW=10, MEDIUM=25, HIGH=50, URGENT=100
  */
 export async function calculateTaskXP(task: TaskXPData): Promise<XPCalculation> {
-  // Priority base XP — intentionally weighted, not arbitrary multipliers
-  const priorityBaseXP: Record<Priority, number> = {
-    LOW: 10,
-    MEDIUM: 25,
-    HIGH: 50,
-    URGENT: 100,
-  };
-  const baseXP = priorityBaseXP[task.priority] ?? 25;
+  const baseXP = PRIORITY_BASE_XP[task.priority] ?? 25;
   // Keep priorityMultiplier as 1 — the base values already encode priority weight
   const priorityMultiplier = 1;
 
@@ -144,24 +145,24 @@ export async function awardXP(
   const newLevel = calculateLevel(newXP);
   const leveledUp = newLevel > (user.level || 1);
 
-  // Update user
-  await prisma.user.update({
-    where: { id: userId },
-    data: {
-      xp: newXP,
-      level: newLevel
-    }
-  });
-
-  // Log XP gain
-  await prisma.xPLog.create({
-    data: {
-      userId,
-      xpGained: xp,
-      source,
-      timestamp: new Date(),
-    }
-  });
+  // Update user and log the gain in one explicit transaction (one commit)
+  await prisma.$transaction([
+    prisma.user.update({
+      where: { id: userId },
+      data: {
+        xp: newXP,
+        level: newLevel
+      }
+    }),
+    prisma.xPLog.create({
+      data: {
+        userId,
+        xpGained: xp,
+        source,
+        timestamp: new Date(),
+      }
+    }),
+  ]);
 
   // Send real-time update via Socket.io
   const socketIO = getIO();
@@ -185,23 +186,23 @@ export async function awardXP(
   return { newLevel, leveledUp, newXP };
 }
 
+const LEVEL_REWARDS: Record<number, LevelReward> = {
+  2: { type: 'feature', name: 'Achievement Tab', description: 'Track your achievements!' },
+  3: { type: 'cosmetic', name: 'Custom Themes', description: '3 new color schemes unlocked' },
+  5: { type: 'feature', name: 'Skill Tree Preview', description: 'Unlock at level 10 or with Plus!' },
+  10: { type: 'milestone', name: 'Free Tier Complete', description: 'Upgrade to Plus for levels 11-50!' },
+  15: { type: 'feature', name: 'Advanced Filters', description: 'Create complex task queries' },
+  20: { type: 'feature', name: 'Custom Fields', description: 'Add custom metadata to tasks' },
+  30: { type: 'feature', name: 'API Access', description: 'Integrate TaskMan with other tools' },
+  40: { type: 'feature', name: 'White-Label', description: 'Brand TaskMan as your own' },
+  50: { type: 'milestone', name: 'Max Level!', description: 'You\'ve mastered TaskMan!' },
+};
+
 /**
  * Get rewards for reaching a specific level
  */
 function getLevelRewards(level: number): LevelReward {
-  const rewardMap: Record<number, LevelReward> = {
-    2: { type: 'feature', name: 'Achievement Tab', description: 'Track your achievements!' },
-    3: { type: 'cosmetic', name: 'Custom Themes', description: '3 new color schemes unlocked' },
-    5: { type: 'feature', name: 'Skill Tree Preview', description: 'Unlock at level 10 or with Plus!' },
-    10: { type: 'milestone', name: 'Free Tier Complete', description: 'Upgrade to Plus for levels 11-50!' },
-    15: { type: 'feature', name: 'Advanced Filters', description: 'Create complex task queries' },
-    20: { type: 'feature', name: 'Custom Fields', description: 'Add custom metadata to tasks' },
-    30: { type: 'feature', name: 'API Access', description: 'Integrate TaskMan with other tools' },
-    40: { type: 'feature', name: 'White-Label', description: 'Brand TaskMan as your own' },
-    50: { type: 'milestone', name: 'Max Level!', description: 'You\'ve mastered TaskMan!' },
-  };
-
-  return rewardMap[level] || {
+  return LEVEL_REWARDS[level] || {
     type: 'generic',
     name: 'Level Up!',
     description: `You've reached level ${level}!`
@@ -235,18 +236,21 @@ export async function calculateHistoricalXP(userId: string): Promise<number> {
     }
   });
 
+  // Sum time tracked per task in one grouped query instead of one query per task
+  const timeTotals = await prisma.timeEntry.groupBy({
+    by: ['taskId'],
+    where: {
+      userId,
+      taskId: { in: completedTasks.map((task) => task.id) }
+    },
+    _sum: { duration: true }
+  });
+  const timeByTask = new Map(timeTotals.map((row) => [row.taskId, row._sum.duration ?? 0]));
+
   let totalXP = 0;
 
   for (const task of completedTasks) {
-    // Calculate time tracked (sum of time entries)
-    const timeEntries = await prisma.timeEntry.findMany({
-      where: {
-        taskId: task.id,
-        userId
-      },
-      select: { duration: true }
-    });
-    const timeTracked = timeEntries.reduce((sum, entry) => sum + (entry.duration || 0), 0);
+    const timeTracked = timeByTask.get(task.id) ?? 0;
 
     const calc = await calculateTaskXP({
       priority: task.priority,
@@ -272,6 +276,7 @@ export async function applyRetroactiveXP(
 ): Promise<{ alreadyApplied: boolean; xpAwarded: number }> {
   const existing = await prisma.xPLog.findFirst({
     where: { userId, source: 'Retroactive XP calculation' },
+    select: { id: true },
   });
 
   if (existing) {
@@ -283,19 +288,20 @@ export async function applyRetroactiveXP(
   if (totalXP > 0) {
     const newLevel = calculateLevel(totalXP);
 
-    await prisma.user.update({
-      where: { id: userId },
-      data: { xp: totalXP, level: newLevel },
-    });
-
-    await prisma.xPLog.create({
-      data: {
-        userId,
-        xpGained: totalXP,
-        source: 'Retroactive XP calculation',
-        timestamp: new Date(),
-      },
-    });
+    await prisma.$transaction([
+      prisma.user.update({
+        where: { id: userId },
+        data: { xp: totalXP, level: newLevel },
+      }),
+      prisma.xPLog.create({
+        data: {
+          userId,
+          xpGained: totalXP,
+          source: 'Retroactive XP calculation',
+          timestamp: new Date(),
+        },
+      }),
+    ]);
   }
 
   return { alreadyApplied: false, xpAwarded: totalXP };
@@ -10,14 +10,14 @@ import { jest, describe, it, expect, beforeAll, beforeEach } from '@jest/globals
 // ─── Mock prisma ──────────────────────────────────────────────────────────────
 
 const mockCreate = jest.fn();
-const mockDeleteMany = jest.fn();
+const mockCreateMany = jest.fn();
 const mockTransaction = jest.fn();
 
 jest.unstable_mockModule('../src/lib/prisma.js', () => ({
   default: {
     activityLog: {
       create: mockCreate,
-      deleteMany: mockDeleteMany,
+      createMany: mockCreateMany,
     },
     $transaction: mockTransaction,
   },
@@ -40,6 +40,8 @@ let logTaskCreated: any;
 // eslint-disable-next-line @typescript-eslint/no-explicit-any
 let logTaskChanges: any;
 // eslint-disable-next-line @typescript-eslint/no-explicit-any
+let logBulkStatusChanges: any;
+// eslint-disable-next-line @typescript-eslint/no-explicit-any
 let logTaskDeleted: any;
 // eslint-disable-next-line @typescript-eslint/no-explicit-any
 let logDependencyAdded: any;
@@ -52,6 +54,7 @@ beforeAll(async () => {
   const mod = await import('../src/lib/activityLog.js');
   logTaskCreated = mod.logTaskCreated;
   logTaskChanges = mod.logTaskChanges;
+  logBulkStatusChanges = mod.logBulkStatusChanges;
   logTaskDeleted = mod.logTaskDeleted;
   logDependencyAdded = mod.logDependencyAdded;
   logDependencyRemoved = mod.logDependencyRemoved;
@@ -75,7 +78,7 @@ beforeEach(() => {
   // Reset ALL mock state including implementations — prevents leaked mock
   // implementations from one test affecting the next.
   mockCreate.mockReset();
-  mockDeleteMany.mockReset();
+  mockCreateMany.mockReset();
   mockTransaction.mockReset();
   mockGetIO.mockReset();
   mockTo.mockReset();
@@ -83,7 +86,6 @@ beforeEach(() => {
 
   // Defaults
   mockGetIO.mockReturnValue(null);                     // no socket by default
-  mockDeleteMany.mockResolvedValue({ count: 0 });       // fire-and-forget cleanup
   mockTo.mockReturnValue({ emit: mockEmit });           // safe default for enableIO()
 });
 
@@ -238,6 +240,54 @@ describe('logTaskChanges', () => {
   });
 });
 
+// ─── logBulkStatusChanges ─────────────────────────────────────────────────────
+
+describe('logBulkStatusChanges', () => {
+  const changes = [
+    { taskId: 'task-a', oldStatus: 'TODO' },
+    { taskId: 'task-b', oldStatus: 'IN_PROGRESS' },
+  ];
+
+  it('does nothing when there are no changes', async () => {
+    await logBulkStatusChanges([], 'DONE', 'user-7');
+    expect(mockTransaction).not.toHaveBeenCalled();
+    expect(mockCreateMany).not.toHaveBeenCalled();
+  });
+
+  it('writes one status log per task in a single createMany', async () => {
+    mockCreateMany.mockReturnValue('createMany-op');
+    mockTransaction.mockResolvedValue([{ count: 2 }]);
+
+    await logBulkStatusChanges(changes, 'DONE', 'user-7');
+
+    expect(mockTransaction).toHaveBeenCalledWith(['createMany-op']);
+    expect(mockCreateMany).toHaveBeenCalledTimes(1);
+    const { data } = mockCreateMany.mock.calls[0][0] as { data: Record<string, unknown>[] };
+    expect(data).toEqual([
+      expect.objectContaining({ action: 'UPDATED', field: 'status', oldValue: 'TODO', newValue: 'DONE', taskId: 'task-a', userId: 'user-7' }),
+      expect.objectContaining({ action: 'UPDATED', field: 'status', oldValue: 'IN_PROGRESS', newValue: 'DONE', taskId: 'task-b', userId: 'user-7' }),
+    ]);
+    expect(data[0].id).not.toBe(data[1].id);
+  });
+
+  it('emits task:updated and activity:new per task when IO is available', async () => {
+    mockTransaction.mockResolvedValue([{ count: 2 }]);
+    enableIO();
+
+    await logBulkStatusChanges(changes, 'DONE', 'user-7');
+
+    expect(mockTo).toHaveBeenCalledWith('task:task-a');
+    expect(mockTo).toHaveBeenCalledWith('task:task-b');
+    expect(mockEmit).toHaveBeenCalledWith('task:updated', { taskId: 'task-a' });
+    expect(mockEmit).toHaveBeenCalledWith('activity:new', expect.objectContaining({ taskId: 'task-b', newValue: 'DONE' }));
+  });
+
+  it('swallows errors silently', async () => {
+    mockTransaction.mockRejectedValue(new Error('fail'));
+    await expect(logBulkStatusChanges(changes, 'DONE', 'user-7')).resolves.toBeUndefined();
+  });
+});
+
 // ─── logTaskDeleted ───────────────────────────────────────────────────────────
 
 describe('logTaskDeleted', () => {
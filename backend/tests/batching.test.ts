@@ -0,0 +1,31 @@
+import { describe, it, expect } from '@jest/globals';
+import { chunk, distinct } from '../src/lib/batching.js';
+
+describe('chunk', () => {
+  it('returns no chunks for an empty array', () => {
+    expect(chunk([], 3)).toEqual([]);
+  });
+
+  it('splits into slices of the requested size with a short tail', () => {
+    expect(chunk([1, 2, 3, 4, 5, 6, 7], 3)).toEqual([[1, 2, 3], [4, 5, 6], [7]]);
+  });
+
+  it('returns a single chunk when the size exceeds the length', () => {
+    expect(chunk(['a', 'b'], 10)).toEqual([['a', 'b']]);
+  });
+
+  it('treats sizes below 1 as 1', () => {
+    expect(chunk([1, 2], 0)).toEqual([[1], [2]]);
+  });
+});
+
+describe('distinct', () => {
+  it('returns no keys for an empty input', () => {
+    expect(distinct([], (x) => x)).toEqual([]);
+  });
+
+  it('drops repeated keys and keeps first-seen order', () => {
+    const rows = [{ id: 'b' }, { id: 'a' }, { id: 'b' }, { id: 'c' }, { id: 'a' }];
+    expect(distinct(rows, (r) => r.id)).toEqual(['b', 'a', 'c']);
+  });
+});
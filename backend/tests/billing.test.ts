@@ -240,5 +240,27 @@ describe('Billing webhook', () => {
       const sub = await prisma.subscription.findFirst({ where: { userId: TEST_USER_ID } });
       expect(sub?.stripeEventId).toBe('evt_idem_003b');
     });
+
+    it('skips a recent redelivery from the in-process cache even after its stripeEventId was replaced', async () => {
+      const event1 = makeFakeCheckoutEvent({ id: 'evt_idem_004a', subscriptionId: 'sub_004a' });
+      const event2 = makeFakeCheckoutEvent({ id: 'evt_idem_004b', subscriptionId: 'sub_004b' });
+      mockSubscriptionsRetrieve.mockResolvedValueOnce(makeStripeSub('sub_004a'));
+      mockSubscriptionsRetrieve.mockResolvedValueOnce(makeStripeSub('sub_004b'));
+
+      await sendWebhook(event1);
+      await sendWebhook(event2);
+
+      // event1 is redelivered after event2 replaced its stripeEventId. Only this
+      // process's recent-event cache recognises it; the database guard would not.
+      const res = await sendWebhook(event1);
+      expect(res.status).toBe(200);
+
+      // Only the two original deliveries reached Stripe
+      expect(mockSubscriptionsRetrieve).toHaveBeenCalledTimes(2);
+
+      const sub = await prisma.subscription.findFirst({ where: { userId: TEST_USER_ID } });
+      expect(sub?.stripeSubscriptionId).toBe('sub_004b');
+      expect(sub?.stripeEventId).toBe('evt_idem_004b');
+    });
   });
 });
@@ -0,0 +1,38 @@
+import { describe, it, expect } from '@jest/globals';
+import { BoundedSet } from '../src/lib/boundedSet.js';
+
+describe('BoundedSet', () => {
+  it('remembers values up to its capacity', () => {
+    const set = new BoundedSet<string>(3);
+    set.add('a');
+    set.add('b');
+    set.add('c');
+
+    expect(set.size).toBe(3);
+    expect(['a', 'b', 'c'].every((v) => set.has(v))).toBe(true);
+    expect(set.has('d')).toBe(false);
+  });
+
+  it('evicts the oldest value when a new one is added to a full set', () => {
+    const set = new BoundedSet<string>(2);
+    set.add('a');
+    set.add('b');
+    set.add('c');
+
+    expect(set.size).toBe(2);
+    expect(set.has('a')).toBe(false);
+    expect(set.has('b')).toBe(true);
+    expect(set.has('c')).toBe(true);
+  });
+
+  it('does not evict anything when re-adding a value it already holds', () => {
+    const set = new BoundedSet<string>(2);
+    set.add('a');
+    set.add('b');
+    set.add('b');
+
+    expect(set.size).toBe(2);
+    expect(set.has('a')).toBe(true);
+    expect(set.has('b')).toBe(true);
+  });
+});
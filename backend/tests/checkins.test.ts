@@ -138,6 +138,33 @@ describe('Daily Check-ins API', () => {
       expect(res.body.total).toBeGreaterThanOrEqual(1);
     });
 
+    it('pages with a date cursor without repeating rows', async () => {
+      const first = await request(app)
+        .get('/api/checkins?limit=1')
+        .set('Cookie', authCookie);
+
+      expect(first.status).toBe(200);
+      expect(first.body.checkins).toHaveLength(1);
+      expect(typeof first.body.nextCursor).toBe('string');
+
+      const second = await request(app)
+        .get(`/api/checkins?limit=1&cursor=${first.body.nextCursor}`)
+        .set('Cookie', authCookie);
+
+      expect(second.status).toBe(200);
+      const ids = second.body.checkins.map((c: { id: string }) => c.id);
+      expect(ids).not.toContain(first.body.checkins[0].id);
+      expect(second.body.total).toBe(first.body.total);
+    });
+
+    it('rejects an invalid cursor', async () => {
+      const res = await request(app)
+        .get('/api/checkins?cursor=not-a-date')
+        .set('Cookie', authCookie);
+
+      expect(res.status).toBe(400);
+    });
+
     it('filters by date range', async () => {
       const today = new Date().toISOString().slice(0, 10);
       const res = await request(app)
@@ -0,0 +1,53 @@
+import { describe, it, expect } from '@jest/globals';
+import { mapWithConcurrency } from '../src/lib/concurrency.js';
+
+function delay(ms: number): Promise<void> {
+  return new Promise((resolve) => setTimeout(resolve, ms));
+}
+
+describe('mapWithConcurrency', () => {
+  it('returns an empty array for no items', async () => {
+    await expect(mapWithConcurrency([], 4, async (x) => x)).resolves.toEqual([]);
+  });
+
+  it('preserves input order regardless of completion order', async () => {
+    const result = await mapWithConcurrency([30, 10, 20], 3, async (ms) => {
+      await delay(ms);
+      return ms * 2;
+    });
+    expect(result).toEqual([60, 20, 40]);
+  });
+
+  it('never exceeds the concurrency limit', async () => {
+    let inFlight = 0;
+    let peak = 0;
+    await mapWithConcurrency(Array.from({ length: 10 }, (_, i) => i), 3, async () => {
+      inFlight++;
+      peak = Math.max(peak, inFlight);
+      await delay(5);
+      inFlight--;
+    });
+    expect(peak).toBe(3);
+  });
+
+  it('treats a limit below 1 as serial execution', async () => {
+    let inFlight = 0;
+    let peak = 0;
+    await mapWithConcurrency([1, 2, 3], 0, async () => {
+      inFlight++;
+      peak = Math.max(peak, inFlight);
+      await delay(1);
+      inFlight--;
+    });
+    expect(peak).toBe(1);
+  });
+
+  it('rejects when a worker throws', async () => {
+    await expect(
+      mapWithConcurrency([1, 2], 2, async (x) => {
+        if (x === 2) throw new Error('boom');
+        return x;
+      }),
+    ).rejects.toThrow('boom');
+  });
+});
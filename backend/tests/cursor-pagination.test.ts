@@ -249,6 +249,14 @@ describe('Cursor-based Pagination', () => {
             expect(res.body.length).toBe(25);
         });
 
+        it('rejects a malformed cursor with 400', async () => {
+            const res = await request(app)
+                .get('/api/tasks?cursor=not-a-uuid&limit=5')
+                .set('Cookie', authCookie);
+
+            expect(res.status).toBe(400);
+        });
+
         it('backward compat: offset-based pagination still works', async () => {
             const res = await request(app)
                 .get('/api/tasks?page=1&limit=10')
@@ -342,6 +350,14 @@ describe('Cursor-based Pagination', () => {
             expect(res.body.pagination.limit).toBe(100);
         });
 
+        it('rejects a malformed cursor with 400', async () => {
+            const res = await request(app)
+                .get('/api/notifications?cursor=not-a-uuid&limit=5')
+                .set('Cookie', authCookie);
+
+            expect(res.status).toBe(400);
+        });
+
         it('backward compat: raw array without cursor param', async () => {
             const res = await request(app)
                 .get('/api/notifications')
@@ -416,6 +432,14 @@ describe('Cursor-based Pagination', () => {
             expect(allIds.length).toBeGreaterThanOrEqual(2);
         });
 
+        it('rejects a malformed cursor with 400', async () => {
+            const res = await request(app)
+                .get(`/api/tasks/${taskId}/activity?cursor=not-a-uuid&limit=3`)
+                .set('Cookie', authCookie);
+
+            expect(res.status).toBe(400);
+        });
+
         it('backward compat: raw array without cursor param', async () => {
             const res = await request(app)
                 .get(`/api/tasks/${taskId}/activity`)
@@ -443,4 +467,65 @@ describe('Cursor-based Pagination', () => {
             expect(res.status).toBe(404);
         });
     });
+
+    // ==========================================
+    // Projects cursor-based pagination
+    // ==========================================
+    describe('GET /api/projects (cursor-based)', () => {
+        beforeAll(async () => {
+            // 6 more projects alongside the suite's own one, 1 min apart
+            for (let i = 0; i < 6; i++) {
+                await prisma.project.create({
+                    data: {
+                        name: `Cursor Project ${i + 1}`,
+                        ownerId: userId,
+                        members: { create: { userId, role: 'OWNER' } },
+                        createdAt: new Date(Date.now() - (6 - i) * 60000),
+                    },
+                });
+            }
+        });
+
+        it('pages through all projects without duplication', async () => {
+            const allIds: string[] = [];
+            let cursor: string | undefined;
+
+            for (let i = 0; i < 10; i++) {
+                const res = await request(app)
+                    .get(`/api/projects?cursor=${cursor ?? ''}&limit=3`)
+                    .set('Cookie', authCookie);
+
+                expect(res.status).toBe(200);
+                expect(res.body.pagination.total).toBe(7);
+                allIds.push(...res.body.data.map((p: any) => p.id));
+
+                if (!res.body.pagination.hasMore) {
+                    expect(res.body.pagination.nextCursor).toBeNull();
+                    break;
+                }
+                cursor = res.body.pagination.nextCursor;
+            }
+
+            expect(allIds.length).toBe(7);
+            expect(new Set(allIds).size).toBe(7);
+        });
+
+        it('rejects a malformed cursor with 400', async () => {
+            const res = await request(app)
+                .get('/api/projects?cursor=not-a-uuid&limit=3')
+                .set('Cookie', authCookie);
+
+            expect(res.status).toBe(400);
+        });
+
+        it('backward compat: offset-based pagination still works', async () => {
+            const res = await request(app)
+                .get('/api/projects?page=1&limit=3')
+                .set('Cookie', authCookie);
+
+            expect(res.status).toBe(200);
+            expect(res.body.data.length).toBe(3);
+            expect(res.body.pagination.totalPages).toBe(3);
+        });
+    });
 });
@@ -123,4 +123,49 @@ describe('Export API', () => {
             expect(res.status).toBe(403);
         });
     });
+
+    describe('GET /api/export/tasks (multiple batches)', () => {
+        let bulkProjectId: string;
+
+        beforeAll(async () => {
+            const proj = await prisma.project.create({
+                data: {
+                    name: 'Export Bulk Project',
+                    ownerId: userId,
+                    members: { create: { userId, role: 'OWNER' } },
+                },
+            });
+            bulkProjectId = proj.id;
+
+            // Two full 500-row batches plus a short tail
+            await prisma.task.createMany({
+                data: Array.from({ length: 1001 }, (_, i) => ({
+                    title: `Bulk Export ${i}`,
+                    projectId: bulkProjectId,
+                    creatorId: userId,
+                })),
+            });
+        });
+
+        it('streams every task exactly once as valid JSON', async () => {
+            const res = await request(app)
+                .get(`/api/export/tasks?format=json&projectId=${bulkProjectId}`)
+                .set('Cookie', authCookie);
+
+            expect(res.status).toBe(200);
+            expect(res.body.length).toBe(1001);
+            expect(new Set(res.body.map((t: { title: string }) => t.title)).size).toBe(1001);
+        });
+
+        it('streams every task exactly once as CSV', async () => {
+            const res = await request(app)
+                .get(`/api/export/tasks?projectId=${bulkProjectId}`)
+                .set('Cookie', authCookie);
+
+            expect(res.status).toBe(200);
+            const lines = res.text.split('\n');
+            expect(lines.length).toBe(1002); // header + rows
+            expect(new Set(lines.slice(1)).size).toBe(1001);
+        });
+    });
 });
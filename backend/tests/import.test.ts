@@ -404,6 +404,25 @@ describe('Milestone Import API', () => {
       expect(dep).not.toBeNull();
     });
 
+    it('creates a dependency listed twice only once, without a warning', async () => {
+      const res = await request(app)
+        .post('/api/import/milestones')
+        .set('Cookie', ownerCookie)
+        .send({
+          project: projectName,
+          milestones: [
+            { title: 'Dep D' },
+            { title: 'Dep E', dependsOn: ['Dep D', 'dep d'] },
+          ],
+        });
+      expect(res.status).toBe(201);
+      expect(res.body.warnings).toEqual([]);
+
+      const taskE = res.body.tasks.find((t: { title: string }) => t.title === 'Dep E');
+      const deps = await prisma.taskDependency.count({ where: { taskId: taskE.id } });
+      expect(deps).toBe(1);
+    });
+
     it('warns on missing dependency title', async () => {
       const res = await request(app)
         .post('/api/import/milestones')
@@ -0,0 +1,30 @@
+import { describe, it, expect } from '@jest/globals';
+import { createBufferedLogStream } from '../src/lib/logStream.js';
+
+const nextTurn = () => new Promise((resolve) => setImmediate(resolve));
+
+describe('createBufferedLogStream', () => {
+  it('coalesces lines written in the same turn into one write', async () => {
+    const writes: string[] = [];
+    const stream = createBufferedLogStream({ write: (chunk: string) => writes.push(chunk) });
+
+    stream.write('GET / 200\n');
+    stream.write('GET /health 200\n');
+    expect(writes).toEqual([]);
+
+    await nextTurn();
+    expect(writes).toEqual(['GET / 200\nGET /health 200\n']);
+  });
+
+  it('starts a fresh batch after each flush', async () => {
+    const writes: string[] = [];
+    const stream = createBufferedLogStream({ write: (chunk: string) => writes.push(chunk) });
+
+    stream.write('first\n');
+    await nextTurn();
+    stream.write('second\n');
+    await nextTurn();
+
+    expect(writes).toEqual(['first\n', 'second\n']);
+  });
+});
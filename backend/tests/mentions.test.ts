@@ -3,7 +3,7 @@
  *
  * parseMentions   — pure function, no mocking required
  * resolveMentions — requires prisma mock (projectMember.findMany)
- * notifyMentions  — requires createNotification mock from notifications.js
+ * notifyMentions  — requires createNotifications mock from notifications.js
  */
 
 import { jest, describe, it, expect, beforeAll, beforeEach } from '@jest/globals';
@@ -22,10 +22,10 @@ jest.unstable_mockModule('../src/lib/prisma.js', () => ({
 
 // ─── Mock notifications ───────────────────────────────────────────────────────
 
-const mockCreateNotification = jest.fn();
+const mockCreateNotifications = jest.fn();
 
 jest.unstable_mockModule('../src/lib/notifications.js', () => ({
-  createNotification: mockCreateNotification,
+  createNotifications: mockCreateNotifications,
 }));
 
 // ─── Dynamic imports ──────────────────────────────────────────────────────────
@@ -46,8 +46,8 @@ beforeAll(async () => {
 
 beforeEach(() => {
   mockFindMany.mockReset();
-  mockCreateNotification.mockReset();
-  mockCreateNotification.mockResolvedValue({ id: 'notif-1' });
+  mockCreateNotifications.mockReset();
+  mockCreateNotifications.mockResolvedValue([{ id: 'notif-1' }]);
 });
 
 // ─── parseMentions (pure) ─────────────────────────────────────────────────────
@@ -184,18 +184,23 @@ describe('notifyMentions', () => {
   const TASK_TITLE  = 'Fix the bug';
   const PROJECT_ID  = 'proj-1';
 
+  // Notifications passed to the single createNotifications call
+  // eslint-disable-next-line @typescript-eslint/no-explicit-any
+  const created = (): any[] => mockCreateNotifications.mock.calls[0][0] as any[];
+
   it('does nothing when mentionedUsers is empty', async () => {
     await notifyMentions([], AUTHOR_ID, AUTHOR_NAME, TASK_ID, TASK_TITLE, PROJECT_ID);
-    expect(mockCreateNotification).not.toHaveBeenCalled();
+    expect(mockCreateNotifications).not.toHaveBeenCalled();
   });
 
-  it('calls createNotification once per mentioned user', async () => {
+  it('creates every mention in a single createNotifications call', async () => {
     const users = [
       { id: 'u1', name: 'Alice' },
       { id: 'u2', name: 'Bob' },
     ];
     await notifyMentions(users, AUTHOR_ID, AUTHOR_NAME, TASK_ID, TASK_TITLE, PROJECT_ID);
-    expect(mockCreateNotification).toHaveBeenCalledTimes(2);
+    expect(mockCreateNotifications).toHaveBeenCalledTimes(1);
+    expect(created().map((n) => n.userId)).toEqual(['u1', 'u2']);
   });
 
   it('skips self-mentions (mentionedUser.id === authorId)', async () => {
@@ -204,10 +209,8 @@ describe('notifyMentions', () => {
       { id: 'u2', name: 'Bob' },
     ];
     await notifyMentions(users, AUTHOR_ID, AUTHOR_NAME, TASK_ID, TASK_TITLE, PROJECT_ID);
-    expect(mockCreateNotification).toHaveBeenCalledTimes(1);
-    expect(mockCreateNotification).toHaveBeenCalledWith(
-      expect.objectContaining({ userId: 'u2' }),
-    );
+    expect(created()).toHaveLength(1);
+    expect(created()[0]).toEqual(expect.objectContaining({ userId: 'u2' }));
   });
 
   it('creates a MENTION type notification', async () => {
@@ -215,9 +218,7 @@ describe('notifyMentions', () => {
       [{ id: 'u1', name: 'Alice' }],
       AUTHOR_ID, AUTHOR_NAME, TASK_ID, TASK_TITLE, PROJECT_ID,
     );
-    expect(mockCreateNotification).toHaveBeenCalledWith(
-      expect.objectContaining({ type: 'MENTION' }),
-    );
+    expect(created()[0]).toEqual(expect.objectContaining({ type: 'MENTION' }));
   });
 
   it('sets notification title to "You were mentioned"', async () => {
@@ -225,9 +226,7 @@ describe('notifyMentions', () => {
       [{ id: 'u1', name: 'Alice' }],
       AUTHOR_ID, AUTHOR_NAME, TASK_ID, TASK_TITLE, PROJECT_ID,
     );
-    expect(mockCreateNotification).toHaveBeenCalledWith(
-      expect.objectContaining({ title: 'You were mentioned' }),
-    );
+    expect(created()[0]).toEqual(expect.objectContaining({ title: 'You were mentioned' }));
   });
 
   it('includes the author name and task title in the notification message', async () => {
@@ -235,17 +234,17 @@ describe('notifyMentions', () => {
       [{ id: 'u1', name: 'Alice' }],
       AUTHOR_ID, AUTHOR_NAME, TASK_ID, TASK_TITLE, PROJECT_ID,
     );
-    const call = mockCreateNotification.mock.calls[0][0] as { message: string };
-    expect(call.message).toContain(AUTHOR_NAME);
-    expect(call.message).toContain(TASK_TITLE);
+    const { message } = created()[0] as { message: string };
+    expect(message).toContain(AUTHOR_NAME);
+    expect(message).toContain(TASK_TITLE);
   });
 
-  it('passes taskId and projectId to createNotification', async () => {
+  it('passes taskId and projectId through', async () => {
     await notifyMentions(
       [{ id: 'u1', name: 'Alice' }],
       AUTHOR_ID, AUTHOR_NAME, TASK_ID, TASK_TITLE, PROJECT_ID,
     );
-    expect(mockCreateNotification).toHaveBeenCalledWith(
+    expect(created()[0]).toEqual(
       expect.objectContaining({ taskId: TASK_ID, projectId: PROJECT_ID }),
     );
   });
@@ -253,6 +252,6 @@ describe('notifyMentions', () => {
   it('does not notify when all mentioned users are the author', async () => {
     const users = [{ id: AUTHOR_ID, name: 'Jane Doe' }];
     await notifyMentions(users, AUTHOR_ID, AUTHOR_NAME, TASK_ID, TASK_TITLE, PROJECT_ID);
-    expect(mockCreateNotification).not.toHaveBeenCalled();
+    expect(mockCreateNotifications).not.toHaveBeenCalled();
   });
 });
@@ -1127,6 +1127,24 @@ describe('Phase 3: Tasks & Views', () => {
       expect(res.status).toBe(400);
     });
 
+    it('updates ids spread across more than one IN-list chunk', async () => {
+      // 1000 unknown ids fill the first lookup chunk; the real task lands in the second
+      const unknownIds = Array.from({ length: 1000 }, (_, i) =>
+        `00000000-0000-4000-8000-${i.toString().padStart(12, '0')}`);
+      const res = await request(app)
+        .patch('/api/tasks/bulk-status')
+        .set('Cookie', alice.cookie)
+        .send({ taskIds: [...unknownIds, bulkTask2.id], status: 'IN_REVIEW' });
+
+      expect(res.status).toBe(200);
+      expect(res.body.updated).toBe(1);
+
+      const task2 = await request(app)
+        .get(`/api/tasks/${bulkTask2.id}`)
+        .set('Cookie', alice.cookie);
+      expect(task2.body.status).toBe('IN_REVIEW');
+    });
+
     it('validates status enum → 400', async () => {
       const res = await request(app)
         .patch('/api/tasks/bulk-status')
@@ -351,8 +351,13 @@ describe('Projects API', () => {
   describe('DELETE /api/projects/:id/members/:userId — remove member (OWNER/ADMIN only)', () => {
     let targetUser: { id: string; email: string; cookie: string };
 
+    // Register once for the block (bcrypt hashing dominates setup time);
+    // only the membership is reset between tests.
+    beforeAll(async () => {
+      targetUser = await registerUser('rm-target');
+    });
+
     beforeEach(async () => {
-      targetUser = await registerUser(`rm-target-${Date.now()}`);
       await request(app)
         .post(`/api/projects/${projectId}/members`)
         .set('Cookie', owner.cookie)
@@ -361,6 +366,9 @@ describe('Projects API', () => {
 
     afterEach(async () => {
       await prisma.projectMember.deleteMany({ where: { projectId, userId: targetUser.id } });
+    });
+
+    afterAll(async () => {
       await prisma.user.deleteMany({ where: { id: targetUser.id } });
     });
 
@@ -0,0 +1,151 @@
+/**
+ * Unit tests for src/lib/retention.ts
+ *
+ * Uses jest.unstable_mockModule + dynamic imports (ESM + ts-jest pattern).
+ * No real database required.
+ */
+
+import { jest, describe, it, expect, beforeAll, beforeEach } from '@jest/globals';
+
+// ─── Mock prisma ──────────────────────────────────────────────────────────────
+
+const mockActivityFindMany = jest.fn();
+const mockActivityDeleteMany = jest.fn();
+const mockWebhookLogFindMany = jest.fn();
+const mockWebhookLogDeleteMany = jest.fn();
+
+jest.unstable_mockModule('../src/lib/prisma.js', () => ({
+  default: {
+    activityLog: {
+      findMany: mockActivityFindMany,
+      deleteMany: mockActivityDeleteMany,
+    },
+    webhookLog: {
+      findMany: mockWebhookLogFindMany,
+      deleteMany: mockWebhookLogDeleteMany,
+    },
+  },
+}));
+
+// ─── Dynamic imports after mocks registered ───────────────────────────────────
+
+// eslint-disable-next-line @typescript-eslint/no-explicit-any
+let purgeExpiredActivityLogs: any;
+// eslint-disable-next-line @typescript-eslint/no-explicit-any
+let purgeExpiredWebhookLogs: any;
+
+beforeAll(async () => {
+  const mod = await import('../src/lib/retention.js');
+  purgeExpiredActivityLogs = mod.purgeExpiredActivityLogs;
+  purgeExpiredWebhookLogs = mod.purgeExpiredWebhookLogs;
+});
+
+// ─── Helpers ──────────────────────────────────────────────────────────────────
+
+const BATCH_SIZE = 5000;
+const DAY_MS = 24 * 60 * 60 * 1000;
+
+function ids(count: number, prefix = 'log') {
+  return Array.from({ length: count }, (_, i) => ({ id: `${prefix}-${i}` }));
+}
+
+// deleteMany reports as many rows as it was asked to delete
+function deleteRequested(args: unknown) {
+  const { where } = args as { where: { id: { in: string[] } } };
+  return Promise.resolve({ count: where.id.in.length });
+}
+
+// ─── Setup ────────────────────────────────────────────────────────────────────
+
+beforeEach(() => {
+  mockActivityFindMany.mockReset();
+  mockActivityDeleteMany.mockReset();
+  mockWebhookLogFindMany.mockReset();
+  mockWebhookLogDeleteMany.mockReset();
+
+  mockActivityDeleteMany.mockImplementation(deleteRequested);
+  mockWebhookLogDeleteMany.mockImplementation(deleteRequested);
+});
+
+// ─── purgeExpiredWebhookLogs ──────────────────────────────────────────────────
+
+describe('purgeExpiredWebhookLogs', () => {
+  it('deletes nothing and returns 0 when no logs have expired', async () => {
+    mockWebhookLogFindMany.mockResolvedValue([]);
+
+    const purged = await purgeExpiredWebhookLogs();
+
+    expect(purged).toBe(0);
+    expect(mockWebhookLogFindMany).toHaveBeenCalledTimes(1);
+    expect(mockWebhookLogDeleteMany).not.toHaveBeenCalled();
+  });
+
+  it('keeps deleting full batches until a short batch and sums the counts', async () => {
+    mockWebhookLogFindMany
+      .mockResolvedValueOnce(ids(BATCH_SIZE, 'a'))
+      .mockResolvedValueOnce(ids(BATCH_SIZE, 'b'))
+      .mockResolvedValueOnce(ids(12, 'c'));
+
+    const purged = await purgeExpiredWebhookLogs();
+
+    expect(purged).toBe(2 * BATCH_SIZE + 12);
+    expect(mockWebhookLogFindMany).toHaveBeenCalledTimes(3);
+    expect(mockWebhookLogDeleteMany).toHaveBeenCalledTimes(3);
+    // Each DELETE targets exactly the ids its SELECT returned
+    const lastDelete = mockWebhookLogDeleteMany.mock.calls[2][0] as { where: { id: { in: string[] } } };
+    expect(lastDelete.where.id.in).toEqual(ids(12, 'c').map((r) => r.id));
+  });
+
+  it('stops after an empty batch that follows a full one', async () => {
+    mockWebhookLogFindMany
+      .mockResolvedValueOnce(ids(BATCH_SIZE))
+      .mockResolvedValueOnce([]);
+
+    const purged = await purgeExpiredWebhookLogs();
+
+    expect(purged).toBe(BATCH_SIZE);
+    expect(mockWebhookLogFindMany).toHaveBeenCalledTimes(2);
+    expect(mockWebhookLogDeleteMany).toHaveBeenCalledTimes(1);
+  });
+
+  it('only selects logs older than 90 days, in batches of the purge size', async () => {
+    mockWebhookLogFindMany.mockResolvedValue([]);
+
+    const before = Date.now();
+    await purgeExpiredWebhookLogs();
+    const after = Date.now();
+
+    const args = mockWebhookLogFindMany.mock.calls[0][0] as {
+      where: { createdAt: { lt: Date } };
+      select: unknown;
+      take: number;
+    };
+    const cutoff = args.where.createdAt.lt.getTime();
+    expect(cutoff).toBeGreaterThanOrEqual(before - 90 * DAY_MS);
+    expect(cutoff).toBeLessThanOrEqual(after - 90 * DAY_MS);
+    expect(args.select).toEqual({ id: true });
+    expect(args.take).toBe(BATCH_SIZE);
+  });
+});
+
+// ─── purgeExpiredActivityLogs ─────────────────────────────────────────────────
+
+describe('purgeExpiredActivityLogs', () => {
+  it('only selects activity older than 180 days and deletes it by id', async () => {
+    mockActivityFindMany.mockResolvedValueOnce(ids(3));
+
+    const before = Date.now();
+    const purged = await purgeExpiredActivityLogs();
+    const after = Date.now();
+
+    expect(purged).toBe(3);
+    const args = mockActivityFindMany.mock.calls[0][0] as { where: { createdAt: { lt: Date } } };
+    const cutoff = args.where.createdAt.lt.getTime();
+    expect(cutoff).toBeGreaterThanOrEqual(before - 180 * DAY_MS);
+    expect(cutoff).toBeLessThanOrEqual(after - 180 * DAY_MS);
+    expect(mockActivityDeleteMany).toHaveBeenCalledWith({
+      where: { id: { in: ['log-0', 'log-1', 'log-2'] } },
+    });
+    expect(mockWebhookLogFindMany).not.toHaveBeenCalled();
+  });
+});
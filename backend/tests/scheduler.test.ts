@@ -0,0 +1,95 @@
+/**
+ * Unit tests for src/lib/scheduler.ts
+ *
+ * Uses jest.unstable_mockModule to capture the cron callbacks and stub the
+ * jobs they run. No real cron timers or database required.
+ */
+
+import { jest, describe, it, expect, beforeAll, beforeEach, afterEach } from '@jest/globals';
+
+// ─── Mock node-cron, recurrence and retention ─────────────────────────────────
+
+const mockSchedule = jest.fn();
+const mockGenerateAllDueRecurringTasks = jest.fn();
+const mockPurgeExpiredActivityLogs = jest.fn();
+const mockPurgeExpiredWebhookLogs = jest.fn();
+
+jest.unstable_mockModule('node-cron', () => ({
+  default: { schedule: mockSchedule },
+}));
+
+jest.unstable_mockModule('../src/lib/recurrence.js', () => ({
+  generateAllDueRecurringTasks: mockGenerateAllDueRecurringTasks,
+}));
+
+jest.unstable_mockModule('../src/lib/retention.js', () => ({
+  purgeExpiredActivityLogs: mockPurgeExpiredActivityLogs,
+  purgeExpiredWebhookLogs: mockPurgeExpiredWebhookLogs,
+}));
+
+// ─── Dynamic import after mocks registered ────────────────────────────────────
+
+// eslint-disable-next-line @typescript-eslint/no-explicit-any
+let startScheduler: any;
+
+beforeAll(async () => {
+  const mod = await import('../src/lib/scheduler.js');
+  startScheduler = mod.startScheduler;
+});
+
+// ─── Helpers ──────────────────────────────────────────────────────────────────
+
+const RETENTION_SCHEDULE = '30 3 * * *';
+
+function retentionJob(): () => Promise<void> {
+  const call = mockSchedule.mock.calls.find(([expr]) => expr === RETENTION_SCHEDULE);
+  if (!call) throw new Error('retention job was not scheduled');
+  return call[1] as () => Promise<void>;
+}
+
+// ─── Setup ────────────────────────────────────────────────────────────────────
+
+beforeEach(() => {
+  mockSchedule.mockReset();
+  mockPurgeExpiredActivityLogs.mockReset();
+  mockPurgeExpiredWebhookLogs.mockReset();
+  jest.spyOn(console, 'log').mockImplementation(() => {});
+  jest.spyOn(console, 'error').mockImplementation(() => {});
+});
+
+afterEach(() => {
+  jest.restoreAllMocks();
+});
+
+// ─── Log retention job ────────────────────────────────────────────────────────
+
+describe('log retention job', () => {
+  it('is scheduled once a day', () => {
+    startScheduler();
+
+    expect(mockSchedule).toHaveBeenCalledWith(RETENTION_SCHEDULE, expect.any(Function));
+  });
+
+  it('purges both log tables and reports the counts', async () => {
+    mockPurgeExpiredActivityLogs.mockResolvedValue(7);
+    mockPurgeExpiredWebhookLogs.mockResolvedValue(3);
+    startScheduler();
+
+    await retentionJob()();
+
+    expect(mockPurgeExpiredActivityLogs).toHaveBeenCalledTimes(1);
+    expect(mockPurgeExpiredWebhookLogs).toHaveBeenCalledTimes(1);
+    expect(console.log).toHaveBeenCalledWith('[Scheduler] Purged 7 activity logs and 3 webhook logs');
+  });
+
+  it('logs a failed purge instead of throwing', async () => {
+    const failure = new Error('db down');
+    mockPurgeExpiredActivityLogs.mockResolvedValue(0);
+    mockPurgeExpiredWebhookLogs.mockRejectedValue(failure);
+    startScheduler();
+
+    await expect(retentionJob()()).resolves.toBeUndefined();
+
+    expect(console.error).toHaveBeenCalledWith('[Scheduler] Error purging expired logs:', failure);
+  });
+});
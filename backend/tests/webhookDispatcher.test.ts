@@ -11,7 +11,6 @@ import { jest, describe, it, expect, beforeAll, beforeEach, afterEach } from '@j
 
 const mockFindMany   = jest.fn();
 const mockUpsert     = jest.fn();
-const mockDeleteMany = jest.fn();
 const mockWebhookUpdate = jest.fn();
 
 jest.unstable_mockModule('../src/lib/prisma.js', () => ({
@@ -21,8 +20,7 @@ jest.unstable_mockModule('../src/lib/prisma.js', () => ({
       update:   mockWebhookUpdate,
     },
     webhookLog: {
-      upsert:     mockUpsert,
-      deleteMany: mockDeleteMany,
+      upsert: mockUpsert,
     },
   },
 }));
@@ -74,12 +72,10 @@ let fetchSpy: ReturnType<typeof jest.spyOn>;
 beforeEach(() => {
   mockFindMany.mockReset();
   mockUpsert.mockReset();
-  mockDeleteMany.mockReset();
   mockWebhookUpdate.mockReset();
 
   // Default: clean/successful DB responses
   mockUpsert.mockResolvedValue({});
-  mockDeleteMany.mockResolvedValue({ count: 0 });
   mockWebhookUpdate.mockResolvedValue({ id: 'wh-1', failureCount: 0 });
 
   // Spy on global fetch
@@ -121,6 +117,7 @@ describe('dispatchWebhooks — webhook lookup', () => {
     await dispatchWebhooks('task.created', { id: 't1' }, 'user-1');
     expect(mockFindMany).toHaveBeenCalledWith({
       where: { userId: 'user-1', active: true, events: { has: 'task.created' } },
+      select: { id: true, url: true, secret: true },
     });
   });
 
@@ -200,6 +197,16 @@ describe('dispatchWebhooks — HTTP delivery', () => {
     expect(body.deliveryId).toBeDefined();
     expect(body.timestamp).toBeDefined();
   });
+
+  it('omits the data field when there is no payload', async () => {
+    fetchSpy.mockResolvedValue(okResponse());
+    await dispatchWebhooks('task.deleted', undefined, 'user-1');
+    await flushAsync();
+    const [, opts] = fetchSpy.mock.calls[0] as [string, RequestInit];
+    const body = JSON.parse(opts.body as string);
+    expect(body.event).toBe('task.deleted');
+    expect(body).not.toHaveProperty('data');
+  });
 });
 
 // ─── dispatchWebhooks — success path ─────────────────────────────────────────
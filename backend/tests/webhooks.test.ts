@@ -3,6 +3,7 @@ import { PrismaClient } from '@prisma/client';
 import http from 'http';
 import crypto from 'crypto';
 import app from '../src/app';
+import { purgeExpiredWebhookLogs } from '../src/lib/retention';
 
 const prisma = new PrismaClient();
 
@@ -639,7 +640,7 @@ describe('Webhooks', () => {
   });
 
   // -------------------------------------------------------
-  // 5. Log Retention (90-day cleanup)
+  // 5. Log Retention (90-day purge)
   // -------------------------------------------------------
   describe('Log Retention', () => {
     let retentionWebhookId: string;
@@ -649,8 +650,8 @@ describe('Webhooks', () => {
       await prisma.webhookLog.deleteMany();
       await prisma.webhook.deleteMany({ where: { userId: user1.id } });
 
-      // Insert the retention webhook directly via Prisma (bypasses SSRF validation
-      // intentionally — this test needs a local server to receive deliveries)
+      // Insert the retention webhook directly via Prisma; the tests below write
+      // its logs directly and run the purge that the daily scheduler job calls
       const retentionSecret = crypto.randomBytes(32).toString('hex');
       const created = await prisma.webhook.create({
         data: {
@@ -661,47 +662,34 @@ describe('Webhooks', () => {
         },
       });
       retentionWebhookId = created.id;
-      receivedRequests = [];
     });
 
-    it('should delete logs older than 90 days after a new delivery', async () => {
-      // Insert 3 old log entries with createdAt > 90 days ago
+    it('should purge logs older than 90 days and keep newer ones', async () => {
       const oldDate = new Date(Date.now() - 91 * 24 * 60 * 60 * 1000);
+      const recentDate = new Date(Date.now() - 89 * 24 * 60 * 60 * 1000);
       await prisma.webhookLog.createMany({
         data: [
           { webhookId: retentionWebhookId, event: 'task.created', statusCode: 200, createdAt: oldDate },
           { webhookId: retentionWebhookId, event: 'task.created', statusCode: 200, createdAt: oldDate },
           { webhookId: retentionWebhookId, event: 'task.created', error: 'timeout', createdAt: oldDate },
+          { webhookId: retentionWebhookId, event: 'task.updated', statusCode: 200, createdAt: recentDate },
+          { webhookId: retentionWebhookId, event: 'task.deleted', statusCode: 200 },
         ],
       });
 
-      // Verify the old logs are in the DB before triggering a delivery
-      const beforeCount = await prisma.webhookLog.count({ where: { webhookId: retentionWebhookId } });
-      expect(beforeCount).toBe(3);
+      const purged = await purgeExpiredWebhookLogs();
+      expect(purged).toBe(3);
 
-      // Trigger a new delivery by creating a task (fires task.created)
-      const taskRes = await request(app)
-        .post('/api/tasks')
-        .set('Cookie', user1.cookie)
-        .send({ title: 'Retention test task', projectId });
-      expect(taskRes.status).toBe(201);
-
-      // Wait for the fire-and-forget delivery AND the async cleanup to complete
-      await new Promise((r) => setTimeout(r, 1000));
-
-      // Old logs (>90 days) should have been deleted; only the new log remains
+      // Only the logs inside the 90-day window remain
       const remainingLogs = await prisma.webhookLog.findMany({
         where: { webhookId: retentionWebhookId },
         orderBy: { createdAt: 'desc' },
       });
+      expect(remainingLogs.map((l) => l.event)).toEqual(['task.deleted', 'task.updated']);
+    });
 
-      const cutoff = new Date(Date.now() - 90 * 24 * 60 * 60 * 1000);
-      const oldLogsRemaining = remainingLogs.filter((l) => l.createdAt < cutoff);
-      expect(oldLogsRemaining).toHaveLength(0);
-
-      // The new delivery log should be present
-      expect(remainingLogs.length).toBeGreaterThanOrEqual(1);
-      expect(remainingLogs[0].event).toBe('task.created');
+    it('should return 0 when nothing has expired', async () => {
+      expect(await purgeExpiredWebhookLogs()).toBe(0);
     });
   });
 });
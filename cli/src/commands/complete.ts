@@ -1,12 +1,13 @@
 import { Command } from 'commander';
 import chalk from 'chalk';
-import { api } from '../api/client.js';
 
 export const completeCommand = new Command('complete')
     .description('Mark task as completed')
     .argument('<id>', 'Task ID (short or full)')
     .action(async (id) => {
         try {
+            const { api } = await import('../api/client.js');
+
             // If short ID provided, search for full ID
             let taskId = id;
             if (id.length < 36) {
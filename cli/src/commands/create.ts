@@ -1,6 +1,5 @@
 import { Command } from 'commander';
 import chalk from 'chalk';
-import { api } from '../api/client.js';
 import { parseISO, addDays, addWeeks, addMonths, format } from 'date-fns';
 
 export const createCommand = new Command('create')
@@ -13,6 +12,8 @@ export const createCommand = new Command('create')
     .option('-a, --assignee <id>', 'Assignee user ID')
     .action(async (title, options) => {
         try {
+            const { api } = await import('../api/client.js');
+
             if (!title) {
                 console.error(chalk.red('Task title is required'));
                 console.log(chalk.gray('Usage: taskman create "Task title" [options]'));
@@ -1,7 +1,5 @@
 import { Command } from 'commander';
 import chalk from 'chalk';
-import { api } from '../api/client.js';
-import { createTaskTable } from '../utils/formatting.js';
 
 export const listCommand = new Command('list')
     .description('List tasks')
@@ -12,6 +10,11 @@ export const listCommand = new Command('list')
     .option('--limit <number>', 'Limit number of results', '20')
     .action(async (options) => {
         try {
+            const [{ api }, { createTaskTable }] = await Promise.all([
+                import('../api/client.js'),
+                import('../utils/formatting.js'),
+            ]);
+
             const params: any = {};
 
             // Build query params
@@ -27,20 +30,16 @@ export const listCommand = new Command('list')
                 return;
             }
 
-            // Filter by project name if provided (client-side)
-            let filteredTasks = tasks;
-            if (options.project) {
-                filteredTasks = tasks.filter(task =>
-                    task.project?.name?.toLowerCase().includes(options.project.toLowerCase())
-                );
-            }
-
-            // Filter by assignee email if provided (client-side)
-            if (options.assignee) {
-                filteredTasks = filteredTasks.filter(task =>
-                    task.assignee?.email?.toLowerCase().includes(options.assignee.toLowerCase())
-                );
-            }
+            // Filter by project name and/or assignee email if provided (client-side).
+            // Lowercase the needles once and apply both filters in a single pass.
+            const projectNeedle: string | undefined = options.project?.toLowerCase();
+            const assigneeNeedle: string | undefined = options.assignee?.toLowerCase();
+            const filteredTasks = projectNeedle || assigneeNeedle
+                ? tasks.filter(task =>
+                    (!projectNeedle || task.project?.name?.toLowerCase().includes(projectNeedle)) &&
+                    (!assigneeNeedle || task.assignee?.email?.toLowerCase().includes(assigneeNeedle))
+                )
+                : tasks;
 
             if (filteredTasks.length === 0) {
                 console.log(chalk.yellow('No tasks match your filters'));
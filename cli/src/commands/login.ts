@@ -1,13 +1,16 @@
 import { Command } from 'commander';
 import chalk from 'chalk';
-import { api } from '../api/client.js';
-import { config } from '../config/store.js';
-import { promptForText } from '../utils/prompts.js';
 
 export const loginCommand = new Command('login')
     .description('Configure API credentials')
     .action(async () => {
         try {
+            const [{ api }, { config }, { promptForText }] = await Promise.all([
+                import('../api/client.js'),
+                import('../config/store.js'),
+                import('../utils/prompts.js'),
+            ]);
+
             console.log(chalk.bold('\n🔐 TaskMan CLI Login\n'));
 
             // Prompt for base URL
@@ -1,12 +1,15 @@
 import { Command } from 'commander';
 import chalk from 'chalk';
-import { api } from '../api/client.js';
-import { createProjectTable } from '../utils/formatting.js';
 
 export const projectsCommand = new Command('projects')
     .description('List projects')
     .action(async () => {
         try {
+            const [{ api }, { createProjectTable }] = await Promise.all([
+                import('../api/client.js'),
+                import('../utils/formatting.js'),
+            ]);
+
             const projects = await api.get<any[]>('/projects');
 
             if (!Array.isArray(projects) || projects.length === 0) {
@@ -1,13 +1,16 @@
 import { Command } from 'commander';
 import chalk from 'chalk';
-import { api } from '../api/client.js';
-import { formatPriority, formatStatus, formatDate } from '../utils/formatting.js';
 
 export const showCommand = new Command('show')
     .description('Show task details')
     .argument('<id>', 'Task ID (short or full)')
     .action(async (id) => {
         try {
+            const [{ api }, { formatPriority, formatStatus, formatDate }] = await Promise.all([
+                import('../api/client.js'),
+                import('../utils/formatting.js'),
+            ]);
+
             // If short ID provided, we need to search for it
             let taskId = id;
             if (id.length < 36) {
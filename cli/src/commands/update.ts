@@ -1,6 +1,5 @@
 import { Command } from 'commander';
 import chalk from 'chalk';
-import { api } from '../api/client.js';
 
 export const updateCommand = new Command('update')
     .description('Update a task')
@@ -13,6 +12,8 @@ export const updateCommand = new Command('update')
     .option('--due <date>', 'New due date (YYYY-MM-DD)')
     .action(async (id, options) => {
         try {
+            const { api } = await import('../api/client.js');
+
             // If short ID provided, search for full ID
             let taskId = id;
             if (id.length < 36) {
@@ -8,6 +8,9 @@ interface ConfigSchema {
 
 class ConfigStore {
     private store: Conf<ConfigSchema>;
+    // Conf re-reads and parses the config file on every get(); keep one parsed
+    // snapshot and drop it whenever this process writes
+    private cache: ConfigSchema | undefined;
 
     constructor() {
         this.store = new Conf<ConfigSchema>({
@@ -18,24 +21,30 @@ class ConfigStore {
         });
     }
 
+    private get values(): ConfigSchema {
+        return (this.cache ??= this.store.store);
+    }
+
     get apiKey(): string | undefined {
-        return this.store.get('apiKey');
+        return this.values.apiKey;
     }
 
     set apiKey(value: string) {
         this.store.set('apiKey', value);
+        this.cache = undefined;
     }
 
     get baseUrl(): string {
-        return this.store.get('baseUrl') || 'http://localhost:3000';
+        return this.values.baseUrl || 'http://localhost:3000';
     }
 
     set baseUrl(value: string) {
         this.store.set('baseUrl', value);
+        this.cache = undefined;
     }
 
     get defaultProjectId(): string | undefined {
-        return this.store.get('defaultProjectId');
+        return this.values.defaultProjectId;
     }
 
     set defaultProjectId(value: string | undefined) {
@@ -44,10 +53,12 @@ class ConfigStore {
         } else {
             this.store.delete('defaultProjectId');
         }
+        this.cache = undefined;
     }
 
     clear(): void {
         this.store.clear();
+        this.cache = undefined;
     }
 
     getConfigPath(): string {
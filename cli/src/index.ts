@@ -16,7 +16,9 @@ program
     .description(chalk.cyan('TaskMan CLI - Manage tasks from your terminal'))
     .version('1.0.0');
 
-// Register commands
+// Register commands. Each command imports its heavy dependencies (axios, conf,
+// inquirer, cli-table3) inside its action, so `--help`/`--version` and any one
+// command only pay for the modules they actually use.
 program.addCommand(loginCommand);
 program.addCommand(createCommand);
 program.addCommand(listCommand);
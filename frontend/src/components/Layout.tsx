@@ -15,6 +15,7 @@ import ThemeToggle from './ThemeToggle';
 import NotificationCenter from './NotificationCenter';
 import ConnectionStatus from './ConnectionStatus';
 import { useSocket } from '../hooks/useSocket';
+import { useSocketStore } from '../store/socket';
 import CommandPalette from './CommandPalette';
 import KeyboardShortcutsModal from './KeyboardShortcutsModal';
 import { useCommandPalette } from '../hooks/useCommandPalette';
@@ -49,6 +50,7 @@ export default function Layout() {
   const { density } = useDensityStore();
   useCommandPalette();
   useSocket();
+  const socketConnected = useSocketStore((s) => s.connected);
 
   // Fetch XP progress
   const { data: xpProgress } = useQuery({
@@ -60,7 +62,9 @@ export default function Layout() {
       if (!res.ok) throw new Error('Failed to fetch XP progress');
       return res.json();
     },
-    refetchInterval: 30000, // Refetch every 30 seconds
+    // XP changes arrive as xpGained/levelUp socket events, so only poll as a
+    // fallback while the socket is down
+    refetchInterval: socketConnected ? false : 30000,
   });
 
   const handleLogout = async () => {
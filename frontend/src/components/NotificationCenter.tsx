@@ -5,11 +5,16 @@ import { formatDistanceToNow } from 'date-fns';
 import clsx from 'clsx';
 import { notificationsApi } from '../lib/api';
 import type { NotificationItem } from '../lib/api';
+import { useSocketStore } from '../store/socket';
 
 export default function NotificationCenter() {
   const [isOpen, setIsOpen] = useState(false);
   const panelRef = useRef<HTMLDivElement>(null);
   const queryClient = useQueryClient();
+  // New notifications are pushed over the socket (notification:new), so polling
+  // is only needed as a fallback while it is disconnected
+  const socketConnected = useSocketStore((s) => s.connected);
+  const pollInterval = socketConnected ? false : 60000;
 
   // Fetch notifications with cursor-based pagination
   const {
@@ -23,7 +28,7 @@ export default function NotificationCenter() {
     queryFn: ({ pageParam }) => notificationsApi.getCursorPaginated(pageParam, 20),
     getNextPageParam: (lastPage) => lastPage.pagination.nextCursor ?? undefined,
     initialPageParam: undefined as string | undefined,
-    refetchInterval: 60000,
+    refetchInterval: pollInterval,
   });
 
   const notifications = useMemo(
@@ -35,7 +40,7 @@ export default function NotificationCenter() {
   const { data: unreadData } = useQuery({
     queryKey: ['notifications', 'unread-count'],
     queryFn: notificationsApi.getUnreadCount,
-    refetchInterval: 60000,
+    refetchInterval: pollInterval,
   });
 
   const unreadCount = unreadData?.count || 0;
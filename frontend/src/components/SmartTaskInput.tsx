@@ -10,7 +10,7 @@ import {
   Check,
   AlertCircle,
 } from 'lucide-react';
-import { parseNaturalLanguage, type ParsedTask } from '../lib/nlpParser';
+import { parseNaturalLanguage, formatDueDate, type ParsedTask } from '../lib/nlpParser';
 import { tasksApi, projectsApi } from '../lib/api';
 import type { Project } from '../types';
 
@@ -166,11 +166,7 @@ export default function SmartTaskInput({
                 {parsed.dueDate && (
                   <span className="inline-flex items-center gap-1 px-2 py-0.5 text-xs rounded-full bg-indigo-50 dark:bg-indigo-900/30 text-indigo-600 dark:text-indigo-400">
                     <Calendar size={11} />
-                    {parsed.dueDate.toLocaleDateString('en-US', {
-                      weekday: 'short',
-                      month: 'short',
-                      day: 'numeric',
-                    })}
+                    {formatDueDate(parsed.dueDate)}
                   </span>
                 )}
                 {parsed.priority && (
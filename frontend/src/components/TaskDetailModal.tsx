@@ -9,6 +9,7 @@ import { useTaskSocket } from '../hooks/useTaskSocket';
 import DependencyPicker from './DependencyPicker';
 import FileAttachments from './FileAttachments';
 import DomainPicker from './DomainPicker';
+import { isProjectAdmin } from '../lib/taskConstants';
 
 export interface TaskFormData {
   title: string;
@@ -95,7 +96,7 @@ export default function TaskDetailModal({
     const membership = p.members?.find((m) => m.userId === currentUserId);
     if (!membership) console.log('TaskDetailModal: no membership for project', p.name, p.id);
     else console.log('TaskDetailModal: membership role', p.name, membership.role);
-    return membership && ['OWNER', 'ADMIN', 'MEMBER'].includes(membership.role);
+    return !!membership && (isProjectAdmin(membership.role) || membership.role === 'MEMBER');
   });
   console.log('TaskDetailModal: writableProjects', writableProjects.length);
   const selectedProject = useMemo(() => projects.find((p) => p.id === form.projectId), [projects, form.projectId]);
@@ -9,6 +9,10 @@ interface WeekViewProps {
 
 const DAY_NAMES = ['Sun', 'Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat'];
 
+// Header range formatters, created once rather than on every render
+const RANGE_START_FORMAT = new Intl.DateTimeFormat('en-US', { month: 'short', day: 'numeric' });
+const RANGE_END_FORMAT = new Intl.DateTimeFormat('en-US', { month: 'short', day: 'numeric', year: 'numeric' });
+
 const PRIORITY_COLORS: Record<string, string> = {
   URGENT: '#ef4444',
   HIGH: '#f97316',
@@ -28,18 +32,6 @@ function getWeekDays(offset: number): Date[] {
   });
 }
 
-function getTasksForDay(day: Date, tasks: Task[]): Task[] {
-  return tasks.filter((t) => {
-    if (!t.dueDate) return false;
-    const due = new Date(t.dueDate);
-    return (
-      due.getFullYear() === day.getFullYear() &&
-      due.getMonth() === day.getMonth() &&
-      due.getDate() === day.getDate()
-    );
-  });
-}
-
 function isToday(day: Date): boolean {
   const today = new Date();
   return (
@@ -58,11 +50,17 @@ export default function WeekView({ tasks, onTaskClick }: WeekViewProps) {
   const weekEnd = new Date(weekDays[6]);
   weekEnd.setHours(23, 59, 59, 999);
 
-  const weekTasks = tasks.filter((t) => {
-    if (!t.dueDate) return false;
+  // Parse each due date once: keep this week's tasks and bucket them by
+  // column (the grid runs Sunday to Saturday, matching Date#getDay)
+  const weekTasks: Task[] = [];
+  const tasksByDay: Task[][] = Array.from({ length: 7 }, () => []);
+  for (const t of tasks) {
+    if (!t.dueDate) continue;
     const due = new Date(t.dueDate);
-    return due >= weekStart && due <= weekEnd;
-  });
+    if (due < weekStart || due > weekEnd) continue;
+    weekTasks.push(t);
+    tasksByDay[due.getDay()].push(t);
+  }
 
   const completedThisWeek = weekTasks.filter((t) => t.status === 'DONE').length;
   const addedThisWeek = weekTasks.length;
@@ -83,13 +81,9 @@ export default function WeekView({ tasks, onTaskClick }: WeekViewProps) {
         </button>
         <div className="text-center">
           <h2 className="font-semibold text-gray-900 dark:text-white">
-            {weekDays[0].toLocaleDateString('en-US', { month: 'short', day: 'numeric' })}
+            {RANGE_START_FORMAT.format(weekDays[0])}
             {' – '}
-            {weekDays[6].toLocaleDateString('en-US', {
-              month: 'short',
-              day: 'numeric',
-              year: 'numeric',
-            })}
+            {RANGE_END_FORMAT.format(weekDays[6])}
           </h2>
           {weekOffset !== 0 && (
             <button
@@ -119,7 +113,7 @@ export default function WeekView({ tasks, onTaskClick }: WeekViewProps) {
       {/* 7-column grid */}
       <div className="grid grid-cols-7 gap-2">
         {weekDays.map((day, i) => {
-          const dayTasks = getTasksForDay(day, tasks);
+          const dayTasks = tasksByDay[i];
           const today = isToday(day);
           return (
             <div
@@ -28,6 +28,13 @@ export function useSocket() {
       setConnected(false);
     });
 
+    // Pushed updates stop while disconnected; catch up on anything missed
+    const handleReconnect = () => {
+      queryClient.invalidateQueries({ queryKey: ['notifications'] });
+      queryClient.invalidateQueries({ queryKey: ['xp-progress'] });
+    };
+    socket.io.on('reconnect', handleReconnect);
+
     socket.on('notification:new', () => {
       queryClient.invalidateQueries({ queryKey: ['notifications'] });
       // Also refetch projects in case a PROJECT_INVITE was received
@@ -58,6 +65,7 @@ export function useSocket() {
       socket.off('presence:update');
       socket.off('xpGained');
       socket.off('levelUp');
+      socket.io.off('reconnect', handleReconnect);
       disconnectSocket();
       setConnected(false);
     };
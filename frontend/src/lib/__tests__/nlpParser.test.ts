@@ -1,5 +1,5 @@
 import { describe, it, expect } from 'vitest';
-import { parseNaturalLanguage } from '../nlpParser';
+import { parseNaturalLanguage, formatDueDate, formatParsedPreview } from '../nlpParser';
 
 describe('parseNaturalLanguage', () => {
   it('returns the input as title when no metadata detected', () => {
@@ -91,3 +91,19 @@ describe('parseNaturalLanguage', () => {
     expect(result.priority).toBe('HIGH');
   });
 });
+
+describe('formatDueDate', () => {
+  it('formats as short weekday, month and day', () => {
+    expect(formatDueDate(new Date(2026, 2, 6))).toBe('Fri, Mar 6');
+  });
+
+  it('is used for the due date in previews', () => {
+    const preview = formatParsedPreview({
+      title: 'Ship it',
+      dueDate: new Date(2026, 2, 6),
+      priority: 'HIGH',
+      projectHint: null,
+    });
+    expect(preview).toBe('Ship it | due Fri, Mar 6 | [HIGH]');
+  });
+});
@@ -619,14 +619,15 @@ export const checkinsApi = {
   getToday: () =>
     request<DailyCheckin>('/api/checkins/today'),
 
-  getAll: (params?: { startDate?: string; endDate?: string; limit?: number; offset?: number }) => {
+  getAll: (params?: { startDate?: string; endDate?: string; limit?: number; offset?: number; cursor?: string }) => {
     const qs = new URLSearchParams();
     if (params?.startDate) qs.set('startDate', params.startDate);
     if (params?.endDate) qs.set('endDate', params.endDate);
     if (params?.limit) qs.set('limit', String(params.limit));
     if (params?.offset) qs.set('offset', String(params.offset));
+    if (params?.cursor) qs.set('cursor', params.cursor);
     const query = qs.toString();
-    return request<{ checkins: DailyCheckin[]; total: number }>(`/api/checkins${query ? `?${query}` : ''}`);
+    return request<{ checkins: DailyCheckin[]; total: number; nextCursor: string | null }>(`/api/checkins${query ? `?${query}` : ''}`);
   },
 
   getStreak: () =>
@@ -87,6 +87,17 @@ export function parseNaturalLanguage(input: string): ParsedTask {
   };
 }
 
+// Built once: toLocaleDateString with options constructs (and resolves locale
+// data for) a new formatter on every call, and previews re-render per keystroke.
+const DUE_DATE_FORMAT = new Intl.DateTimeFormat('en-US', { weekday: 'short', month: 'short', day: 'numeric' });
+
+/**
+ * Format a due date for previews, e.g. "Fri, Mar 6".
+ */
+export function formatDueDate(date: Date): string {
+  return DUE_DATE_FORMAT.format(date);
+}
+
 /**
  * Format a parsed result back into a human-readable preview string.
  */
@@ -94,7 +105,7 @@ export function formatParsedPreview(parsed: ParsedTask): string {
   const parts: string[] = [];
   if (parsed.title) parts.push(parsed.title);
   if (parsed.dueDate) {
-    parts.push(`due ${parsed.dueDate.toLocaleDateString('en-US', { weekday: 'short', month: 'short', day: 'numeric' })}`);
+    parts.push(`due ${formatDueDate(parsed.dueDate)}`);
   }
   if (parsed.priority) parts.push(`[${parsed.priority}]`);
   if (parsed.projectHint) parts.push(`#${parsed.projectHint}`);
@@ -37,6 +37,12 @@ export default function AgentQueuePage() {
     },
   });
 
+  // Tally every agent type in one pass rather than re-filtering the queue per card
+  const countsByAgent = new Map<AgentType, number>();
+  for (const d of delegations) {
+    countsByAgent.set(d.agentType, (countsByAgent.get(d.agentType) ?? 0) + 1);
+  }
+
   // Listen for real-time agent status updates via socket
   useEffect(() => {
     const socket = getSocket();
@@ -63,7 +69,7 @@ export default function AgentQueuePage() {
       {/* Agent summary cards */}
       <div className="grid grid-cols-2 sm:grid-cols-3 gap-4 mb-8">
         {AGENTS.map((agent) => {
-          const count = delegations.filter((d) => d.agentType === agent.type).length;
+          const count = countsByAgent.get(agent.type) ?? 0;
           return (
             <div
               key={agent.type}
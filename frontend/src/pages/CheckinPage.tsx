@@ -4,6 +4,9 @@ import { checkinsApi, domainsApi } from '../lib/api';
 import { ClipboardList, Zap, Flame } from 'lucide-react';
 import type { Domain } from '../types';
 
+// One formatter for every row of the history list instead of one per row
+const CHECKIN_DATE_FORMAT = new Intl.DateTimeFormat(undefined, { month: 'short', day: 'numeric' });
+
 export default function CheckinPage() {
   const queryClient = useQueryClient();
   const [initializedFor, setInitializedFor] = useState<string | null>(null);
@@ -244,10 +247,7 @@ export default function CheckinPage() {
               <div className="space-y-3">
                 {history.checkins.map((checkin) => {
                   const firstLine = checkin.priorities.split('\n')[0] ?? '';
-                  const dateStr = new Date(checkin.date).toLocaleDateString(undefined, {
-                    month: 'short',
-                    day: 'numeric',
-                  });
+                  const dateStr = CHECKIN_DATE_FORMAT.format(new Date(checkin.date));
                   return (
                     <div
                       key={checkin.id}
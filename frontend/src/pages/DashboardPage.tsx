@@ -31,6 +31,30 @@ function StatCard({ title, value, icon: Icon, color }: { title: string; value: n
 // TaskCard replaced by shared component
 import TaskCard from '../components/TaskCard';
 
+/**
+ * The `count` most recently created items, newest first. Keeps a small sorted
+ * window while scanning once, instead of copying and fully sorting the list
+ * (and re-parsing both dates on every comparison) just to take the head.
+ */
+function newestFirst<T extends { createdAt: string }>(
+  items: readonly T[],
+  count: number,
+  include: (item: T) => boolean = () => true,
+): T[] {
+  const top: { item: T; time: number }[] = [];
+  for (const item of items) {
+    if (!include(item)) continue;
+    const time = Date.parse(item.createdAt);
+    if (top.length === count && time <= top[count - 1].time) continue;
+    // Ties keep list order, matching the stable sort this replaces
+    let i = top.length;
+    while (i > 0 && top[i - 1].time < time) i--;
+    top.splice(i, 0, { item, time });
+    if (top.length > count) top.pop();
+  }
+  return top.map((entry) => entry.item);
+}
+
 function ProjectCard({ project }: { project: Project }) {
   return (
     <Link to={`/projects/${project.id}`} className="flex items-center gap-3 p-3 hover:bg-gray-50 dark:hover:bg-gray-700 rounded-lg transition-colors">
@@ -57,16 +81,16 @@ export default function DashboardPage() {
 
   const isLoading = tasksLoading || projectsLoading;
 
-  const stats = {
-    total: tasks.length,
-    completed: tasks.filter((t) => t.status === 'DONE').length,
-    inProgress: tasks.filter((t) => t.status === 'IN_PROGRESS').length,
-    urgent: tasks.filter((t) => t.priority === 'URGENT').length,
-  };
+  const stats = { total: tasks.length, completed: 0, inProgress: 0, urgent: 0 };
+  for (const t of tasks) {
+    if (t.status === 'DONE') stats.completed++;
+    else if (t.status === 'IN_PROGRESS') stats.inProgress++;
+    if (t.priority === 'URGENT') stats.urgent++;
+  }
 
-  const recentTasks = [...tasks].sort((a, b) => new Date(b.createdAt).getTime() - new Date(a.createdAt).getTime()).slice(0, 5);
-  const recentProjects = [...projects].sort((a, b) => new Date(b.createdAt).getTime() - new Date(a.createdAt).getTime()).slice(0, 5);
-  const myContributions = tasks.filter(t => t.creatorId === user?.id).sort((a, b) => new Date(b.createdAt).getTime() - new Date(a.createdAt).getTime()).slice(0, 5);
+  const recentTasks = newestFirst(tasks, 5);
+  const recentProjects = newestFirst(projects, 5);
+  const myContributions = newestFirst(tasks, 5, (t) => t.creatorId === user?.id);
 
   if (isLoading) {
     return <DashboardSkeleton />;
@@ -55,19 +55,19 @@ export default function FocusPage() {
     },
   });
 
-  // Filter to incomplete tasks, sort by priority, take top 3
+  // Filter to incomplete tasks, sort by priority, take top 3. Sort keys are
+  // plain numbers computed once per task, so comparisons never parse dates.
   const focusTasks = allTasks
     .filter((t) => t.status !== 'DONE')
-    .sort((a, b) => {
-      const pDiff = PRIORITY_ORDER[a.priority] - PRIORITY_ORDER[b.priority];
-      if (pDiff !== 0) return pDiff;
-      // Secondary sort: earliest due date first
-      if (a.dueDate && b.dueDate) return new Date(a.dueDate).getTime() - new Date(b.dueDate).getTime();
-      if (a.dueDate) return -1;
-      if (b.dueDate) return 1;
-      return 0;
-    })
-    .slice(0, 3);
+    .map((task) => ({
+      task,
+      priority: PRIORITY_ORDER[task.priority],
+      // Secondary sort: earliest due date first, tasks without one last
+      due: task.dueDate ? Date.parse(task.dueDate) : Number.MAX_SAFE_INTEGER,
+    }))
+    .sort((a, b) => a.priority - b.priority || a.due - b.due)
+    .slice(0, 3)
+    .map((entry) => entry.task);
 
   const completedToday = allTasks.filter((t) => {
     if (t.status !== 'DONE') return false;
@@ -6,14 +6,8 @@ import { useAuthStore } from '../store/auth';
 import { ArrowLeft, UserPlus, X, Calendar } from 'lucide-react';
 import clsx from 'clsx';
 import { format } from 'date-fns';
-import type { Project, ProjectRole, TaskStatus, TaskPriority } from '../types';
-
-const STATUS_LABELS: Record<TaskStatus, string> = {
-  TODO: 'To Do',
-  IN_PROGRESS: 'In Progress',
-  IN_REVIEW: 'In Review',
-  DONE: 'Done',
-};
+import { STATUSES, STATUS_LABELS, PRIORITY_COLORS, isProjectAdmin } from '../lib/taskConstants';
+import type { Project, ProjectRole, TaskStatus } from '../types';
 
 const STATUS_COLORS: Record<TaskStatus, string> = {
   TODO: 'bg-gray-100 dark:bg-gray-700 text-gray-700 dark:text-gray-300',
@@ -22,13 +16,6 @@ const STATUS_COLORS: Record<TaskStatus, string> = {
   DONE: 'bg-green-100 dark:bg-green-900/50 text-green-700 dark:text-green-300',
 };
 
-const PRIORITY_COLORS: Record<TaskPriority, string> = {
-  LOW: 'bg-gray-100 dark:bg-gray-700 text-gray-600 dark:text-gray-300',
-  MEDIUM: 'bg-blue-100 dark:bg-blue-900/50 text-blue-600 dark:text-blue-300',
-  HIGH: 'bg-orange-100 dark:bg-orange-900/50 text-orange-600 dark:text-orange-300',
-  URGENT: 'bg-red-100 dark:bg-red-900/50 text-red-600 dark:text-red-300',
-};
-
 const ROLE_BADGES: Record<ProjectRole, string> = {
   OWNER: 'bg-purple-100 dark:bg-purple-900/50 text-purple-700 dark:text-purple-300',
   ADMIN: 'bg-indigo-100 dark:bg-indigo-900/50 text-indigo-700 dark:text-indigo-300',
@@ -36,17 +23,11 @@ const ROLE_BADGES: Record<ProjectRole, string> = {
   VIEWER: 'bg-gray-50 dark:bg-gray-800 text-gray-500 dark:text-gray-400',
 };
 
-const STATUSES: TaskStatus[] = ['TODO', 'IN_PROGRESS', 'IN_REVIEW', 'DONE'];
-
 function getUserRole(project: Project, userId: string): ProjectRole | null {
   const membership = project.members?.find((m) => m.userId === userId);
   return membership?.role ?? null;
 }
 
-function canManageMembers(role: ProjectRole | null): boolean {
-  return role === 'OWNER' || role === 'ADMIN';
-}
-
 export default function ProjectDetailPage() {
   const { id } = useParams<{ id: string }>();
   const navigate = useNavigate();
@@ -117,7 +98,7 @@ export default function ProjectDetailPage() {
   }
 
   const userRole = currentUser ? getUserRole(project, currentUser.id) : null;
-  const isManager = canManageMembers(userRole);
+  const isManager = isProjectAdmin(userRole);
 
   const handleAddMember = (e: React.FormEvent) => {
     e.preventDefault();
@@ -2,6 +2,7 @@ import { useState } from 'react';
 import { useNavigate } from 'react-router-dom';
 import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
 import { projectsApi } from '../lib/api';
+import { isProjectAdmin } from '../lib/taskConstants';
 import { useAuthStore } from '../store/auth';
 import { Plus, Trash2, Users, CheckSquare, X } from 'lucide-react';
 import { ProjectCardSkeleton } from '../components/Skeletons';
@@ -279,7 +280,7 @@ export default function ProjectsPage() {
               <div className="p-4">
                 <div className="flex items-start justify-between">
                   <h3 className="font-semibold text-gray-900 dark:text-gray-100 truncate flex-1">{project.name}</h3>
-                  {(project.ownerId === currentUser?.id || project.members?.some(m => m.userId === currentUser?.id && ['OWNER', 'ADMIN'].includes(m.role))) && (
+                  {(project.ownerId === currentUser?.id || project.members?.some(m => m.userId === currentUser?.id && isProjectAdmin(m.role))) && (
                     <button
                       onClick={(e) => {
                         e.stopPropagation();
@@ -1,5 +1,5 @@
 import { useState, useEffect, useMemo } from 'react';
-import { useQuery, useInfiniteQuery, useMutation, useQueryClient } from '@tanstack/react-query';
+import { useQuery, useInfiniteQuery, useMutation, useQueryClient, type InfiniteData } from '@tanstack/react-query';
 import { AnimatePresence, motion } from 'framer-motion';
 import { useSearchParams } from 'react-router-dom';
 import { tasksApi, projectsApi, recurringTasksApi, exportApi, domainsApi } from '../lib/api';
@@ -8,7 +8,7 @@ import { useCelebrationStore } from '../store/celebration';
 import { Plus, Table, Columns3, Calendar as CalendarIcon, CalendarDays, Download, Zap, Loader2, X } from 'lucide-react';
 import clsx from 'clsx';
 import type { Task, TaskStatus, TaskPriority } from '../types';
-import type { TaskFilters } from '../lib/api';
+import type { TaskFilters, CursorPaginatedResponse } from '../lib/api';
 import TaskCompletionCelebration from '../components/TaskCompletionCelebration';
 import RecurrencePickerModal, { RecurrenceConfig } from '../components/RecurrencePickerModal';
 import { TableSkeleton, KanbanSkeleton } from '../components/Skeletons';
@@ -24,6 +24,8 @@ import { TaskTableView } from '../components/TaskTableView';
 import { TaskKanbanView } from '../components/TaskKanbanView';
 import { STATUSES, STATUS_LABELS } from '../lib/taskConstants';
 
+type TaskPages = InfiniteData<CursorPaginatedResponse<Task>>;
+
 // --- Main Page ---
 
 export default function TasksPage() {
@@ -88,8 +90,10 @@ export default function TasksPage() {
 
   const tasks = useMemo(() => {
     if (selectedDomainIds.length === 0) return allTasks;
+    // Built once per filter change, so each task domain is a Set lookup
+    const selectedDomains = new Set(selectedDomainIds);
     return allTasks.filter((t) =>
-      t.domains?.some((d) => selectedDomainIds.includes(d.domainId))
+      t.domains?.some((d) => selectedDomains.has(d.domainId))
     );
   }, [allTasks, selectedDomainIds]);
 
@@ -148,9 +152,15 @@ export default function TasksPage() {
       tasksApi.bulkStatus(taskIds, status),
     onMutate: async ({ taskIds, status }) => {
       await queryClient.cancelQueries({ queryKey: ['tasks', filters] });
-      const previousTasks = queryClient.getQueryData<Task[]>(['tasks', filters]);
-      queryClient.setQueryData(['tasks', filters], (old: Task[] | undefined) => {
-        return old?.map((t) => (taskIds.includes(t.id) ? { ...t, status } : t)) || [];
+      const previousTasks = queryClient.getQueryData<TaskPages>(['tasks', filters]);
+      // One Set lookup per cached task instead of scanning taskIds for each
+      const updatedIds = new Set(taskIds);
+      queryClient.setQueryData<TaskPages>(['tasks', filters], (old) => old && {
+        ...old,
+        pages: old.pages.map((page) => ({
+          ...page,
+          data: page.data.map((t) => (updatedIds.has(t.id) ? { ...t, status } : t)),
+        })),
       });
       return { previousTasks };
     },
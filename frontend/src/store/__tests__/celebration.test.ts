@@ -90,7 +90,7 @@ describe('CelebrationStore — nextCelebration', () => {
   });
 
   it('sets current to null when queue is empty', () => {
-    useCelebrationStore.setState({ queue: [], current: { type: 'TASK', data: {}, id: 'x' } });
+    useCelebrationStore.setState({ queue: [], current: { type: 'TASK', data: {}, id: 'x', queuedAt: Date.now() } });
     useCelebrationStore.getState().nextCelebration();
     expect(useCelebrationStore.getState().current).toBeNull();
   });
@@ -104,6 +104,44 @@ describe('CelebrationStore — nextCelebration', () => {
     expect(useCelebrationStore.getState().current?.type).toBe('LEVEL_UP');
     expect(useCelebrationStore.getState().queue).toHaveLength(0);
   });
+
+  it('skips celebrations that waited longer than the TTL', () => {
+    const now = Date.now();
+    useCelebrationStore.setState({
+      current: { type: 'TASK', data: {}, id: 'current', queuedAt: now },
+      queue: [
+        { type: 'XP', data: {}, id: 'stale', queuedAt: now - 60_000 },
+        { type: 'LEVEL_UP', data: {}, id: 'fresh', queuedAt: now },
+      ],
+    });
+    useCelebrationStore.getState().nextCelebration();
+    expect(useCelebrationStore.getState().current?.id).toBe('fresh');
+    expect(useCelebrationStore.getState().queue).toHaveLength(0);
+  });
+
+  it('clears current when every queued celebration is stale', () => {
+    useCelebrationStore.setState({
+      current: { type: 'TASK', data: {}, id: 'current', queuedAt: Date.now() },
+      queue: [{ type: 'XP', data: {}, id: 'stale', queuedAt: Date.now() - 60_000 }],
+    });
+    useCelebrationStore.getState().nextCelebration();
+    expect(useCelebrationStore.getState().current).toBeNull();
+    expect(useCelebrationStore.getState().queue).toEqual([]);
+  });
+});
+
+describe('CelebrationStore — backlog limit', () => {
+  it('drops the oldest waiting celebration once the backlog is full', () => {
+    useCelebrationStore.getState().addCelebration('TASK', { n: 0 });
+    for (let n = 1; n <= 11; n++) {
+      useCelebrationStore.getState().addCelebration('XP', { n });
+    }
+    const { queue, current } = useCelebrationStore.getState();
+    expect(current?.data).toEqual({ n: 0 });
+    expect(queue).toHaveLength(10);
+    expect(queue[0].data).toEqual({ n: 2 });
+    expect(queue[9].data).toEqual({ n: 11 });
+  });
 });
 
 describe('CelebrationStore — clearQueue', () => {
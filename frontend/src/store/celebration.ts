@@ -4,6 +4,7 @@ interface Celebration {
   type: 'TASK' | 'XP' | 'LEVEL_UP' | 'ACHIEVEMENT' | 'STREAK' | 'QUEST';
   data: any;
   id: string;
+  queuedAt: number;
 }
 
 interface CelebrationState {
@@ -14,16 +15,26 @@ interface CelebrationState {
   clearQueue: () => void;
 }
 
+// Celebrations only make sense shortly after whatever triggered them. Cap the
+// backlog and skip entries that waited too long, so a burst (e.g. a bulk
+// status change) cannot queue minutes of stale animations.
+const MAX_QUEUED_CELEBRATIONS = 10;
+const CELEBRATION_TTL_MS = 30_000;
+
 export const useCelebrationStore = create<CelebrationState>((set, get) => ({
   queue: [],
   current: null,
 
   addCelebration: (type, data) => {
-    const id = `${type}_${Date.now()}_${Math.random()}`;
-    const celebration: Celebration = { type, data, id };
+    const queuedAt = Date.now();
+    const id = `${type}_${queuedAt}_${Math.random()}`;
+    const celebration: Celebration = { type, data, id, queuedAt };
 
     set((state) => ({
-      queue: [...state.queue, celebration],
+      // Once the backlog is full, the oldest waiting entry makes room
+      queue: state.queue.length >= MAX_QUEUED_CELEBRATIONS
+        ? [...state.queue.slice(1), celebration]
+        : [...state.queue, celebration],
     }));
 
     // If no current celebration, start immediately
@@ -35,13 +46,16 @@ export const useCelebrationStore = create<CelebrationState>((set, get) => ({
   nextCelebration: () => {
     const { queue } = get();
 
-    if (queue.length === 0) {
-      set({ current: null });
+    // Skip anything that went stale while earlier celebrations were showing
+    const cutoff = Date.now() - CELEBRATION_TTL_MS;
+    const nextIndex = queue.findIndex((c) => c.queuedAt >= cutoff);
+
+    if (nextIndex === -1) {
+      set({ current: null, queue: [] });
       return;
     }
 
-    const [next, ...remaining] = queue;
-    set({ current: next, queue: remaining });
+    set({ current: queue[nextIndex], queue: queue.slice(nextIndex + 1) });
   },
 
   clearQueue: () => {